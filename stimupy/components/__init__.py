@@ -1,3 +1,4 @@
+import collections.abc
 import itertools
 import logging
 
@@ -5,11 +6,15 @@ import numpy as np
 
 from stimupy.components import *  # noqa: F403 # angulars, edges, frames, gaussians, lines, radials, shapes, waves
 from stimupy.components import texts
-from stimupy.utils import resolution
+from stimupy.utils import dtypes, resolution
+from stimupy.utils.cache import LRUCache
 
 # Get module level logger
 logger = logging.getLogger("stimupy.components")
 
+# Process-wide cache of (read-only) distance metrics, shared by all image bases
+grid_cache = LRUCache()
+
 __all__ = [
     "overview",
     "plot_overview",
@@ -30,9 +35,152 @@ __all__ = [
 ]
 
 
+class _ImageBase(collections.abc.Mapping):
+    """Read-only mapping of image-base parameters and (lazily computed) distance metrics
+
+    Scalar entries (resolution, rotation, single axes) are stored directly.
+    Each 2D distance metric is only computed the first time it is accessed,
+    and then kept for subsequent access.
+    Computed metrics are also stored in the process-wide `grid_cache`,
+    so that other image bases of the same resolution, rotation and origin reuse them.
+    """
+
+    _metrics = (
+        "horizontal",
+        "vertical",
+        "oblique",
+        "oblique_y",
+        "rectilinear",
+        "radial",
+        "angular",
+    )
+
+    # Metrics that do not depend on rotation
+    _unrotated = ("horizontal", "vertical", "radial")
+
+    def __init__(self, visual_size, ppd, shape, rotation, origin, x, y):
+        self._params = {
+            "visual_size": visual_size,
+            "ppd": ppd,
+            "shape": shape,
+            "rotation": rotation,
+            "x": x,
+            "y": y,
+        }
+        self._origin = origin
+        self._computed = {}
+
+    def __getitem__(self, key):
+        if key in self._params:
+            return self._params[key]
+        if key not in self._metrics:
+            raise KeyError(key)
+        if key not in self._computed:
+            self._computed[key] = grid_cache.get_or_compute(
+                self._cache_key(key), getattr(self, f"_compute_{key}")
+            )
+        return self._computed[key]
+
+    def __iter__(self):
+        yield from self._params
+        yield from self._metrics
+
+    def __len__(self):
+        return len(self._params) + len(self._metrics)
+
+    def __repr__(self):
+        computed = ", ".join(self._computed) or "none"
+        return (
+            f"{type(self).__name__}(shape={tuple(self['shape'])}, "
+            f"rotation={self['rotation']}, origin={self._origin!r}, computed: {computed})"
+        )
+
+    def profile(self, metric):
+        """1D profile of a distance metric, if it only varies along a single axis
+
+        Parameters
+        ----------
+        metric : str
+            name of distance metric
+
+        Returns
+        -------
+        numpy.ndarray or None
+            array of shape (1, width) or (height, 1), which broadcasts to the full metric;
+            None if the metric varies along both axes
+        """
+        x = self["x"][np.newaxis, :]
+        y = self["y"][:, np.newaxis]
+        if metric == "horizontal":
+            return x
+        if metric == "vertical":
+            return y
+        if metric == "oblique" and self["rotation"] == 0:
+            if self._origin == "corner":
+                return x - x.min()
+            return x
+        return None
+
+    def _cache_key(self, metric):
+        rotation = None if metric in self._unrotated else self["rotation"]
+        return (metric, self["shape"], self["visual_size"], self._origin, rotation)
+
+    def _grid(self):
+        # Broadcast views of the axes; cheaper than a full meshgrid copy
+        return np.meshgrid(self["x"], self["y"], copy=False)
+
+    def _compute_horizontal(self):
+        return np.meshgrid(self["x"], self["y"])[0]
+
+    def _compute_vertical(self):
+        return np.meshgrid(self["x"], self["y"])[1]
+
+    def _compute_oblique(self):
+        xx, yy = self._grid()
+        rotation = self["rotation"]
+        alpha = [np.cos(np.deg2rad(-rotation)), np.sin(np.deg2rad(-rotation))]
+        oblique_x = alpha[0] * xx + alpha[1] * yy
+        if self._origin == "corner":
+            oblique_x = oblique_x - oblique_x.min()
+        return oblique_x
+
+    def _compute_oblique_y(self):
+        xx, yy = self._grid()
+        rotation = self["rotation"]
+        beta = [np.cos(np.deg2rad(rotation)), np.sin(np.deg2rad(rotation))]
+        oblique_y = beta[1] * xx + beta[0] * yy
+        if self._origin == "corner":
+            oblique_y = oblique_y - oblique_y.min()
+        return oblique_y
+
+    def _compute_rectilinear(self):
+        return np.maximum(np.abs(self["oblique"]), np.abs(self["oblique_y"]))
+
+    def _compute_radial(self):
+        xx, yy = self._grid()
+        return np.sqrt(xx**2 + yy**2)
+
+    def _compute_angular(self):
+        # Unrotated angle only depends on resolution and origin: cache separately,
+        # so that rotating an angular stimulus only needs to offset it
+        key = ("angle", self["shape"], self["visual_size"], self._origin)
+        angular = grid_cache.get_or_compute(key, self._compute_angle)
+        angular = angular - np.deg2rad(self["rotation"] + 90)
+        angular %= 2 * np.pi
+        return angular
+
+    def _compute_angle(self):
+        return np.arctan2(self["x"][np.newaxis, :], self["y"][:, np.newaxis])
+
+
 def image_base(visual_size=None, shape=None, ppd=None, rotation=0.0, origin="mean"):
     """Create coordinate-arrays to serve as image base for drawing
 
+    The distance metrics are computed lazily:
+    each is only calculated the first time it is accessed.
+    Computed metrics are cached (see `stimupy.components.grid_cache`),
+    and returned as read-only arrays.
+
     Parameters
     ----------
     visual_size : Sequence[Number, Number], Number, or None (default)
@@ -50,8 +198,8 @@ def image_base(visual_size=None, shape=None, ppd=None, rotation=0.0, origin="mea
 
     Returns
     -------
-    dict[str, Any]
-        dict with keys:
+    Mapping[str, Any]
+        read-only mapping with keys:
         "visual_size", "ppd" : resolved from input arguments,
         "x", "y" : single axes
         "horizontal", "vertical" : numpy.ndarray of shape, with distance from origin,
@@ -72,44 +220,32 @@ def image_base(visual_size=None, shape=None, ppd=None, rotation=0.0, origin="mea
     # Get single axes
     x, y = resolution.visual_size_to_axes(visual_size=visual_size, shape=shape, origin=origin)
 
-    # Linear distance image bases
-    xx, yy = np.meshgrid(x, y)
+    return _ImageBase(
+        visual_size=visual_size,
+        ppd=ppd,
+        shape=shape,
+        rotation=rotation,
+        origin=origin,
+        x=x,
+        y=y,
+    )
 
-    # Rotate to get obliques
-    alpha = [np.cos(np.deg2rad(-rotation)), np.sin(np.deg2rad(-rotation))]
-    beta = [np.cos(np.deg2rad(rotation)), np.sin(np.deg2rad(rotation))]
-    oblique_x = alpha[0] * xx + alpha[1] * yy
-    oblique_y = beta[1] * xx + beta[0] * yy
-    if origin == "corner":
-        oblique_x = oblique_x - oblique_x.min()
-        oblique_y = oblique_y - oblique_y.min()
 
-    # Rectilinear distance (frames)
-    rectilinear = np.maximum(np.abs(oblique_x), np.abs(oblique_y))
+def _broadcast(arr, shape, materialize=True):
+    """Broadcast (1D profile) array to full image shape
 
-    # Radial distance
-    radial = np.sqrt(xx**2 + yy**2)
+    If materialize, returns a regular (writeable, contiguous) array,
+    otherwise a read-only broadcast view.
+    """
+    if arr.shape == tuple(shape):
+        return arr
+    arr = np.broadcast_to(arr, shape)
+    return np.ascontiguousarray(arr) if materialize else arr
 
-    # Angular distance
-    angular = np.arctan2(xx, yy)
-    angular -= np.deg2rad(rotation + 90)
-    angular %= 2 * np.pi
 
-    return {
-        "visual_size": visual_size,
-        "ppd": ppd,
-        "shape": shape,
-        "rotation": rotation,
-        "x": x,
-        "y": y,
-        "horizontal": xx,
-        "vertical": yy,
-        "oblique": oblique_x,
-        "oblique_y": oblique_y,
-        "rectilinear": rectilinear,
-        "radial": radial,
-        "angular": angular,
-    }
+def _unbroadcast(arr):
+    """Reduce broadcast view to its profile, i.e., of length 1 along broadcast axes"""
+    return arr[tuple(slice(0, 1) if stride == 0 else slice(None) for stride in arr.strides)]
 
 
 def mask_regions(
@@ -163,10 +299,13 @@ def mask_regions(
     if isinstance(edges, (int, float)):
         edges = (edges,)
 
-    # Mark elements with integer idx-value
-    mask = np.zeros(base["shape"], dtype=int)
-    for idx, edge in zip(reversed(range(len(edges))), reversed(edges)):
-        mask[distances <= edge] = int(idx + 1)
+    # Mark elements with integer idx-value:
+    # each pixel belongs to the first region whose edge it does not exceed.
+    # The running maximum of edges is non-decreasing, and exceeds a distance
+    # at the same index as the first such edge, so a single sorted search suffices
+    upper_limits = np.maximum.accumulate(np.asarray(edges, dtype=float))
+    mask = np.searchsorted(upper_limits, distances, side="left").astype(int, copy=False) + 1
+    mask[mask > len(edges)] = 0
 
     # Assemble output
     return {
@@ -187,12 +326,15 @@ def combine_masks(*masks):
 
     Increments mask-indices, such that the resulting mask contains consecutive integer
     indices.
-    Masks are combined in order.
+    Masks are combined in order, in a single pass over each mask.
 
     Parameters
     ----------
     mask_1, mask_2, ... : numpy.ndarray
-        Masks to be combined
+        Masks to be combined.
+        Alternatively, a single 3D numpy.ndarray of stacked masks,
+        or a single iterable (e.g., generator) of masks,
+        so that not all masks have to be in memory at the same time.
 
     Returns
     -------
@@ -206,24 +348,42 @@ def combine_masks(*masks):
     ValueError
         if multiple masks index the same pixel
     """
+    if len(masks) == 1 and not (isinstance(masks[0], np.ndarray) and masks[0].ndim < 3):
+        # Stacked array, or iterable of masks
+        masks = masks[0]
+    masks = iter(masks)
+
     # Initialize
-    combined_mask = np.zeros_like(masks[0])
-    for mask in masks:
+    try:
+        first_mask = np.asarray(next(masks))
+    except StopIteration:
+        raise ValueError("No masks to combine")
+    combined_mask = np.zeros(first_mask.shape, dtype=np.promote_types(first_mask.dtype, int))
+
+    offset = 0
+    n_masked = 0
+    for mask in itertools.chain((first_mask,), masks):
+        mask = np.asarray(mask)
+
         # Check that masks have the same shape
         if not mask.shape == combined_mask.shape:
             raise ValueError("Not all masks have the same shape")
 
-        # Check that masks don't overlap
-        if (combined_mask & mask).any():
-            raise ValueError("Masks overlap")
+        # Combine: increase `mask`-idc by the current highest idx in combined mask
+        masked = mask != 0
+        np.add(mask, offset, out=combined_mask, where=masked, casting="unsafe")
+        n_masked += np.count_nonzero(masked)
+        offset = max(offset, offset + mask.max())
 
-        # Combine: increase `mask`-idc by adding the current highest idx in combined_mask
-        combined_mask = np.where(mask, mask + combined_mask.max(), combined_mask)
+    # Check that masks don't overlap:
+    # then every masked pixel remains in the combined mask
+    if np.count_nonzero(combined_mask) != n_masked:
+        raise ValueError("Masks overlap")
 
     return combined_mask
 
 
-def draw_regions(mask, intensities, intensity_background=0.5):
+def draw_regions(mask, intensities, intensity_background=0.5, out=None):
     """Draw regions defined by mask, with given intensities
 
     Parameters
@@ -236,6 +396,8 @@ def draw_regions(mask, intensities, intensity_background=0.5):
         If fewer intensities are passed than masked regions, cycles through intensities
     intensity_background : float, optional
         intensity value of background, by default 0.5
+    out : numpy.ndarray or None (default)
+        preallocated array, same shape as mask, to draw image into
 
     Returns
     -------
@@ -243,21 +405,47 @@ def draw_regions(mask, intensities, intensity_background=0.5):
         image-array, same shape as mask, with intensity assigned to each masked region
     """
 
-    # Create background
-    img = np.ones(mask.shape) * intensity_background
-
-    # Get mask indices
-    mask_idcs = np.unique(mask[mask > 0])
+    mask = np.asarray(mask)
+    float_dtype = dtypes.get_dtypes().float
 
     if isinstance(intensities, (float, int)):
         intensities = (intensities,)
 
+    # Get mask indices
+    dense = (
+        mask.dtype.kind in "biu" and mask.size > 0 and mask.min() >= 0 and mask.max() <= mask.size
+    )
+    if dense:
+        # Small, non-negative integer indices: index the lookup-table directly
+        labels = mask.astype(np.intp, copy=False)
+        present = np.zeros(labels.max() + 1, dtype=bool)
+        present[labels] = True
+        present[0] = False
+        mask_idcs = np.flatnonzero(present)
+    else:
+        mask_idcs = np.unique(mask[mask > 0])
+
     # Assign intensities to masked regions
     ints = [*itertools.islice(itertools.cycle(intensities), len(mask_idcs))]
-    for frame_idx, intensity in zip(mask_idcs, ints):
-        img = np.where(mask == frame_idx, intensity, img)
 
-    return img
+    # Draw all regions in a single gather from lookup-table of intensities
+    if dense:
+        lut = np.full(len(present), intensity_background, dtype=float_dtype)
+        lut[mask_idcs] = ints
+        return np.take(lut, labels, out=out)
+
+    if len(mask_idcs) == 0:
+        if out is None:
+            return np.full(mask.shape, intensity_background, dtype=float_dtype)
+        out.fill(intensity_background)
+        return out
+
+    # Otherwise, first translate mask indices to positions in lookup-table,
+    # where position 0 is the background
+    lut = np.array([intensity_background, *ints], dtype=float_dtype)
+    positions = np.minimum(np.searchsorted(mask_idcs, mask), len(mask_idcs) - 1)
+    is_region = mask_idcs[positions] == mask
+    return np.take(lut, np.where(is_region, positions + 1, 0), out=out)
 
 
 def overview(skip=False):
@@ -2,6 +2,8 @@ import numpy as np
 
 from stimupy.components import draw_regions, mask_regions
 from stimupy.components.radials import ring
+from stimupy.utils import stimulus_output
+from stimupy.utils.utils import _output_buffer
 
 __all__ = [
     "wedge",
@@ -55,6 +57,7 @@ def mask_angle(
     return stim
 
 
+@stimulus_output
 def wedge(
     visual_size=None,
     ppd=None,
@@ -193,6 +196,7 @@ def mask_segments(
     return stim
 
 
+@stimulus_output
 def segments(
     visual_size=None,
     ppd=None,
@@ -255,6 +259,7 @@ def segments(
         stim["segment_mask"],
         intensities=intensity_segments,
         intensity_background=intensity_background,
+        out=_output_buffer(stim["segment_mask"].shape),
     )
 
     # Update args
@@ -2,7 +2,8 @@ import copy
 
 import numpy as np
 
-from stimupy.components import gaussians, image_base
+from stimupy.components import _broadcast, gaussians, image_base
+from stimupy.utils import dtypes, stimulus_output
 
 __all__ = [
     "step",
@@ -11,6 +12,7 @@ __all__ = [
 ]
 
 
+@stimulus_output
 def step(
     visual_size=None,
     ppd=None,
@@ -49,14 +51,22 @@ def step(
         origin="corner",
     )
 
-    img = np.ones(base["shape"]) * intensity_edges[0]
-    img = np.where(base["oblique"] < base["oblique"].mean(), img, intensity_edges[1])
-    mask = np.ones(base["shape"])
-    mask = np.where(base["oblique"] < base["oblique"].mean(), mask, 2)
+    # Unrotated edges only vary horizontally: draw on profile, then broadcast.
+    # Edge lies at the mean of the full grid; the mean of the profile can differ
+    # in the last bit, which would move the middle column of odd widths.
+    edge = base["oblique"].mean()
+    distances = base.profile("oblique")
+    if distances is None:
+        distances = base["oblique"]
+
+    img = np.full(distances.shape, intensity_edges[0], dtype=dtypes.get_dtypes().float)
+    img = np.where(distances < edge, img, intensity_edges[1])
+    mask = np.ones(distances.shape)
+    mask = np.where(distances < edge, mask, 2)
 
     stim = {
-        "img": img,
-        "edge_mask": mask.astype(int),
+        "img": _broadcast(img, base["shape"]),
+        "edge_mask": _broadcast(mask.astype(int), base["shape"]),
         "visual_size": base["visual_size"],
         "ppd": base["ppd"],
         "shape": base["shape"],
@@ -67,6 +77,7 @@ def step(
     return stim
 
 
+@stimulus_output
 def gaussian(
     visual_size=None,
     ppd=None,
@@ -129,6 +140,7 @@ def gaussian(
     return stim
 
 
+@stimulus_output
 def cornsweet(
     visual_size=None,
     ppd=None,
@@ -199,7 +211,12 @@ def cornsweet(
     if ramp_width > max(base["visual_size"]) / 2:
         raise ValueError("ramp_width is too large")
 
-    dist = np.round(base["oblique"] / ramp_width, 6)
+    # Unrotated edges only vary horizontally: draw on profile, then broadcast
+    distances = base.profile("oblique")
+    if distances is None:
+        distances = base["oblique"]
+
+    dist = np.round(distances / ramp_width, 6)
     d1 = copy.deepcopy(dist)
     d2 = copy.deepcopy(dist) * (-1)
     d1 = d1 - np.abs(d1).min()
@@ -221,8 +238,8 @@ def cornsweet(
     mask[mask == 3] = 1
 
     stim = {
-        "img": img,
-        "edge_mask": mask.astype(int),
+        "img": _broadcast(img, base["shape"]),
+        "edge_mask": _broadcast(mask.astype(int), base["shape"]),
         "visual_size": base["visual_size"],
         "ppd": base["ppd"],
         "shape": base["shape"],
@@ -231,8 +248,8 @@ def cornsweet(
         "ramp_width": ramp_width,
         "rotation": rotation,
         "exponent": exponent,
-        "d1": d1,
-        "d2": d2,
+        "d1": _broadcast(d1, base["shape"]),
+        "d2": _broadcast(d2, base["shape"]),
     }
 
     return stim
@@ -1,6 +1,8 @@
 import numpy as np
 
 from stimupy.components import draw_regions, mask_regions
+from stimupy.utils import stimulus_output
+from stimupy.utils.utils import _output_buffer
 
 __all__ = [
     "frames",
@@ -54,6 +56,7 @@ def mask_frames(
     return stim
 
 
+@stimulus_output
 def frames(
     visual_size=None,
     ppd=None,
@@ -115,7 +118,10 @@ def frames(
 
     # Draw image and update args
     stim["img"] = draw_regions(
-        stim["frame_mask"], intensities=intensity_frames, intensity_background=intensity_background
+        stim["frame_mask"],
+        intensities=intensity_frames,
+        intensity_background=intensity_background,
+        out=_output_buffer(stim["frame_mask"].shape),
     )
     stim["radii"] = radii
     stim["intensity_frames"] = intensity_frames
@@ -1,13 +1,15 @@
 import numpy as np
 
-from stimupy.components import image_base
+from stimupy.components import grid_cache, image_base
 from stimupy.components.shapes import ellipse
+from stimupy.utils import dtypes, stimulus_output
 
 __all__ = [
     "gaussian",
 ]
 
 
+@stimulus_output
 def gaussian(
     visual_size=None,
     ppd=None,
@@ -19,6 +21,10 @@ def gaussian(
 ):
     """Create a Gaussian (envelop)
 
+    The normalized Gaussian and its mask are cached
+    (see `stimupy.components.grid_cache`) by sigma, rotation and resolution,
+    so that e.g. the components of a plaid share a single envelope.
+
     Parameters
     ----------
     visual_size : Sequence[Number, Number], Number, or None (default)
@@ -58,31 +64,42 @@ def gaussian(
         rotation=rotation,
         origin=origin,
     )
-    xx = base["horizontal"]
-    yy = base["vertical"]
-
-    # convert rotation parameter to radians
-    theta = np.deg2rad(-rotation)
-
-    # determine a, b, c coefficients
-    a = (np.cos(theta) ** 2 / (2 * sigma[1] ** 2)) + (np.sin(theta) ** 2 / (2 * sigma[0] ** 2))
-    b = -(np.sin(2 * theta) / (4 * sigma[1] ** 2)) + (np.sin(2 * theta) / (4 * sigma[0] ** 2))
-    c = (np.sin(theta) ** 2 / (2 * sigma[1] ** 2)) + (np.cos(theta) ** 2 / (2 * sigma[0] ** 2))
 
-    # create Gaussian
-    gaussian = np.exp(-(a * xx**2 + 2 * b * xx * yy + c * yy**2))
-    gaussian = gaussian / gaussian.max() * intensity_max
-
-    # create mask as ellipse with sigma radius
-    mask = ellipse(
-        visual_size=visual_size,
-        ppd=ppd,
-        shape=shape,
-        radius=sigma,
-        rotation=rotation,
-        origin=origin,
-        restrict_size=False,
-    )["ellipse_mask"]
+    def _compute():
+        # convert rotation parameter to radians
+        theta = np.deg2rad(-rotation)
+
+        # determine a, b, c coefficients
+        a = (np.cos(theta) ** 2 / (2 * sigma[1] ** 2)) + (np.sin(theta) ** 2 / (2 * sigma[0] ** 2))
+        b = -(np.sin(2 * theta) / (4 * sigma[1] ** 2)) + (np.sin(2 * theta) / (4 * sigma[0] ** 2))
+        c = (np.sin(theta) ** 2 / (2 * sigma[1] ** 2)) + (np.cos(theta) ** 2 / (2 * sigma[0] ** 2))
+
+        # create Gaussian
+        if b == 0:
+            # Axis-aligned: outer product of a vertical and horizontal Gaussian profile
+            x = base.profile("horizontal")
+            y = base.profile("vertical")
+            gaussian = np.exp(-c * y**2) * np.exp(-a * x**2)
+        else:
+            xx = base["horizontal"]
+            yy = base["vertical"]
+            gaussian = np.exp(-(a * xx**2 + 2 * b * xx * yy + c * yy**2))
+
+        # create mask as ellipse with sigma radius
+        mask = ellipse(
+            visual_size=visual_size,
+            ppd=ppd,
+            shape=shape,
+            radius=sigma,
+            rotation=rotation,
+            origin=origin,
+            restrict_size=False,
+        )["ellipse_mask"]
+        return gaussian / gaussian.max(), mask
+
+    key = ("gaussian", tuple(sigma), rotation, base["shape"], base["visual_size"], origin)
+    gaussian, mask = grid_cache.get_or_compute(key, _compute)
+    gaussian = np.multiply(gaussian, intensity_max, dtype=dtypes.get_dtypes().float)
 
     stim = {
         "img": gaussian,
@@ -5,7 +5,7 @@ import numpy as np
 from PIL import Image, ImageDraw
 
 from stimupy.components.shapes import ellipse as ellipse_shape
-from stimupy.utils import resolution
+from stimupy.utils import resolution, stimulus_output
 
 __all__ = [
     "line",
@@ -15,6 +15,7 @@ __all__ = [
 ]
 
 
+@stimulus_output
 def line(
     visual_size=None,
     ppd=None,
@@ -130,6 +131,7 @@ def line(
     return stim
 
 
+@stimulus_output
 def dipole(
     visual_size=None,
     ppd=None,
@@ -231,6 +233,7 @@ def dipole(
     return stim1
 
 
+@stimulus_output
 def ellipse(
     visual_size=None,
     ppd=None,
@@ -303,6 +306,7 @@ def ellipse(
     return stim
 
 
+@stimulus_output
 def circle(
     visual_size=None,
     ppd=None,
@@ -3,7 +3,8 @@ import collections
 import numpy as np
 
 from stimupy.components import draw_regions, mask_regions
-from stimupy.utils import resolution
+from stimupy.utils import resolution, stimulus_output
+from stimupy.utils.utils import _output_buffer
 
 __all__ = [
     "disc",
@@ -71,6 +72,7 @@ def mask_rings(
     return stim
 
 
+@stimulus_output
 def rings(
     visual_size=None,
     ppd=None,
@@ -142,7 +144,10 @@ def rings(
 
     # Draw rings
     stim["img"] = draw_regions(
-        stim["ring_mask"], intensity_rings, intensity_background=intensity_background
+        stim["ring_mask"],
+        intensity_rings,
+        intensity_background=intensity_background,
+        out=_output_buffer(stim["ring_mask"].shape),
     )
 
     # Assemble output
@@ -152,6 +157,7 @@ def rings(
     return stim
 
 
+@stimulus_output
 def disc(
     visual_size=None,
     ppd=None,
@@ -217,6 +223,7 @@ def disc(
     return stim
 
 
+@stimulus_output
 def ring(
     visual_size=None,
     ppd=None,
@@ -3,7 +3,7 @@ import numpy as np
 from stimupy.components import image_base
 from stimupy.components.angulars import wedge
 from stimupy.components.radials import annulus, disc, ring
-from stimupy.utils import resolution
+from stimupy.utils import resolution, stimulus_output
 
 __all__ = [
     "rectangle",
@@ -19,6 +19,7 @@ __all__ = [
 ]
 
 
+@stimulus_output
 def rectangle(
     visual_size=None,
     ppd=None,
@@ -69,11 +70,82 @@ def rectangle(
         rotation=rotation,
         origin="center",
     )
-    xx = base["horizontal"]
-    yy = base["vertical"]
     theta = np.deg2rad(rotation)
     rectangle_size = resolution.validate_visual_size(visual_size=rectangle_size)
 
+    # Determine shift, and check that rectangle fits
+    rectangle_position, rect_shift = _rectangle_shift(
+        base, rectangle_size, rectangle_position, rotation
+    )
+
+    if rotation == 0:
+        # Unrotated: rectangle is the outer product of a vertical and horizontal profile
+        img_y, img_x = _rectangle_profiles(base, rectangle_size, rect_shift)
+        img = img_y * img_x
+    else:
+        # Rotate coordinate systems
+        xx = base["horizontal"]
+        yy = base["vertical"]
+        x = np.round(np.cos(theta) * xx - np.sin(theta) * yy, 8)
+        y = np.round(np.sin(theta) * xx + np.cos(theta) * yy, 8)
+
+        # Rounding for more robust behavior:
+        x = np.round(x * (base["ppd"][0] * 2)) / (base["ppd"][0] * 2)
+        y = np.round(y * (base["ppd"][0] * 2)) / (base["ppd"][0] * 2)
+
+        # Draw rectangle
+        img1 = np.where(x < rectangle_size.width / 2, 1, 0)
+        img2 = np.where(x >= -rectangle_size.width / 2, 1, 0)
+        img3 = np.where(y < rectangle_size.height / 2, 1, 0)
+        img4 = np.where(y >= -rectangle_size.height / 2, 1, 0)
+        img = img1 * img2 * img3 * img4
+
+        # Shift rectangle
+        img = np.roll(img, (rect_shift[0], rect_shift[1]), axis=(0, 1))
+
+    return {
+        "img": img * (intensity_rectangle - intensity_background) + intensity_background,
+        "rectangle_mask": img.astype(int),
+        "visual_size": base["visual_size"],
+        "ppd": base["ppd"],
+        "shape": base["shape"],
+        "rectangle_size": rectangle_size,
+        "rectangle_position": rectangle_position,
+        "intensity_background": intensity_background,
+        "intensity_rectangle": intensity_rectangle,
+        "rotation": rotation,
+    }
+
+
+def _rectangle_shift(base, rectangle_size, rectangle_position, rotation=0.0):
+    """Shift (in pixels) of a rectangle from the center of the image
+
+    Parameters
+    ----------
+    base : stimupy.components.image_base
+        image base, with origin "center"
+    rectangle_size : Sequence[Number, Number]
+        rectangle size [height, width], in degrees visual angle
+    rectangle_position : Number, Sequence[Number, Number], or None
+        position of the rectangle, in degrees visual angle.
+        If None, rectangle will be placed in center of image.
+    rotation : float, optional
+        rotation (in degrees), counterclockwise, by default 0.0 (horizontal)
+
+    Returns
+    -------
+    rectangle_position : numpy.ndarray
+        position of the rectangle, in degrees visual angle, clipped to be positive
+    rect_shift : numpy.ndarray
+        shift [vertical, horizontal] of the rectangle from the center, in pixels
+
+    Raises
+    ------
+    ValueError
+        if the rectangle does not fully fit into the image
+    """
+    theta = np.deg2rad(rotation)
+
     # Determine center position
     rect_posy = (base["visual_size"].height / 2) - (rectangle_size.height / 2)
     rect_posx = (base["visual_size"].width / 2) - (rectangle_size.width / 2)
@@ -92,24 +164,6 @@ def rectangle(
     center_pos = resolution.shape_from_visual_size_ppd(center_pos, base["ppd"])
     rect_shift = (np.array(rect_pos) - np.array(center_pos)).astype(int)
 
-    # Rotate coordinate systems
-    x = np.round(np.cos(theta) * xx - np.sin(theta) * yy, 8)
-    y = np.round(np.sin(theta) * xx + np.cos(theta) * yy, 8)
-
-    # Rounding for more robust behavior:
-    x = np.round(x * (base["ppd"][0] * 2)) / (base["ppd"][0] * 2)
-    y = np.round(y * (base["ppd"][0] * 2)) / (base["ppd"][0] * 2)
-
-    # Draw rectangle
-    img1 = np.where(x < rectangle_size.width / 2, 1, 0)
-    img2 = np.where(x >= -rectangle_size.width / 2, 1, 0)
-    img3 = np.where(y < rectangle_size.height / 2, 1, 0)
-    img4 = np.where(y >= -rectangle_size.height / 2, 1, 0)
-    img = img1 * img2 * img3 * img4
-
-    # Shift rectangle
-    img = np.roll(img, (rect_shift[0], rect_shift[1]), axis=(0, 1))
-
     # Does the rectangle fit?
     x1 = rectangle_size[1] / 2 * np.cos(theta)
     x2 = rectangle_size[1] / 2 * np.sin(theta)
@@ -123,20 +177,47 @@ def rectangle(
     if (cy > base["visual_size"][0] / 2) or (cx > base["visual_size"][1] / 2):
         raise ValueError("stimulus does not fully fit into requested size")
 
-    return {
-        "img": img * (intensity_rectangle - intensity_background) + intensity_background,
-        "rectangle_mask": img.astype(int),
-        "visual_size": base["visual_size"],
-        "ppd": base["ppd"],
-        "shape": base["shape"],
-        "rectangle_size": rectangle_size,
-        "rectangle_position": rectangle_position,
-        "intensity_background": intensity_background,
-        "intensity_rectangle": intensity_rectangle,
-        "rotation": rotation,
-    }
+    return rectangle_position, rect_shift
+
+
+def _rectangle_profiles(base, rectangle_size, rect_shift):
+    """Vertical and horizontal profile of an unrotated rectangle
+
+    Parameters
+    ----------
+    base : stimupy.components.image_base
+        image base, with origin "center"
+    rectangle_size : Sequence[Number, Number]
+        rectangle size [height, width], in degrees visual angle
+    rect_shift : Sequence[int, int]
+        shift [vertical, horizontal] of the rectangle from the center, in pixels
+
+    Returns
+    -------
+    img_y : numpy.ndarray
+        array of shape (height, 1), 1 for rows that the rectangle covers, 0 elsewhere
+    img_x : numpy.ndarray
+        array of shape (1, width), 1 for columns that the rectangle covers, 0 elsewhere;
+        the rectangle mask is the outer product img_y * img_x
+    """
+    x = np.round(base.profile("horizontal"), 8)
+    y = np.round(base.profile("vertical"), 8)
+
+    # Rounding for more robust behavior:
+    x = np.round(x * (base["ppd"][0] * 2)) / (base["ppd"][0] * 2)
+    y = np.round(y * (base["ppd"][0] * 2)) / (base["ppd"][0] * 2)
+
+    # Draw and shift profiles
+    img1 = np.where(x < rectangle_size.width / 2, 1, 0)
+    img2 = np.where(x >= -rectangle_size.width / 2, 1, 0)
+    img3 = np.where(y < rectangle_size.height / 2, 1, 0)
+    img4 = np.where(y >= -rectangle_size.height / 2, 1, 0)
+    img_x = np.roll(img1 * img2, rect_shift[1], axis=1)
+    img_y = np.roll(img3 * img4, rect_shift[0], axis=0)
+    return img_y, img_x
 
 
+@stimulus_output
 def triangle(
     visual_size=None,
     ppd=None,
@@ -225,6 +306,7 @@ def triangle(
     }
 
 
+@stimulus_output
 def cross(
     visual_size=None,
     ppd=None,
@@ -333,6 +415,7 @@ def cross(
     }
 
 
+@stimulus_output
 def parallelogram(
     visual_size=None,
     ppd=None,
@@ -445,6 +528,7 @@ def parallelogram(
     }
 
 
+@stimulus_output
 def ellipse(
     visual_size=None,
     ppd=None,
@@ -537,6 +621,7 @@ def ellipse(
     }
 
 
+@stimulus_output
 def circle(
     visual_size=None,
     ppd=None,
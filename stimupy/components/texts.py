@@ -1,13 +1,14 @@
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
-from stimupy.utils import pad_dict_to_visual_size, resolution
+from stimupy.utils import pad_dict_to_visual_size, resolution, stimulus_output
 
 __all__ = [
     "text",
 ]
 
 
+@stimulus_output
 def text(
     text,
     visual_size=None,
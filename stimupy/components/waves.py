@@ -4,19 +4,22 @@ from copy import deepcopy
 
 import numpy as np
 
-from stimupy.components import draw_regions, image_base
-from stimupy.utils import int_factorize, resolution
+from stimupy.components import _broadcast, draw_regions, grid_cache, image_base
+from stimupy.utils import dtypes, int_factorize, memoize, resolution, stimulus_output
 from stimupy.utils.contrast_conversions import adapt_intensity_range
-from stimupy.utils.utils import apply_bessel, round_to_vals
+from stimupy.utils.utils import _output_buffer, _round_to_vals_idcs, apply_bessel, round_to_vals
 
 __all__ = [
     "sine",
+    "sine_batch",
+    "sine_frames",
     "square",
     "staircase",
     "bessel",
 ]
 
 
+@memoize
 def resolve_grating_params(
     length=None,
     visual_angle=None,
@@ -43,6 +46,8 @@ def resolve_grating_params(
 
     Note: all phases in a grating have the same width
 
+    Results are memoized (see stimupy.utils.cache.memoize).
+
     Parameters
     ----------
     length : Number, or None (default)
@@ -244,68 +249,27 @@ def round_n_phases(n_phases, length, period="either"):
     return int(closest)
 
 
-def sine(
-    visual_size=None,
-    ppd=None,
-    shape=None,
-    frequency=None,
-    n_phases=None,
-    phase_width=None,
-    period="ignore",
-    rotation=0.0,
-    phase_shift=0.0,
-    intensities=(0.0, 1.0),
-    origin="center",
-    distance_metric=None,
-    round_phase_width=False,
+def _resolve_sine(
+    visual_size,
+    ppd,
+    shape,
+    frequency,
+    n_phases,
+    phase_width,
+    period,
+    rotation,
+    distance_metric,
+    round_phase_width,
 ):
-    """Draw a sine-wave grating given a certain distance_metric
+    """Resolve resolution and grating parameters of a sine-wave grating
 
-    Parameters
-    ----------
-    visual_size : Sequence[Number, Number], Number, or None (default)
-        visual size [height, width] of image, in degrees
-    ppd : Sequence[Number, Number], Number, or None (default)
-        pixels per degree [vertical, horizontal]
-    shape : Sequence[Number, Number], Number, or None (default)
-        shape [height, width] of image, in pixels
-    frequency : Number, or None (default)
-        spatial frequency of grating, in cycles per degree visual angle.
-        For `distance_metric="angular"`, this is used as cycles-per-image.
-    n_phases : int, or None (default)
-        number of phases in the grating
-    phase_width : Number, or None (default)
-        width of a single phase, in degrees visual angle
-    period : "even", "odd", "either", "ignore" (default)
-        ensure whether the grating has "even" number of phases, "odd"
-        number of phases, either or whether not to round the number of
-        phases ("ignore")
-    rotation : float, optional
-        rotation (in degrees), counterclockwise, by default 0.0 (horizontal)
-    phase_shift : float
-        phase shift of grating in degrees, by default 0.0
-    intensities : Sequence[float, float]
-        min and max intensity of sine-wave, by default (0.0, 1.0).
-    origin : "corner", "mean", or "center" (default)
-        if "corner": set origin to upper left corner
-        if "mean": set origin to hypothetical image center
-        if "center": set origin to real center (closest existing value to mean)
-    distance_metric : str or None
-        if "horizontal", use distance from origin in x-direction,
-        if "vertical", use distance from origin in x-direction;
-        if "oblique", use combined and rotated distance from origin in x-y;
-        if "radial", use radial distance from origin,
-        if "angular", use angular distance from origin,
-        if "rectilinear", use rectilinear/cityblock/Manhattan distance from origin
-    round_phase_width : bool
-        if True, round width of bars given resolution, by default False.
+    See sine for a description of the parameters.
 
     Returns
-    ----------
+    -------
     dict[str, Any]
-        dict with the stimulus (key: "img"),
-        mask with integer index for each bar (key: "grating_mask"),
-        and additional keys containing stimulus parameters
+        resolved "shape", "visual_size", "ppd", "frequency", "n_phases", "phase_width",
+        "period" and "round_phase_width"
     """
     distance_metrics = ["horizontal", "vertical", "oblique", "radial", "angular", "rectilinear"]
     if distance_metric not in distance_metrics:
@@ -406,31 +370,112 @@ def sine(
     visual_size = resolution.validate_visual_size(visual_size)
     ppd = resolution.validate_ppd(ppd)
 
-    # Set up coordinates
-    base = image_base(
-        shape=shape, visual_size=visual_size, ppd=ppd, rotation=rotation, origin=origin
+    return {
+        "shape": shape,
+        "visual_size": visual_size,
+        "ppd": ppd,
+        "frequency": frequency,
+        "n_phases": n_phases,
+        "phase_width": phase_width,
+        "period": period,
+        "round_phase_width": round_phase_width,
+    }
+
+
+def _quadrant(base, distance_metric):
+    """Unique absolute axis values of a mirror-symmetric grating, and indices to expand them
+
+    Radial, and unrotated rectilinear, distances only depend on the absolute axis values,
+    and are thus (exactly) mirror-symmetric about an origin in the image.
+    These only need to be computed on the grid of unique absolute axis values,
+    i.e., a single quadrant, if the axes are symmetric about the origin.
+
+    Returns
+    -------
+    quadrant : (numpy.ndarray, numpy.ndarray) or None
+        unique absolute values of y and x axes;
+        None if grating is not symmetric, or the grid of these is not at most half the image
+    idcs : (numpy.ndarray, numpy.ndarray) or None
+        for each row and column of the image, index into the quadrant
+    """
+    if distance_metric != "radial" and not (
+        distance_metric == "rectilinear" and base["rotation"] == 0
+    ):
+        return None, None
+
+    x, x_idcs = np.unique(np.abs(base["x"]), return_inverse=True)
+    y, y_idcs = np.unique(np.abs(base["y"]), return_inverse=True)
+    if 2 * x.size * y.size > base["x"].size * base["y"].size:
+        return None, None
+
+    return (y, x), (y_idcs, x_idcs)
+
+
+def _expand(arr, shape, idcs=None, materialize=True, out=None):
+    """Expand compact array (1D profile, or quadrant) to full image shape
+
+    If materialize and out is given, the full array is written into out.
+    """
+    if out is not None and materialize:
+        if idcs is not None:
+            return np.take(np.take(arr, idcs[0], axis=0), idcs[1], axis=1, out=out)
+        if arr is not out:
+            np.copyto(out, arr, casting="same_kind")
+        return out
+    if idcs is not None:
+        arr = np.take(np.take(arr, idcs[0], axis=0), idcs[1], axis=1)
+    return _broadcast(arr, shape, materialize=materialize)
+
+
+def _sine_distances(base, distance_metric, origin, n_phases, phase_width, quadrant=None):
+    """Distances along which sine-wave grating varies, shifted minimally
+
+    Gratings along a single axis only get distances along their 1D profile;
+    mirror-symmetric gratings only get distances on a single quadrant (see _quadrant).
+    Distances are cached (see `stimupy.components.grid_cache`),
+    since they do not depend on e.g. frequency, phase or intensities.
+    """
+    angular_extent = n_phases * phase_width if distance_metric == "angular" else None
+    key = (
+        "sine_distances",
+        *base._cache_key(distance_metric),
+        angular_extent,
+        quadrant is not None,
     )
-    distances = base[distance_metric]
-    distances = np.round(distances, 6)
 
-    # Shift distances minimally to ensure proper behavior
-    if origin == "corner":
-        distances = adapt_intensity_range(distances, 1e-03, distances.max() - 1e-03)
-    else:
-        distances = adapt_intensity_range(
-            distances, distances.min() - 1e-05, distances.max() - 1e-05
-        )
+    def _compute():
+        if quadrant is not None:
+            y, x = quadrant[0][:, np.newaxis], quadrant[1][np.newaxis, :]
+            if distance_metric == "radial":
+                distances = np.sqrt(x**2 + y**2)
+            else:
+                distances = np.maximum(x, y)
+        else:
+            distances = base.profile(distance_metric)
+            if distances is None:
+                distances = base[distance_metric]
+        distances = np.round(distances, 6)
+
+        # Shift distances minimally to ensure proper behavior
+        if origin == "corner":
+            distances = adapt_intensity_range(distances, 1e-03, distances.max() - 1e-03)
+        else:
+            distances = adapt_intensity_range(
+                distances, distances.min() - 1e-05, distances.max() - 1e-05
+            )
 
-    if distance_metric == "angular":
-        distances = adapt_intensity_range(
-            distances, distances.min() - 1e-05, n_phases * phase_width - 1e-05
-        )
+        if distance_metric == "angular":
+            distances = adapt_intensity_range(
+                distances, distances.min() - 1e-05, angular_extent - 1e-05
+            )
 
-    # Draw image
-    img = np.sin(frequency * 2 * np.pi * distances + np.deg2rad(phase_shift))
-    img = adapt_intensity_range(img, intensities[0], intensities[1])
+        return distances
 
-    # Create mask
+    return grid_cache.get_or_compute(key, _compute)
+
+
+def _sine_mask(distances, distance_metric, origin, phase_width, phase_shift):
+    """Mask with integer index for each phase of sine-wave grating"""
     dmax = max(distances.max(), -distances.min()) + (phase_width / 1)
     if (
         origin == "corner"
@@ -450,10 +495,104 @@ def sine(
     edges -= (((phase_shift) % 360) / 180) * phase_width
     # edges = np.round(edges, 8)
 
-    regions = round_to_vals(distances, edges)
-    mask = np.zeros(shape=regions.shape)
-    for idx, val in enumerate(np.unique(regions)):
-        mask = np.where(regions == val, idx + 1, mask)
+    # Round distances to (index of) nearest edge,
+    # and label regions 1, 2, ... in order of (present) edges
+    idcs = _round_to_vals_idcs(distances, np.unique(edges))
+    present = np.bincount(idcs.ravel(), minlength=len(edges)) > 0
+    mask = np.cumsum(present)[idcs]
+
+    return mask
+
+
+def _sine(
+    visual_size,
+    ppd,
+    shape,
+    frequency,
+    n_phases,
+    phase_width,
+    period,
+    rotation,
+    phase_shift,
+    intensities,
+    origin,
+    distance_metric,
+    round_phase_width,
+    dtype=None,
+    out=None,
+):
+    """Draw a sine-wave grating in compact form
+
+    See sine for a description of the parameters;
+    dtype is the floating point dtype of the image,
+    by default (None) the package-wide float dtype.
+    If the grating cannot be drawn in compact form, it is drawn into out (if given).
+
+    Returns
+    -------
+    stim : dict[str, Any]
+        as returned by sine, but with "img" and "grating_mask" in compact form:
+        a 1D profile (for gratings along a single axis),
+        a single quadrant (for mirror-symmetric gratings, see _quadrant),
+        or the full image
+    idcs : (numpy.ndarray, numpy.ndarray) or None
+        row and column indices to expand a quadrant to the full image (see _expand)
+    """
+    params = _resolve_sine(
+        visual_size=visual_size,
+        ppd=ppd,
+        shape=shape,
+        frequency=frequency,
+        n_phases=n_phases,
+        phase_width=phase_width,
+        period=period,
+        rotation=rotation,
+        distance_metric=distance_metric,
+        round_phase_width=round_phase_width,
+    )
+    shape, visual_size, ppd = params["shape"], params["visual_size"], params["ppd"]
+    frequency, n_phases, phase_width = (
+        params["frequency"],
+        params["n_phases"],
+        params["phase_width"],
+    )
+    period, round_phase_width = params["period"], params["round_phase_width"]
+
+    # Set up coordinates
+    base = image_base(
+        shape=shape, visual_size=visual_size, ppd=ppd, rotation=rotation, origin=origin
+    )
+    quadrant, idcs = _quadrant(base, distance_metric)
+    distances = _sine_distances(
+        base,
+        distance_metric=distance_metric,
+        origin=origin,
+        n_phases=n_phases,
+        phase_width=phase_width,
+        quadrant=quadrant,
+    )
+
+    # Draw image
+    # (geometry in float64, image in package-wide float dtype)
+    if dtype is None:
+        dtype = dtypes.get_dtypes().float
+    if out is not None and out.shape == distances.shape:
+        img = out
+    else:
+        img = np.empty(distances.shape, dtype=dtype)
+    np.sin(frequency * 2 * np.pi * distances + np.deg2rad(phase_shift), out=img)
+    img = adapt_intensity_range(
+        img, intensities[0], intensities[1], out=img if img is out else None
+    )
+
+    # Create mask
+    mask = _sine_mask(
+        distances,
+        distance_metric=distance_metric,
+        origin=origin,
+        phase_width=phase_width,
+        phase_shift=phase_shift,
+    )
 
     # Package and output
     stim = {
@@ -473,9 +612,475 @@ def sine(
         "distance_metric": distance_metric,
         "intensities": intensities,
     }
+    return stim, idcs
+
+
+@stimulus_output
+def sine(
+    visual_size=None,
+    ppd=None,
+    shape=None,
+    frequency=None,
+    n_phases=None,
+    phase_width=None,
+    period="ignore",
+    rotation=0.0,
+    phase_shift=0.0,
+    intensities=(0.0, 1.0),
+    origin="center",
+    distance_metric=None,
+    round_phase_width=False,
+    materialize=True,
+):
+    """Draw a sine-wave grating given a certain distance_metric
+
+    Gratings along a single axis ("horizontal", "vertical",
+    or unrotated "oblique" distance_metric)
+    are computed on a 1D profile, and then broadcast to the full image.
+
+    Parameters
+    ----------
+    visual_size : Sequence[Number, Number], Number, or None (default)
+        visual size [height, width] of image, in degrees
+    ppd : Sequence[Number, Number], Number, or None (default)
+        pixels per degree [vertical, horizontal]
+    shape : Sequence[Number, Number], Number, or None (default)
+        shape [height, width] of image, in pixels
+    frequency : Number, or None (default)
+        spatial frequency of grating, in cycles per degree visual angle.
+        For `distance_metric="angular"`, this is used as cycles-per-image.
+    n_phases : int, or None (default)
+        number of phases in the grating
+    phase_width : Number, or None (default)
+        width of a single phase, in degrees visual angle
+    period : "even", "odd", "either", "ignore" (default)
+        ensure whether the grating has "even" number of phases, "odd"
+        number of phases, either or whether not to round the number of
+        phases ("ignore")
+    rotation : float, optional
+        rotation (in degrees), counterclockwise, by default 0.0 (horizontal)
+    phase_shift : float
+        phase shift of grating in degrees, by default 0.0
+    intensities : Sequence[float, float]
+        min and max intensity of sine-wave, by default (0.0, 1.0).
+    origin : "corner", "mean", or "center" (default)
+        if "corner": set origin to upper left corner
+        if "mean": set origin to hypothetical image center
+        if "center": set origin to real center (closest existing value to mean)
+    distance_metric : str or None
+        if "horizontal", use distance from origin in x-direction,
+        if "vertical", use distance from origin in x-direction;
+        if "oblique", use combined and rotated distance from origin in x-y;
+        if "radial", use radial distance from origin,
+        if "angular", use angular distance from origin,
+        if "rectilinear", use rectilinear/cityblock/Manhattan distance from origin
+    round_phase_width : bool
+        if True, round width of bars given resolution, by default False.
+    materialize : bool
+        if True (default), return "img" and "grating_mask" as regular arrays.
+        If False, gratings along a single axis are returned as read-only broadcast views
+        of their 1D profile, which take up memory only for that profile.
+
+    Returns
+    ----------
+    dict[str, Any]
+        dict with the stimulus (key: "img"),
+        mask with integer index for each bar (key: "grating_mask"),
+        and additional keys containing stimulus parameters
+    """
+    stim, idcs = _sine(
+        visual_size=visual_size,
+        ppd=ppd,
+        shape=shape,
+        frequency=frequency,
+        n_phases=n_phases,
+        phase_width=phase_width,
+        period=period,
+        rotation=rotation,
+        phase_shift=phase_shift,
+        intensities=intensities,
+        origin=origin,
+        distance_metric=distance_metric,
+        round_phase_width=round_phase_width,
+        out=_output_buffer(),
+    )
+    stim["img"] = _expand(
+        stim["img"],
+        stim["shape"],
+        idcs,
+        materialize=materialize,
+        out=_output_buffer(stim["shape"]),
+    )
+    stim["grating_mask"] = _expand(
+        stim["grating_mask"], stim["shape"], idcs, materialize=materialize
+    )
+    return stim
+
+
+@stimulus_output
+def sine_batch(
+    visual_size=None,
+    ppd=None,
+    shape=None,
+    frequency=None,
+    n_phases=None,
+    phase_width=None,
+    period="ignore",
+    rotation=0.0,
+    phase_shift=0.0,
+    intensities=(0.0, 1.0),
+    origin="center",
+    distance_metric=None,
+    round_phase_width=False,
+    return_masks=False,
+):
+    """Draw a stack of sine-wave gratings, that differ in frequency, phase and/or rotation
+
+    Gives the same images (and masks) as calling sine for each set of parameters,
+    but sets up coordinates only once for all gratings with the same rotation,
+    and draws each grating in place into the stack.
+
+    Parameters
+    ----------
+    visual_size : Sequence[Number, Number], Number, or None (default)
+        visual size [height, width] of image, in degrees
+    ppd : Sequence[Number, Number], Number, or None (default)
+        pixels per degree [vertical, horizontal]
+    shape : Sequence[Number, Number], Number, or None (default)
+        shape [height, width] of image, in pixels
+    frequency : Number, Sequence[Number, ...], or None (default)
+        spatial frequency of each grating, in cycles per degree visual angle.
+        For `distance_metric="angular"`, this is used as cycles-per-image.
+    n_phases : int, Sequence[int, ...], or None (default)
+        number of phases in each grating
+    phase_width : Number, Sequence[Number, ...], or None (default)
+        width of a single phase in each grating, in degrees visual angle
+    period : "even", "odd", "either", "ignore" (default)
+        ensure whether the gratings have "even" number of phases, "odd"
+        number of phases, either or whether not to round the number of
+        phases ("ignore")
+    rotation : float, or Sequence[float, ...]
+        rotation (in degrees) of each grating, counterclockwise, by default 0.0 (horizontal)
+    phase_shift : float, or Sequence[float, ...]
+        phase shift of each grating in degrees, by default 0.0
+    intensities : Sequence[float, float]
+        min and max intensity of sine-waves, by default (0.0, 1.0).
+    origin : "corner", "mean", or "center" (default)
+        if "corner": set origin to upper left corner
+        if "mean": set origin to hypothetical image center
+        if "center": set origin to real center (closest existing value to mean)
+    distance_metric : str or None
+        if "horizontal", use distance from origin in x-direction,
+        if "vertical", use distance from origin in x-direction;
+        if "oblique", use combined and rotated distance from origin in x-y;
+        if "radial", use radial distance from origin,
+        if "angular", use angular distance from origin,
+        if "rectilinear", use rectilinear/cityblock/Manhattan distance from origin
+    round_phase_width : bool
+        if True, round width of bars given resolution, by default False.
+    return_masks : bool
+        if True, also return a mask with integer index for each phase of each grating,
+        by default False
+
+    Returns
+    ----------
+    dict[str, Any]
+        dict with the stack of N stimuli (key: "img", shape (N, height, width)),
+        if return_masks: stack of masks with integer index for each phase
+        (key: "grating_mask"),
+        and additional keys containing stimulus parameters, per grating as numpy.ndarray
+
+    Raises
+    ------
+    ValueError
+        if the batched parameters are of different lengths,
+        or if the gratings do not all resolve to the same shape
+    """
+    # Broadcast batched parameters
+    batched = {
+        "frequency": frequency,
+        "n_phases": n_phases,
+        "phase_width": phase_width,
+        "rotation": rotation,
+        "phase_shift": phase_shift,
+    }
+    lengths = {len(value) for value in batched.values() if np.ndim(value) > 0}
+    if len(lengths) > 1:
+        raise ValueError(f"Batched parameters should all have the same length, not {lengths}")
+    n_gratings = lengths.pop() if lengths else 1
+    batch = [
+        {key: value[idx] if np.ndim(value) > 0 else value for key, value in batched.items()}
+        for idx in range(n_gratings)
+    ]
+
+    # Resolve each set of parameters
+    for item in batch:
+        item.update(
+            _resolve_sine(
+                visual_size=visual_size,
+                ppd=ppd,
+                shape=shape,
+                frequency=item["frequency"],
+                n_phases=item["n_phases"],
+                phase_width=item["phase_width"],
+                period=period,
+                rotation=item["rotation"],
+                distance_metric=distance_metric,
+                round_phase_width=round_phase_width,
+            )
+        )
+    if len({item["shape"] for item in batch}) > 1:
+        raise ValueError("Gratings in batch should all resolve to the same shape")
+    shape, visual_size, ppd = batch[0]["shape"], batch[0]["visual_size"], batch[0]["ppd"]
+
+    # Group gratings that share their distances
+    groups = {}
+    for idx, item in enumerate(batch):
+        angular_extent = (
+            item["n_phases"] * item["phase_width"] if distance_metric == "angular" else None
+        )
+        groups.setdefault((item["rotation"], angular_extent), []).append(idx)
+
+    imgs = np.empty((n_gratings, *shape), dtype=dtypes.get_dtypes().float)
+    masks = np.empty((n_gratings, *shape), dtype=int) if return_masks else None
+    for idcs in groups.values():
+        first = batch[idcs[0]]
+
+        # Set up coordinates
+        base = image_base(
+            shape=shape,
+            visual_size=visual_size,
+            ppd=ppd,
+            rotation=first["rotation"],
+            origin=origin,
+        )
+        distances = _sine_distances(
+            base,
+            distance_metric=distance_metric,
+            origin=origin,
+            n_phases=first["n_phases"],
+            phase_width=first["phase_width"],
+        )
+
+        # Draw images, in place, one grating at a time (to stay in cache)
+        separable = distances.shape != imgs.shape[1:]
+        img = np.empty(distances.shape, dtype=imgs.dtype) if separable else None
+        for idx in idcs:
+            if not separable:
+                img = imgs[idx]
+            np.multiply(batch[idx]["frequency"] * 2 * np.pi, distances, out=img)
+            img += np.deg2rad(batch[idx]["phase_shift"])
+            np.sin(img, out=img)
+            adapt_intensity_range(img, intensities[0], intensities[1], out=img)
+            if separable:
+                imgs[idx] = img
+
+        # Create masks
+        if return_masks:
+            for idx in idcs:
+                masks[idx] = _sine_mask(
+                    distances,
+                    distance_metric=distance_metric,
+                    origin=origin,
+                    phase_width=batch[idx]["phase_width"],
+                    phase_shift=batch[idx]["phase_shift"],
+                )
+
+    # Package and output
+    stim = {
+        "img": imgs,
+        "visual_size": visual_size,
+        "ppd": ppd,
+        "shape": shape,
+        "intensities": intensities,
+        "origin": origin,
+        "distance_metric": distance_metric,
+    }
+    if return_masks:
+        stim["grating_mask"] = masks
+    for key in (
+        "frequency",
+        "n_phases",
+        "phase_width",
+        "period",
+        "rotation",
+        "phase_shift",
+        "round_phase_width",
+    ):
+        stim[key] = np.array([item[key] for item in batch])
     return stim
 
 
+def sine_frames(
+    visual_size=None,
+    ppd=None,
+    shape=None,
+    frequency=None,
+    n_phases=None,
+    phase_width=None,
+    period="ignore",
+    rotation=0.0,
+    phase_shift=0.0,
+    intensities=(0.0, 1.0),
+    origin="center",
+    distance_metric=None,
+    round_phase_width=False,
+    temporal_frequency=None,
+    frame_rate=None,
+    n_frames=None,
+    counterphase=False,
+    out=None,
+):
+    """Generate successive frames of a drifting (or counterphase) sine-wave grating
+
+    Frames are generated lazily, so that long sequences do not have to be held in memory.
+    The spatial phase map phi (of the grating at t=0) is computed only once;
+    each frame is then computed as sin(phi + wt) = sin(phi) cos(wt) + cos(phi) sin(wt),
+    from a cached sin(phi) and cos(phi).
+    Frame k of a drifting grating is the grating with phase_shift
+    `phase_shift + 360 * temporal_frequency * k / frame_rate`.
+
+    Unlike sine, which stretches each image to exactly span the intensities,
+    frames map the sine-wave [-1, 1] onto the intensities,
+    so that the contrast of all frames is the same (drifting),
+    or modulated over time (counterphase).
+
+    Parameters
+    ----------
+    visual_size : Sequence[Number, Number], Number, or None (default)
+        visual size [height, width] of image, in degrees
+    ppd : Sequence[Number, Number], Number, or None (default)
+        pixels per degree [vertical, horizontal]
+    shape : Sequence[Number, Number], Number, or None (default)
+        shape [height, width] of image, in pixels
+    frequency : Number, or None (default)
+        spatial frequency of grating, in cycles per degree visual angle.
+        For `distance_metric="angular"`, this is used as cycles-per-image.
+    n_phases : int, or None (default)
+        number of phases in the grating
+    phase_width : Number, or None (default)
+        width of a single phase, in degrees visual angle
+    period : "even", "odd", "either", "ignore" (default)
+        ensure whether the grating has "even" number of phases, "odd"
+        number of phases, either or whether not to round the number of
+        phases ("ignore")
+    rotation : float, optional
+        rotation (in degrees), counterclockwise, by default 0.0 (horizontal)
+    phase_shift : float
+        phase shift of grating (at t=0) in degrees, by default 0.0
+    intensities : Sequence[float, float]
+        min and max intensity of sine-wave, by default (0.0, 1.0).
+    origin : "corner", "mean", or "center" (default)
+        if "corner": set origin to upper left corner
+        if "mean": set origin to hypothetical image center
+        if "center": set origin to real center (closest existing value to mean)
+    distance_metric : str or None
+        if "horizontal", use distance from origin in x-direction,
+        if "vertical", use distance from origin in x-direction;
+        if "oblique", use combined and rotated distance from origin in x-y;
+        if "radial", use radial distance from origin,
+        if "angular", use angular distance from origin,
+        if "rectilinear", use rectilinear/cityblock/Manhattan distance from origin
+    round_phase_width : bool
+        if True, round width of bars given resolution, by default False.
+    temporal_frequency : Number
+        temporal frequency of drift (or contrast reversal), in cycles per second (Hz).
+        Negative values drift in the opposite direction
+    frame_rate : Number
+        number of frames per second (Hz)
+    n_frames : int or None (default)
+        number of frames to generate; if None, generate frames indefinitely
+    counterphase : bool
+        if True, generate a counterphase (contrast reversing) grating sin(phi) cos(wt),
+        instead of a drifting grating, by default False
+    out : numpy.ndarray or None (default)
+        preallocated buffer to write each frame into (and yield).
+        If None (default), each frame is a new array
+
+    Returns
+    -------
+    Iterator[numpy.ndarray]
+        successive frames, generated lazily
+
+    Examples
+    --------
+    >>> frames = sine_frames(
+    ...     visual_size=4, ppd=16, frequency=1, distance_metric="horizontal",
+    ...     temporal_frequency=2, frame_rate=60, n_frames=30,
+    ... )
+    >>> for frame in frames:
+    ...     pass  # e.g., present frame
+    """
+    if temporal_frequency is None:
+        raise ValueError("sine_frames() missing argument 'temporal_frequency' which is not 'None'")
+    if frame_rate is None:
+        raise ValueError("sine_frames() missing argument 'frame_rate' which is not 'None'")
+
+    params = _resolve_sine(
+        visual_size=visual_size,
+        ppd=ppd,
+        shape=shape,
+        frequency=frequency,
+        n_phases=n_phases,
+        phase_width=phase_width,
+        period=period,
+        rotation=rotation,
+        distance_metric=distance_metric,
+        round_phase_width=round_phase_width,
+    )
+    shape = params["shape"]
+    if out is not None and out.shape != tuple(shape):
+        raise ValueError(
+            f"Buffer for frames has shape {out.shape}, but stimulus has shape {shape}"
+        )
+
+    # Spatial phase map, and its sine and cosine
+    base = image_base(
+        shape=shape,
+        visual_size=params["visual_size"],
+        ppd=params["ppd"],
+        rotation=rotation,
+        origin=origin,
+    )
+    distances = _sine_distances(
+        base,
+        distance_metric=distance_metric,
+        origin=origin,
+        n_phases=params["n_phases"],
+        phase_width=params["phase_width"],
+    )
+    phi = params["frequency"] * 2 * np.pi * distances + np.deg2rad(phase_shift)
+    sin_phi = np.sin(phi)
+    cos_phi = np.cos(phi)
+
+    # Map [-1, 1] onto intensities
+    mean = (intensities[1] + intensities[0]) / 2
+    amplitude = (intensities[1] - intensities[0]) / 2
+
+    dtype = dtypes.get_dtypes().float
+    frame_idcs = itertools.count() if n_frames is None else range(n_frames)
+
+    def generate_frames():
+        frame = np.empty(distances.shape)
+        tmp = np.empty(distances.shape)
+        for idx in frame_idcs:
+            wt = 2 * np.pi * temporal_frequency * idx / frame_rate
+            np.multiply(sin_phi, np.cos(wt), out=frame)
+            if not counterphase:
+                frame += np.multiply(cos_phi, np.sin(wt), out=tmp)
+            frame *= amplitude
+            frame += mean
+
+            if out is None:
+                yield np.array(np.broadcast_to(frame, shape), dtype=dtype)
+            else:
+                out[...] = frame
+                yield out
+
+    return generate_frames()
+
+
+@stimulus_output
 def square(
     visual_size=None,
     ppd=None,
@@ -490,9 +1095,14 @@ def square(
     origin="center",
     distance_metric=None,
     round_phase_width=False,
+    materialize=True,
 ):
     """Draw a square-wave grating given a certain distance_metric
 
+    Gratings along a single axis ("horizontal", "vertical",
+    or unrotated "oblique" distance_metric)
+    are computed on a 1D profile, and then broadcast to the full image.
+
     Parameters
     ----------
     visual_size : Sequence[Number, Number], Number, or None (default)
@@ -530,6 +1140,10 @@ def square(
         if "rectilinear", use rectilinear/cityblock/Manhattan distance from origin
     round_phase_width : bool
         if True, round width of bars given resolution, by default False
+    materialize : bool
+        if True (default), return "img" and "grating_mask" as regular arrays.
+        If False, gratings along a single axis are returned as read-only broadcast views
+        of their 1D profile, which take up memory only for that profile.
 
     Returns
     ----------
@@ -539,7 +1153,7 @@ def square(
         and additional keys containing stimulus parameters
     """
 
-    stim = sine(
+    stim, idcs = _sine(
         visual_size=visual_size,
         ppd=ppd,
         shape=shape,
@@ -553,13 +1167,24 @@ def square(
         origin=origin,
         round_phase_width=round_phase_width,
         distance_metric=distance_metric,
+        dtype=np.float64,
     )
 
-    # Round sine-wave to create square wave
-    stim["img"] = round_to_vals(stim["img"], intensities)
+    # Round (float64) sine-wave to create square wave,
+    # so that the phases do not depend on the package-wide float dtype
+    img = round_to_vals(stim["img"], intensities)
+    if img.dtype.kind == "f":
+        img = img.astype(dtypes.get_dtypes().float, copy=False)
+    stim["img"] = _expand(
+        img, stim["shape"], idcs, materialize=materialize, out=_output_buffer(stim["shape"])
+    )
+    stim["grating_mask"] = _expand(
+        stim["grating_mask"], stim["shape"], idcs, materialize=materialize
+    )
     return stim
 
 
+@stimulus_output
 def staircase(
     visual_size=None,
     ppd=None,
@@ -574,9 +1199,14 @@ def staircase(
     distance_metric=None,
     round_phase_width=False,
     intensities=(0.0, 1.0),
+    materialize=True,
 ):
     """Draw a luminance staircase
 
+    Staircases along a single axis ("horizontal", "vertical",
+    or unrotated "oblique" distance_metric)
+    are computed on a 1D profile, and then broadcast to the full image.
+
     Parameters
     ----------
     visual_size : Sequence[Number, Number], Number, or None (default)
@@ -617,6 +1247,10 @@ def staircase(
         if len(intensities)>2, intensity value for each phase.
         Can specify as many intensities as n_phases.
         If fewer intensities are passed than n_phases, cycles through intensities.
+    materialize : bool
+        if True (default), return "img" and "grating_mask" as regular arrays.
+        If False, gratings along a single axis are returned as read-only broadcast views
+        of their 1D profile, which take up memory only for that profile.
 
     Returns
     -------
@@ -626,7 +1260,7 @@ def staircase(
         and additional keys containing stimulus parameters
     """
 
-    stim = square(
+    stim, idcs = _sine(
         visual_size=visual_size,
         ppd=ppd,
         shape=shape,
@@ -636,20 +1270,27 @@ def staircase(
         period=period,
         rotation=rotation,
         phase_shift=phase_shift,
+        intensities=(0.0, 1.0),
         origin=origin,
         round_phase_width=round_phase_width,
         distance_metric=distance_metric,
     )
+    mask = stim["grating_mask"]
 
     if len(intensities) == 2:
-        intensities = np.linspace(intensities[0], intensities[1], stim["grating_mask"].max())
+        intensities = np.linspace(intensities[0], intensities[1], mask.max())
 
     # Use grating_mask to draw staircase
-    stim["img"] = draw_regions(mask=stim["grating_mask"], intensities=intensities)
+    img = draw_regions(mask=mask, intensities=intensities)
+    stim["img"] = _expand(
+        img, stim["shape"], idcs, materialize=materialize, out=_output_buffer(stim["shape"])
+    )
+    stim["grating_mask"] = _expand(mask, stim["shape"], idcs, materialize=materialize)
     stim["intensity_phases"] = intensities
     return stim
 
 
+@stimulus_output
 def bessel(
     visual_size=None,
     ppd=None,
@@ -658,10 +1299,16 @@ def bessel(
     order=0,
     intensities=(1.0, 0.0),
     origin="mean",
+    tolerance=None,
 ):
     """Draw a Bessel stimulus, i.e. draw circular rings following an nth order
     Bessel function of a given frequency.
 
+    The Bessel function is only evaluated once for each unique radius
+    (or on an interpolated table, see tolerance),
+    and cached (see `stimupy.components.grid_cache`) by order, frequency and resolution,
+    so that drawing the same Bessel stimulus again is fast.
+
     Parameters
     ----------
     visual_size : Sequence[Number, Number], Number, or None (default)
@@ -680,6 +1327,10 @@ def bessel(
         if "corner": set origin to upper left corner
         if "mean": set origin to hypothetical image center (default)
         if "center": set origin to real center (closest existing value to mean)
+    tolerance : float or None (default)
+        if None, evaluate Bessel function exactly;
+        otherwise, interpolate it linearly from a table of values,
+        with at most this absolute error (before scaling to intensities)
 
     Returns
     ----------
@@ -699,10 +1350,27 @@ def bessel(
         origin=origin,
     )
 
-    arr = base["radial"] * frequency * 2 * np.pi
-    img = apply_bessel(arr, order=order)
-    img = (img - img.min()) / (img.max() - img.min())
-    img = img * (intensities[0] - intensities[1]) + intensities[1]
+    key = (
+        "bessel",
+        order,
+        frequency,
+        base["ppd"],
+        base["shape"],
+        base["visual_size"],
+        origin,
+        tolerance,
+    )
+    img = grid_cache.get_or_compute(
+        key,
+        lambda: apply_bessel(
+            base["radial"] * frequency * 2 * np.pi, order=order, tolerance=tolerance
+        ),
+    )
+    img_min, img_max = img.min(), img.max()
+    img = np.subtract(img, img_min, dtype=dtypes.get_dtypes().float)
+    img /= img_max - img_min
+    img *= intensities[0] - intensities[1]
+    img += intensities[1]
 
     stim = {
         "img": img,
@@ -714,6 +1382,7 @@ def bessel(
         "frequency": frequency,
         "intensities": intensities,
         "origin": origin,
+        "tolerance": tolerance,
     }
     return stim
 
@@ -1,6 +1,6 @@
 import numpy as np
 
-from stimupy.utils import resolution
+from stimupy.utils import resolution, stimulus_output
 from stimupy.utils.contrast_conversions import adapt_intensity_range
 
 __all__ = [
@@ -8,6 +8,7 @@ __all__ = [
 ]
 
 
+@stimulus_output
 def binary(
     visual_size=None,
     ppd=None,
@@ -1,7 +1,7 @@
 import numpy as np
 
 from stimupy.noises import pseudo_white_spectrum
-from stimupy.utils import resolution
+from stimupy.utils import resolution, stimulus_output
 from stimupy.utils.contrast_conversions import adapt_intensity_range
 
 __all__ = [
@@ -11,6 +11,7 @@ __all__ = [
 ]
 
 
+@stimulus_output
 def one_over_f(
     visual_size=None,
     ppd=None,
@@ -99,6 +100,7 @@ def one_over_f(
     return stim
 
 
+@stimulus_output
 def pink(
     visual_size=None,
     ppd=None,
@@ -143,6 +145,7 @@ def pink(
     return stim
 
 
+@stimulus_output
 def brown(
     visual_size=None,
     ppd=None,
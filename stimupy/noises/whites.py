@@ -1,7 +1,7 @@
 import numpy as np
 
 from stimupy.noises import pseudo_white_spectrum
-from stimupy.utils import resolution
+from stimupy.utils import resolution, stimulus_output
 from stimupy.utils.contrast_conversions import adapt_intensity_range
 
 __all__ = [
@@ -9,6 +9,7 @@ __all__ = [
 ]
 
 
+@stimulus_output
 def white(
     visual_size=None,
     ppd=None,
@@ -3,8 +3,8 @@ import logging
 
 import numpy as np
 
-from stimupy.components import draw_regions
 from stimupy.stimuli import *  # noqa: F403
+from stimupy.utils import dtypes
 
 # Get module level logger
 logger = logging.getLogger("stimupy.stimuli")
@@ -61,6 +61,34 @@ def mask_targets(element_mask, target_indices):
         target mask, with integer values indicating target regions,
         in order that they appear in target_indices
 
+    Raises
+    ------
+    ValueError
+        if a target_idx is greater than any value in the element_mask
+    """
+    lut, labels, _ = _target_lut(element_mask, target_indices)
+    return lut[labels]
+
+
+def _target_lut(element_mask, target_indices):
+    """Lookup-table from element to target index, for remapping element_mask to target_mask
+
+    Parameters
+    ----------
+    element_mask : numpy.ndarray
+        mask with integer values for different elements / regions in a stimulus
+    target_indices : Sequence[int] or int
+        index or indices of elements to be designated as targets
+
+    Returns
+    -------
+    lut : numpy.ndarray
+        target index for each element label
+    labels : numpy.ndarray
+        element label for each pixel, such that lut[labels] is the target mask
+    present : numpy.ndarray
+        sorted indices of targets that occur in the target mask
+
     Raises
     ------
     ValueError
@@ -73,19 +101,50 @@ def mask_targets(element_mask, target_indices):
             target_indices,
         ]
 
-    target_mask = np.zeros_like(element_mask)
-    for target_idx, element_idx in enumerate(target_indices):
+    element_mask = np.asarray(element_mask)
+    if len(target_indices) == 0:
+        return (
+            np.zeros(1, dtype=element_mask.dtype),
+            np.zeros(element_mask.shape, dtype=np.intp),
+            np.zeros(0, dtype=int),
+        )
+
+    max_idx = element_mask.max()
+    element_idcs = []
+    for element_idx in target_indices:
         if element_idx < 0:
-            element_idx = int(element_mask.max()) + element_idx
+            element_idx = int(max_idx) + element_idx
 
-        if element_idx > element_mask.max():
+        if element_idx > max_idx:
             raise ValueError("target_idx is outside stimulus")
-        target_mask = np.where(element_mask == element_idx, target_idx + 1, target_mask)
-
-    return target_mask
-
-
-def place_targets(stim, element_mask_key, target_indices, intensity_target=0.5):
+        element_idcs.append(element_idx)
+
+    # Label each pixel by (the position of) its element value
+    if (
+        element_mask.dtype.kind in "biu"
+        and element_mask.min() >= 0
+        and max_idx <= element_mask.size
+    ):
+        # Small, non-negative integer elements: label is the element value itself
+        labels = element_mask.astype(np.intp, copy=False)
+        values = np.arange(int(max_idx) + 1)
+        label_present = np.bincount(labels.ravel(), minlength=len(values)) > 0
+    else:
+        values, labels = np.unique(element_mask, return_inverse=True)
+        labels = labels.reshape(element_mask.shape)
+        label_present = np.ones(len(values), dtype=bool)
+
+    # Later target_indices take precedence over earlier ones (for the same element)
+    dtype = np.result_type(element_mask.dtype, len(element_idcs))
+    lut = np.zeros(len(values), dtype=dtype)
+    for target_idx, element_idx in enumerate(element_idcs):
+        lut[values == element_idx] = target_idx + 1
+
+    present = np.unique(lut[label_present])
+    return lut, labels, present[present > 0].astype(int)
+
+
+def place_targets(stim, element_mask_key, target_indices, intensity_target=0.5, out=None):
     """Place targets in stimulus
 
     Turns image regions/elements defined by element_mask_key
@@ -102,6 +161,8 @@ def place_targets(stim, element_mask_key, target_indices, intensity_target=0.5):
         index or indices of elements to be designated as targets
     intensity_target : float, optional
         intensity value for target, by default 0.5
+    out : numpy.ndarray or None (default)
+        preallocated array, same shape as stimulus, to draw image with targets into
 
     Returns
     -------
@@ -113,9 +174,8 @@ def place_targets(stim, element_mask_key, target_indices, intensity_target=0.5):
     --------
         mask_targets, draw_regions
     """
-    stim["target_mask"] = mask_targets(
-        element_mask=stim[element_mask_key], target_indices=target_indices
-    )
+    lut, labels, present = _target_lut(stim[element_mask_key], target_indices)
+    stim["target_mask"] = lut[labels]
 
     if isinstance(intensity_target, (int, float)):
         intensity_target = [
@@ -123,13 +183,19 @@ def place_targets(stim, element_mask_key, target_indices, intensity_target=0.5):
         ]
     intensity_target = itertools.cycle(intensity_target)
 
-    stim["img"] = np.where(
-        stim["target_mask"],
-        draw_regions(
-            mask=stim["target_mask"], intensities=intensity_target, intensity_background=0.0
-        ),
-        stim["img"],
-    )
+    # Targets that occur in the image take consecutive intensity values (as in draw_regions)
+    float_dtype = dtypes.get_dtypes().float
+    intensity_lut = np.zeros(int(lut.max()) + 1, dtype=float_dtype)
+    intensity_lut[present] = [*itertools.islice(intensity_target, len(present))]
+    intensity_lut = intensity_lut[lut.astype(np.intp)]
+    if out is None:
+        stim["img"] = np.where(stim["target_mask"], intensity_lut[labels], stim["img"])
+    else:
+        if stim["img"] is not out:
+            np.copyto(out, stim["img"], casting="same_kind")
+        targets = stim["target_mask"] != 0
+        out[targets] = intensity_lut[labels[targets]]
+        stim["img"] = out
     stim["target_indices"] = target_indices
     stim["intensity_target"] = intensity_target
 
@@ -3,7 +3,7 @@ import warnings
 import numpy as np
 
 from stimupy.components.shapes import cross, rectangle, triangle
-from stimupy.utils import resolution
+from stimupy.utils import resolution, stimulus_output
 
 __all__ = [
     "cross_generalized",
@@ -15,6 +15,7 @@ __all__ = [
 ]
 
 
+@stimulus_output
 def cross_generalized(
     visual_size=None,
     ppd=None,
@@ -105,6 +106,7 @@ def cross_generalized(
     return {**stim, **cross_stim}
 
 
+@stimulus_output
 def cross_rectangles(
     visual_size=None,
     ppd=None,
@@ -199,6 +201,7 @@ def cross_rectangles(
     return stim
 
 
+@stimulus_output
 def cross_triangles(
     visual_size=None,
     ppd=None,
@@ -295,6 +298,7 @@ def cross_triangles(
     return stim
 
 
+@stimulus_output
 def todorovic_generalized(
     visual_size=None,
     ppd=None,
@@ -397,6 +401,7 @@ def todorovic_generalized(
     return stim
 
 
+@stimulus_output
 def todorovic_rectangles(
     visual_size=None,
     ppd=None,
@@ -477,6 +482,7 @@ def todorovic_rectangles(
     return stim
 
 
+@stimulus_output
 def todorovic_triangles(
     visual_size=None,
     ppd=None,
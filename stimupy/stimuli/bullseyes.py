@@ -1,5 +1,5 @@
 from stimupy.stimuli import rings
-from stimupy.utils import make_two_sided
+from stimupy.utils import make_two_sided, stimulus_output
 
 __all__ = [
     "circular",
@@ -11,6 +11,7 @@ __all__ = [
 ]
 
 
+@stimulus_output
 def circular(
     visual_size=None,
     ppd=None,
@@ -114,6 +115,7 @@ def circular(
     return stim
 
 
+@stimulus_output
 def circular_generalized(
     visual_size=None,
     ppd=None,
@@ -178,6 +180,7 @@ circular_two_sided = make_two_sided(
 )
 
 
+@stimulus_output
 def rectangular(
     visual_size=None,
     ppd=None,
@@ -264,6 +267,7 @@ def rectangular(
     return stim
 
 
+@stimulus_output
 def rectangular_generalized(
     visual_size=None,
     ppd=None,
@@ -3,7 +3,7 @@ import warnings
 import numpy as np
 
 from stimupy.components import draw_regions, waves
-from stimupy.utils import resolution
+from stimupy.utils import resolution, stimulus_output
 from stimupy.utils.contrast_conversions import transparency
 
 __all__ = [
@@ -98,17 +98,36 @@ def add_targets(checkerboard_stim, target_indices=(), extend_targets=False, inte
     """
     if target_indices is None:
         target_indices = ()
-    target_mask = np.zeros(checkerboard_stim["shape"])
+    board_shape = checkerboard_stim["board_shape"]
+
+    # Index each check by its (row, column), as in checkerboard()
+    row_mask, col_mask = checkerboard_stim["row_mask"], checkerboard_stim["col_mask"]
+    n_cols = int(col_mask.max()) + 1
+    check_idcs = row_mask * n_cols + col_mask
+    present = np.bincount(check_idcs.ravel()) > 0
 
-    # Define target mask
+    # Lookup-table from check index to target index (summed, as in mask_from_idx);
+    # then define target mask in a single gather
+    target_lut = np.zeros(len(present), dtype=int)
     for i, target in enumerate(target_indices):
         if extend_targets:
             target_idc = extend_target_idx(target)
         else:
             target_idc = [target]
-        for target_idx in target_idc:
-            target_mask += mask_from_idx(checkerboard_stim, (target_idx,)) * (i + 1)
-    checkerboard_stim["target_mask"] = target_mask.astype(int)
+        for coords in target_idc:
+            if coords[0] < 0 or coords[1] < 0 or coords[1] > board_shape[1]:
+                raise ValueError(
+                    f"Cannot provide mask for check {coords} outside board {board_shape}"
+                )
+            row, col = coords[0] + 1, coords[1] + 1
+            idx = row * n_cols + col
+            if col >= n_cols or idx >= len(present) or not present[idx]:
+                raise ValueError(
+                    f"Cannot provide mask for check {coords} outside board because of rotation"
+                )
+            target_lut[idx] += i + 1
+    target_mask = target_lut[check_idcs]
+    checkerboard_stim["target_mask"] = target_mask
 
     # Draw targets
     checkerboard_stim["img"] = np.where(
@@ -120,6 +139,7 @@ def add_targets(checkerboard_stim, target_indices=(), extend_targets=False, inte
     return checkerboard_stim
 
 
+@stimulus_output
 def checkerboard(
     visual_size=None,
     ppd=None,
@@ -206,76 +226,64 @@ def checkerboard(
 
     create_twice = visual_size is None and shape is None
 
-    # Create checkerboard by treating it as a plaid
-    sw1 = waves.square(
-        visual_size=visual_size,
-        ppd=ppd,
-        shape=shape,
-        frequency=frequency[0],
-        n_phases=board_shape[0],
-        phase_width=check_visual_size[0],
-        period=period,
-        rotation=rotation,
-        phase_shift=0,
-        intensities=intensity_checks,
-        origin="corner",
-        round_phase_width=round_phase_width,
-        distance_metric="oblique",
-    )
-
-    sw2 = waves.square(
-        visual_size=visual_size,
-        ppd=ppd,
-        shape=shape,
-        frequency=frequency[1],
-        n_phases=board_shape[1],
-        phase_width=check_visual_size[1],
-        period=period,
-        rotation=rotation - 90,
-        phase_shift=0,
-        intensities=intensity_checks,
-        origin="corner",
-        round_phase_width=round_phase_width,
-        distance_metric="oblique",
-    )
+    # Create checkerboard by treating it as a plaid,
+    # of a grating for the columns and one for the rows
+    col_params = {
+        "frequency": frequency[0],
+        "n_phases": board_shape[0],
+        "phase_width": check_visual_size[0],
+        "rotation": rotation,
+    }
+    row_params = {
+        "frequency": frequency[1],
+        "n_phases": board_shape[1],
+        "phase_width": check_visual_size[1],
+        "rotation": rotation - 90,
+    }
+    grating_params = {
+        "period": period,
+        "round_phase_width": round_phase_width,
+        "distance_metric": "oblique",
+    }
 
     # If neither a visual_size nor a shape was given, each square wave
-    # grating is always a square. An easy solution is to just recreate
-    # both gratings with the resolved parameters
-    if create_twice:
-        warnings.filterwarnings("ignore")
+    # grating is always a square. An easy solution is to just resolve
+    # both gratings first, and draw them with the resolved parameters
+    with warnings.catch_warnings():
+        if create_twice:
+            res1 = waves._resolve_sine(
+                visual_size=None, ppd=ppd, shape=None, **col_params, **grating_params
+            )
+            res2 = waves._resolve_sine(
+                visual_size=None, ppd=ppd, shape=None, **row_params, **grating_params
+            )
+            visual_size = (res1["visual_size"][0], res2["visual_size"][1])
+            ppd = res1["ppd"]
+            warnings.simplefilter("ignore")
+
         sw1 = waves.square(
-            visual_size=(sw1["visual_size"][0], sw2["visual_size"][1]),
-            ppd=sw1["ppd"],
-            shape=None,
-            frequency=frequency[0],
-            n_phases=board_shape[0],
-            phase_width=check_visual_size[0],
-            period=period,
-            rotation=rotation,
+            visual_size=visual_size,
+            ppd=ppd,
+            shape=shape,
             phase_shift=0,
             intensities=intensity_checks,
             origin="corner",
-            round_phase_width=round_phase_width,
-            distance_metric="oblique",
+            **col_params,
+            **grating_params,
         )
-
+        if create_twice:
+            visual_size = (sw1["visual_size"][0], visual_size[1])
+            ppd = sw1["ppd"]
         sw2 = waves.square(
-            visual_size=(sw1["visual_size"][0], sw2["visual_size"][1]),
-            ppd=sw1["ppd"],
-            shape=None,
-            frequency=frequency[1],
-            n_phases=board_shape[1],
-            phase_width=check_visual_size[1],
-            period=period,
-            rotation=rotation - 90,
+            visual_size=visual_size,
+            ppd=ppd,
+            shape=shape,
             phase_shift=0,
             intensities=intensity_checks,
             origin="corner",
-            round_phase_width=round_phase_width,
-            distance_metric="oblique",
+            **row_params,
+            **grating_params,
         )
-        warnings.filterwarnings("default")
 
     # Add the two square-wave gratings into a checkerboard
     img = sw1["img"] + sw2["img"]
@@ -283,11 +291,12 @@ def checkerboard(
         img == intensity_checks[0] + intensity_checks[1], intensity_checks[1], intensity_checks[0]
     )
 
-    # Create a mask with target indices for each check
-    mask = sw1["grating_mask"] + sw2["grating_mask"] * sw1["grating_mask"].max() * 10
-    unique_vals = np.unique(mask)
-    for v in range(len(unique_vals)):
-        mask[mask == unique_vals[v]] = v + 1
+    # Create a mask with an index for each check, directly from its row and column:
+    # checks are labeled 1, 2, ... in row-major order of (present) row, column pairs
+    row_mask, col_mask = sw2["grating_mask"], sw1["grating_mask"]
+    check_idcs = row_mask * (col_mask.max() + 1) + col_mask
+    present = np.bincount(check_idcs.ravel()) > 0
+    mask = np.cumsum(present)[check_idcs]
 
     stim = {
         "img": img,
@@ -319,6 +328,7 @@ def checkerboard(
     return stim
 
 
+@stimulus_output
 def contrast_contrast(
     visual_size=None,
     ppd=None,
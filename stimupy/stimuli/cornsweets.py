@@ -1,12 +1,14 @@
 import numpy as np
 
 from stimupy.components.edges import cornsweet as cornsweet_edge
+from stimupy.utils import stimulus_output
 
 __all__ = [
     "cornsweet",
 ]
 
 
+@stimulus_output
 def cornsweet(
     visual_size=None,
     ppd=None,
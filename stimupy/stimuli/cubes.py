@@ -1,6 +1,6 @@
 import numpy as np
 
-from stimupy.utils import resolution
+from stimupy.utils import resolution, stimulus_output
 
 __all__ = [
     "varying_cells",
@@ -8,6 +8,7 @@ __all__ = [
 ]
 
 
+@stimulus_output
 def varying_cells(
     ppd=None,
     cell_lengths=None,
@@ -149,6 +150,7 @@ def varying_cells(
     return stim
 
 
+@stimulus_output
 def cube(
     visual_size=None,
     ppd=None,
@@ -1,10 +1,11 @@
 from stimupy.components import lines
 from stimupy.components.shapes import disc
-from stimupy.utils import make_two_sided
+from stimupy.utils import make_two_sided, stimulus_output
 
 __all__ = ["delboeuf", "two_sided"]
 
 
+@stimulus_output
 def delboeuf(
     visual_size=None,
     ppd=None,
@@ -1,12 +1,13 @@
 import numpy as np
 
-from stimupy.utils import pad_to_shape, resolution
+from stimupy.utils import pad_to_shape, resolution, stimulus_output
 
 __all__ = [
     "dungeon",
 ]
 
 
+@stimulus_output
 def dungeon(
     visual_size=None,
     ppd=None,
@@ -1,9 +1,11 @@
 from stimupy.components import waves
 from stimupy.components.gaussians import gaussian
+from stimupy.utils import stimulus_output
 
 __all__ = ["gabor"]
 
 
+@stimulus_output
 def gabor(
     visual_size=None,
     ppd=None,
@@ -6,7 +6,13 @@ from stimupy.components.gaussians import gaussian
 from stimupy.components.shapes import parallelogram, rectangle
 from stimupy.stimuli.waves import sine_linear as sinewave
 from stimupy.stimuli.waves import square_linear as squarewave
-from stimupy.utils import pad_dict_to_shape, pad_dict_to_visual_size, resolution, strip_dict
+from stimupy.utils import (
+    pad_dict_to_shape,
+    pad_dict_to_visual_size,
+    resolution,
+    stimulus_output,
+    strip_dict,
+)
 from stimupy.utils.filters import convolve
 
 __all__ = [
@@ -21,6 +27,7 @@ __all__ = [
 ]
 
 
+@stimulus_output
 def on_uniform(
     visual_size=None,
     ppd=None,
@@ -139,6 +146,7 @@ def on_uniform(
     return stim
 
 
+@stimulus_output
 def on_grating_masked(
     small_grating_params,
     large_grating_params,
@@ -213,6 +221,7 @@ def on_grating_masked(
     return stim
 
 
+@stimulus_output
 def on_grating(
     small_grating_params,
     large_grating_params,
@@ -249,6 +258,7 @@ def on_grating(
     return stim
 
 
+@stimulus_output
 def phase_shifted(
     visual_size=None,
     ppd=None,
@@ -362,6 +372,7 @@ def phase_shifted(
     return stim
 
 
+@stimulus_output
 def grating_induction(
     visual_size=None,
     ppd=None,
@@ -463,6 +474,7 @@ def grating_induction(
     return stim
 
 
+@stimulus_output
 def grating_induction_blur(
     visual_size=None,
     ppd=None,
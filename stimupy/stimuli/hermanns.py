@@ -1,12 +1,13 @@
 import numpy as np
 
-from stimupy.utils import resolution
+from stimupy.utils import resolution, stimulus_output
 
 __all__ = [
     "grid",
 ]
 
 
+@stimulus_output
 def grid(
     visual_size=None,
     ppd=None,
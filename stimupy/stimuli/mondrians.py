@@ -1,16 +1,76 @@
 import itertools
+import warnings
 
 import numpy as np
 
 from stimupy.components.shapes import parallelogram
-from stimupy.utils import resolution
+from stimupy.utils import dtypes, resolution, stimulus_output
 
 __all__ = [
     "mondrian",
     "corrugated_mondrian",
 ]
 
+# Number of pixels drawn at a time, when drawing Mondrians in bulk
+_BLOCK_SIZE = 2**20
 
+
+def _lengths(visual_angles, ppd):
+    """Lengths (pixels) from array of visual angles (degrees), rounded as in resolution
+
+    Parameters
+    ----------
+    visual_angles : numpy.ndarray
+        visual angles in degrees
+    ppd : Number
+        pixels per degree
+
+    Returns
+    -------
+    numpy.ndarray[int]
+        lengths in pixels, same shape as visual_angles
+    """
+    fpix = np.round(visual_angles * ppd, 10)
+    pix = fpix.astype(int)
+    for angle, f, p in zip(visual_angles.ravel(), fpix.ravel(), pix.ravel()):
+        if f > 0 and f != p:
+            warnings.warn(f"Rounding shape; {angle} * {ppd} = {f} -> {p}")
+    return pix
+
+
+def _patch(patch_size, ppd):
+    """Rasterize a single Mondrian into its bounding box
+
+    Parameters
+    ----------
+    patch_size : (Number, Number, Number)
+        size (height, width, depth) of Mondrian parallelogram in degrees visual angle
+    ppd : Sequence[Number, Number]
+        pixels per degree [vertical, horizontal]
+
+    Returns
+    -------
+    shape : (int, int)
+        shape [height, width] of the bounding box, in pixels
+    mask : numpy.ndarray[bool] or None
+        which pixels of the bounding box the Mondrian covers;
+        None for rectangles, which cover their whole bounding box
+    """
+    height, width, depth = patch_size
+    patch_visual_size = (height, width + np.abs(depth))
+    if depth == 0:
+        patch_shape, _, _ = resolution.resolve(visual_size=patch_visual_size, ppd=ppd)
+        return tuple(patch_shape), None
+
+    patch = parallelogram(
+        visual_size=patch_visual_size,
+        ppd=ppd,
+        parallelogram_size=patch_size,
+    )["parallelogram_mask"]
+    return patch.shape, patch == 1
+
+
+@stimulus_output
 def mondrian(
     visual_size=None,
     ppd=None,
@@ -22,6 +82,11 @@ def mondrian(
 ):
     """Draw Mondrian of given size and intensity at given position
 
+    Many Mondrians can be passed in bulk, as arrays of positions, sizes and intensities.
+    Mondrians of the same size are then drawn together, by fancy-indexing the image
+    with the pixels of their shared patch offset by each position,
+    so that drawing takes time proportional to the total area of the Mondrians.
+
     Parameters
     ----------
     visual_size : Sequence[Number, Number], Number, or None (default)
@@ -30,12 +95,14 @@ def mondrian(
         pixels per degree [vertical, horizontal]
     shape : Sequence[Number, Number], Number, or None (default)
         shape [height, width] of image, in pixels
-    positions : Sequence[tuple, ... ] or None (default)
-        position (y, x) of each Mondrian in degrees visual angle
-    sizes : Sequence[tuple, ... ] or None (default)
-        size (height, width, depth) of Mondrian parallelograms in degrees visual angle;
+    positions : Sequence[tuple, ... ], numpy.ndarray or None (default)
+        position (y, x) of each Mondrian in degrees visual angle,
+        or array of shape (n, 2)
+    sizes : Sequence[tuple, ... ], numpy.ndarray or None (default)
+        size (height, width, depth) of Mondrian parallelograms in degrees visual angle,
+        or array of shape (n, 2) or (n, 3);
         if only one number is given, squares will be drawn
-    intensities : Sequence[Number, ... ] or None (default)
+    intensities : Sequence[Number, ... ], numpy.ndarray or None (default)
         intensity values of each Mondrian, if only one number is given
         all will have the same intensity
     intensity_background : float
@@ -60,9 +127,6 @@ def mondrian(
     if len(np.unique(ppd)) > 1:
         raise ValueError("ppd should be equal in x and y direction")
 
-    img = np.ones(shape) * intensity_background
-    mask = np.zeros(shape)
-
     n_mondrians = len(positions)
     ints = itertools.cycle(intensities)
 
@@ -72,61 +136,83 @@ def mondrian(
     if any(len(lst) != n_mondrians for lst in [positions, sizes]):
         raise Exception("As many positions as sizes required.")
 
-    epositions_px = []
-    eshapes = []
-
-    for m in range(n_mondrians):
-        try:
-            if len(positions[m]) != 2:
-                raise ValueError("Position tuples should be (ypos, xpos)")
-        except Exception:
-            raise ValueError("Position tuples should be (ypos, xpos)")
-
-        ypos, xpos = resolution.lengths_from_visual_angles_ppd(positions[m], ppd[0])
-        individual_shapes = resolution.lengths_from_visual_angles_ppd(sizes[m], ppd[0])
-
-        try:
-            if len(individual_shapes) == 2:
-                depth = 0
-                individual_shapes = individual_shapes + [
-                    depth,
-                ]
-            elif len(individual_shapes) == 3:
-                depth = sizes[m][2]
-            else:
+    # Resolve pixel position of each Mondrian, all at once
+    try:
+        positions_px = _lengths(np.asarray(positions, dtype=float), ppd[0])
+    except ValueError:
+        positions_px = None
+    if positions_px is None or positions_px.shape != (n_mondrians, 2):
+        raise ValueError("Position tuples should be (ypos, xpos)")
+    ypos, xpos = positions_px[:, 0], positions_px[:, 1]
+
+    # Mondrian sizes as (height, width, depth)
+    patch_sizes = np.zeros((n_mondrians, 3))
+    if isinstance(sizes, np.ndarray) and sizes.ndim == 2 and sizes.shape[1] in (2, 3):
+        patch_sizes[:, : sizes.shape[1]] = sizes
+    else:
+        for m, size in enumerate(sizes):
+            try:
+                if len(size) not in (2, 3):
+                    raise ValueError
+                patch_sizes[m, : len(size)] = size
+            except Exception:
                 raise ValueError(
                     "Mondrian size tuples should be (height, width) for "
                     "rectangles or (height, width, depth) for parallelograms"
                 )
-        except Exception:
-            raise ValueError(
-                "Mondrian size tuples should be (height, width) for"
-                "rectangles or (height, width, depth) for parallelograms"
-            )
-
-        if depth < 0:
-            xpos += int(depth * ppd[0])
-        epositions_px.append(tuple([ypos, xpos]))
-        eshapes.append(tuple(individual_shapes))
-
-        # Create parallelogram
-        patch = parallelogram(
-            visual_size=(sizes[m][0], sizes[m][1] + np.abs(depth)),
-            ppd=ppd,
-            parallelogram_size=(sizes[m][0], sizes[m][1], depth),
-        )
-
-        # Place it into Mondrian mosaic
-        yshape, xshape = patch["img"].shape
-        if ypos < 0 or xpos < 0:
-            raise ValueError("There are no negative position coordinates")
-        if (ypos + yshape > shape[0]) or (xpos + xshape > shape[1]):
-            raise ValueError("Not all Mondrians fit into the stimulus")
-        mask_large = np.zeros(shape)
-        mask_large[ypos : ypos + yshape, xpos : xpos + xshape] = patch["parallelogram_mask"]
-
-        img[mask_large == 1] = next(ints)
-        mask[mask_large == 1] = m + 1
+    depths = patch_sizes[:, 2]
+    xpos[depths < 0] += (depths[depths < 0] * ppd[0]).astype(int)
+
+    # Mondrians of the same size share a patch
+    unique_sizes, group_idcs = np.unique(patch_sizes, axis=0, return_inverse=True)
+    patches = [_patch(tuple(size.tolist()), ppd) for size in unique_sizes]
+    patch_shapes = np.array([patch_shape for patch_shape, _ in patches], dtype=int)
+
+    # Check that they fit into Mondrian mosaic
+    if np.any(ypos < 0) or np.any(xpos < 0):
+        raise ValueError("There are no negative position coordinates")
+    group_idcs = group_idcs.ravel()
+    ends = positions_px + patch_shapes[group_idcs]
+    if np.any(ends[:, 0] > shape[0]) or np.any(ends[:, 1] > shape[1]):
+        raise ValueError("Not all Mondrians fit into the stimulus")
+
+    # Draw Mondrians (as their index) a group of same-sized Mondrians at a time.
+    # Where Mondrians overlap, the later (i.e., highest) index is drawn on top,
+    # irrespective of the order in which they are drawn.
+    mask = np.zeros(shape, dtype=int)
+    flat_mask = mask.reshape(-1)
+    offsets = ypos * shape[1] + xpos
+    groups = np.split(
+        np.argsort(group_idcs, kind="stable"), np.cumsum(np.bincount(group_idcs))[:-1]
+    )
+    for ((yshape, xshape), patch_mask), members in zip(patches, groups):
+        if len(members) == 1:
+            # Single Mondrian: draw into its bounding box
+            m = int(members[0])
+            roi = mask[ypos[m] : ypos[m] + yshape, xpos[m] : xpos[m] + xshape]
+            if patch_mask is None:
+                np.maximum(roi, m + 1, out=roi)
+            else:
+                roi[patch_mask] = np.maximum(roi[patch_mask], m + 1)
+            continue
+
+        # In bulk: offset the (flat) pixel indices of their shared patch by each position
+        if patch_mask is None:
+            pixels = (np.arange(yshape)[:, np.newaxis] * shape[1] + np.arange(xshape)).ravel()
+        else:
+            rows, cols = np.nonzero(patch_mask)
+            pixels = rows * shape[1] + cols
+        step = max(1, _BLOCK_SIZE // max(pixels.size, 1))
+        for start in range(0, len(members), step):
+            idcs = members[start : start + step, np.newaxis]
+            indices = offsets[idcs] + pixels
+            labels = np.broadcast_to(idcs + 1, indices.shape)
+            np.maximum.at(flat_mask, indices.ravel(), labels.ravel())
+
+    # Look up intensity of each Mondrian
+    intensity_lut = np.full(n_mondrians + 1, intensity_background, dtype=dtypes.get_dtypes().float)
+    intensity_lut[1:] = [*itertools.islice(ints, n_mondrians)]
+    img = intensity_lut[mask]
 
     stim = {
         "img": img,
@@ -142,6 +228,7 @@ def mondrian(
     return stim
 
 
+@stimulus_output
 def corrugated_mondrian(
     visual_size=None,
     ppd=None,
@@ -228,9 +315,6 @@ def corrugated_mondrian(
     red_depth = np.maximum(red_depth, sum_depth)
     mheight_px, mwidth_px = int(shape[0] / nrows), int((shape[1] - red_depth) / ncols)
 
-    # Initial y coordinates
-    yst = 0
-
     # Calculate initial x coordinates
     xstarts = np.cumsum(np.hstack([0, mdepths_px]))
     temp = np.hstack([mdepths_px, 0])
@@ -238,59 +322,75 @@ def corrugated_mondrian(
     xstarts += temp
     xstarts += np.abs(xstarts.min())
 
+    # Parameters of each individual Mondrian, row by row
+    n_mondrians = nrows * ncols
     sizes = []
     poses = []
-    intenses = []
-    tlist = []
-    target_counter = 1
-    counter = 0
-
     for r in range(nrows):
         xst = xstarts[r]
         if depths[r] < 0:
             xst -= int(depths[r] * ppd[0])
-
         for c in range(ncols):
-            if c != ncols - 1:
-                msize = (mheight_px / ppd[0], (mwidth_px + 1) / ppd[1], depths[r])
-            else:
-                msize = (mheight_px / ppd[0], mwidth_px / ppd[1], depths[r])
-            mpos = (yst / ppd[0], xst / ppd[1])
-            mint = next(ints)
-
-            sizes.append(msize)
-            poses.append(mpos)
-            intenses.append(mint)
-
-            if (r, c) in target_indices:
-                tlist.append(target_counter)
-
-            xst += mwidth_px
-            target_counter += 1
-            counter += 1
-        yst += mheight_px
-
-    stim = mondrian(
-        visual_size=visual_size,
-        ppd=ppd,
-        shape=shape,
-        positions=poses,
-        sizes=sizes,
-        intensities=intenses,
-        intensity_background=intensity_background,
-    )
-
-    target_mask = np.zeros(shape)
-    for t in range(len(tlist)):
-        target_mask[stim["mondrian_mask"] == tlist[t]] = t + 1
-
-    stim["target_mask"] = target_mask.astype(int)
-    stim["target_indices"] = target_indices
-
+            mwidth = mwidth_px + 1 if c != ncols - 1 else mwidth_px
+            sizes.append((mheight_px / ppd[0], mwidth / ppd[1], depths[r]))
+            poses.append((r * mheight_px / ppd[0], (xst + c * mwidth_px) / ppd[1]))
+    intenses = list(itertools.islice(ints, n_mondrians))
+
+    # All rows consist of the same Mondrians, except for their depth.
+    # Rasterize each row (as column indices) once per depth,
+    # and shift it into place for each row with that depth.
+    mask = np.zeros(shape, dtype=int)
+    patches = {}
+    templates = {}
+    for r in range(nrows):
+        if depths[r] not in templates:
+            row_patches = []
+            for c in range(ncols):
+                patch_size = sizes[r * ncols + c]
+                if patch_size not in patches:
+                    patches[patch_size] = _patch(patch_size, ppd)
+                row_patches.append(patches[patch_size])
+            template_width = max(c * mwidth_px + p[0][1] for c, p in enumerate(row_patches))
+            template = np.zeros((row_patches[0][0][0], template_width), dtype=int)
+            for c, ((_, xshape), patch_mask) in enumerate(row_patches):
+                roi = template[:, c * mwidth_px : c * mwidth_px + xshape]
+                if patch_mask is None:
+                    roi[...] = c + 1
+                else:
+                    roi[patch_mask] = c + 1
+            templates[depths[r]] = template
+        template = templates[depths[r]]
+
+        ypos, xpos = r * mheight_px, xstarts[r]
+        if (ypos + template.shape[0] > shape[0]) or (xpos + template.shape[1] > shape[1]):
+            raise ValueError("Not all Mondrians fit into the stimulus")
+        roi = mask[ypos : ypos + template.shape[0], xpos : xpos + template.shape[1]]
+        np.copyto(roi, template + r * ncols, where=template > 0)
+
+    # Look up intensity, and target index, of each Mondrian
+    intensity_lut = np.full(n_mondrians + 1, intensity_background, dtype=dtypes.get_dtypes().float)
+    intensity_lut[1:] = intenses
+    target_lut = np.zeros(n_mondrians + 1, dtype=int)
+    tlist = [
+        r * ncols + c + 1 for r in range(nrows) for c in range(ncols) if (r, c) in target_indices
+    ]
+    target_lut[tlist] = np.arange(len(tlist)) + 1
     if intensity_target is not None:
-        for t in range(len(tlist)):
-            stim["img"] = np.where(target_mask == t + 1, intensity_target, stim["img"])
+        intensity_lut[tlist] = intensity_target
 
+    stim = {
+        "img": intensity_lut[mask],
+        "mondrian_mask": mask,
+        "ppd": ppd,
+        "visual_size": visual_size,
+        "shape": shape,
+        "positions": tuple(poses),
+        "sizes": tuple(sizes),
+        "intensities": tuple(intenses),
+        "intensity_background": intensity_background,
+        "target_mask": target_lut[mask],
+        "target_indices": target_indices,
+    }
     return stim
 
 
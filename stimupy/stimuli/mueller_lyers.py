@@ -3,7 +3,7 @@ import copy
 import numpy as np
 
 from stimupy.components import lines
-from stimupy.utils import make_two_sided, resolution
+from stimupy.utils import make_two_sided, resolution, stimulus_output
 
 __all__ = [
     "mueller_lyer",
@@ -11,6 +11,7 @@ __all__ = [
 ]
 
 
+@stimulus_output
 def mueller_lyer(
     visual_size=None,
     ppd=None,
@@ -6,12 +6,14 @@ from stimupy.components import combine_masks, draw_regions
 from stimupy.components.shapes import circle
 from stimupy.components.shapes import ring as ring_shape
 from stimupy.stimuli import mask_targets, waves
+from stimupy.utils import stimulus_output
 
 __all__ = [
     "pinwheel",
 ]
 
 
+@stimulus_output
 def pinwheel(
     visual_size=None,
     ppd=None,
@@ -154,16 +156,16 @@ def pinwheel(
         )
         target_ring_masks.append(ring["ring_mask"])
 
-    # Combine segment & ring masks
-    target_masks = []
-    for target_idx, ring_mask in enumerate(target_ring_masks):
-        # Find where ring intesects with target segment
-        target_mask = (target_segment_mask == target_idx + 1) & ring_mask
-        target_masks.append(target_mask)
+    # Combine segment & ring masks:
+    # find where ring intesects with target segment, one target at a time
+    target_masks = (
+        (target_segment_mask == target_idx + 1) & ring_mask
+        for target_idx, ring_mask in enumerate(target_ring_masks)
+    )
 
     # Combine target masks
-    if len(target_masks) > 0:
-        target_mask = combine_masks(*target_masks)
+    if len(target_ring_masks) > 0:
+        target_mask = combine_masks(target_masks)
     else:
         target_mask = np.zeros_like(stim["img"])
     stim["target_mask"] = target_mask.astype(int)
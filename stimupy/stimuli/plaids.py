@@ -1,5 +1,9 @@
+import numpy as np
+
 from stimupy.stimuli import gabors as gabors_stim
 from stimupy.stimuli import waves
+from stimupy.utils import stimulus_output
+from stimupy.utils.utils import _output_buffer
 
 __all__ = [
     "gabors",
@@ -8,10 +12,13 @@ __all__ = [
 ]
 
 
-def add_waves(wave_dict1, wave_dict2, weight1=1, weight2=1):
+def add_waves(wave_dict1, wave_dict2, weight1=1, weight2=1, out=None):
     """
     Create plaid-like stimulus by adding two waves
 
+    The weighted sum is accumulated in place, in a single image buffer
+    (out, if given); neither input is altered.
+
     Parameters
     ----------
     wave_dict1 : dict
@@ -24,11 +31,14 @@ def add_waves(wave_dict1, wave_dict2, weight1=1, weight2=1):
         Factor with which the first wave is multiplied. The default is 1.
     weight2 : float, optional
         Factor with which the second wave is multiplied. The default is 1.
+    out : numpy.ndarray or None (default)
+        preallocated array, of the same shape as the waves, to accumulate plaid into
 
     Returns
     -------
-    wave_dict1 : dict
-        dictionary with plaid-like stimulus and additional keys if specified.
+    dict
+        copy of wave_dict1, with plaid-like stimulus (key: "img")
+        and parameters of the second wave (keys ending in "2"), if specified.
 
     """
     if wave_dict1["shape"] != wave_dict2["shape"]:
@@ -37,24 +47,26 @@ def add_waves(wave_dict1, wave_dict2, weight1=1, weight2=1):
         )
     if wave_dict1["ppd"] != wave_dict2["ppd"]:
         raise ValueError(
-            "Waves have different ppds; 1: {wave_dict1['ppd']}, 2: {wave_dict2['ppd']}"
+            f"Waves have different ppds; 1: {wave_dict1['ppd']}, 2: {wave_dict2['ppd']}"
         )
 
-    img = weight1 * wave_dict1["img"] + weight2 * wave_dict2["img"]
-    img = img / (weight1 + weight2)
+    # Accumulate weighted sum in a single buffer
+    img1, img2 = wave_dict1["img"], wave_dict2["img"]
+    dtype = np.result_type(img1, img2, weight1, weight2, 1.0)
+    img = np.multiply(img1, weight1, out=out, dtype=dtype)
+    img += weight2 * img2
+    img /= weight1 + weight2
 
     # Update parameters
-    wave_dict1["img"] = img
-    try:
-        wave_dict1["grating_mask2"] = wave_dict2["grating_mask"]
-        wave_dict1["frequency2"] = wave_dict2["frequency"]
-        wave_dict1["phase_width2"] = wave_dict2["phase_width"]
-        wave_dict1["n_phases2"] = wave_dict2["n_phases"]
-    except Exception:
-        pass
-    return wave_dict1
+    plaid = {**wave_dict1, "img": img}
+    for key in ("grating_mask", "frequency", "phase_width", "n_phases"):
+        if key not in wave_dict2:
+            break
+        plaid[f"{key}2"] = wave_dict2[key]
+    return plaid
 
 
+@stimulus_output
 def gabors(
     gabor_parameters1,
     gabor_parameters2,
@@ -85,7 +97,7 @@ def gabors(
     # Create sine-wave gratings
     grating1 = gabors_stim.gabor(**gabor_parameters1)
     grating2 = gabors_stim.gabor(**gabor_parameters2)
-    plaid = add_waves(grating1, grating2, weight1, weight2)
+    plaid = add_waves(grating1, grating2, weight1, weight2, out=_output_buffer(grating1["shape"]))
 
     out = {
         "img": plaid["img"],
@@ -102,6 +114,7 @@ def gabors(
     return out
 
 
+@stimulus_output
 def sine_waves(
     grating_parameters1,
     grating_parameters2,
@@ -132,7 +145,7 @@ def sine_waves(
     # Create sine-wave gratings
     grating1 = waves.sine_linear(**grating_parameters1)
     grating2 = waves.sine_linear(**grating_parameters2)
-    plaid = add_waves(grating1, grating2, weight1, weight2)
+    plaid = add_waves(grating1, grating2, weight1, weight2, out=_output_buffer(grating1["shape"]))
 
     out = {
         "img": plaid["img"],
@@ -149,6 +162,7 @@ def sine_waves(
     return out
 
 
+@stimulus_output
 def square_waves(
     grating_parameters1,
     grating_parameters2,
@@ -179,7 +193,7 @@ def square_waves(
     # Create sine-wave gratings
     grating1 = waves.square_linear(**grating_parameters1)
     grating2 = waves.square_linear(**grating_parameters2)
-    plaid = add_waves(grating1, grating2, weight1, weight2)
+    plaid = add_waves(grating1, grating2, weight1, weight2, out=_output_buffer(grating1["shape"]))
 
     out = {
         "img": plaid["img"],
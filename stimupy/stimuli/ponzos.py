@@ -1,11 +1,12 @@
 from stimupy.components import lines
-from stimupy.utils import resolution, stack_dicts
+from stimupy.utils import resolution, stack_dicts, stimulus_output
 
 __all__ = [
     "ponzo",
 ]
 
 
+@stimulus_output
 def ponzo(
     visual_size=None,
     ppd=None,
@@ -3,7 +3,8 @@ from stimupy.components.radials import rings
 from stimupy.stimuli import place_targets
 from stimupy.stimuli.waves import square_radial as circular
 from stimupy.stimuli.waves import square_rectilinear as rectangular
-from stimupy.utils import make_two_sided
+from stimupy.utils import make_two_sided, stimulus_output
+from stimupy.utils.utils import _output_buffer
 
 __all__ = [
     "circular",
@@ -15,6 +16,7 @@ __all__ = [
 ]
 
 
+@stimulus_output
 def circular_generalized(
     visual_size=None,
     ppd=None,
@@ -78,6 +80,7 @@ def circular_generalized(
         element_mask_key="ring_mask",
         target_indices=target_indices,
         intensity_target=intensity_target,
+        out=_output_buffer(stim["img"].shape),
     )
 
     return stim
@@ -88,6 +91,7 @@ circular_two_sided = make_two_sided(
 )
 
 
+@stimulus_output
 def rectangular_generalized(
     visual_size=None,
     ppd=None,
@@ -157,6 +161,7 @@ def rectangular_generalized(
         element_mask_key="frame_mask",
         target_indices=target_indices,
         intensity_target=intensity_target,
+        out=_output_buffer(stim["img"].shape),
     )
 
     return stim
@@ -1,8 +1,16 @@
 import numpy as np
 
-from stimupy.components.shapes import disc, rectangle
+from stimupy.components import image_base
+from stimupy.components.shapes import _rectangle_profiles, _rectangle_shift, disc, rectangle
 from stimupy.stimuli import bullseyes
-from stimupy.utils import make_two_sided, pad_by_visual_size, pad_to_shape, resolution
+from stimupy.utils import (
+    dtypes,
+    make_two_sided,
+    memoize,
+    pad_by_visual_size,
+    resolution,
+    stimulus_output,
+)
 
 __all__ = [
     "generalized",
@@ -19,6 +27,101 @@ __all__ = [
 ]
 
 
+@memoize
+def _dot_tile(dot_radius, distance, ppd):
+    """Single dot, padded by half the distance between dots on each side
+
+    Results are memoized (see stimupy.utils.cache.memoize).
+
+    Parameters
+    ----------
+    dot_radius : float
+        radius of dot, in degrees visual angle
+    distance : float
+        distance between dots, in degrees visual angle
+    ppd : Sequence[Number, Number]
+        pixels per degree [vertical, horizontal]
+
+    Returns
+    -------
+    numpy.ndarray[bool]
+        True where the dot is
+    """
+    padding = (distance / 2.0,)
+    patch = disc(
+        radius=dot_radius,
+        ppd=ppd,
+        intensity_background=0.0,
+        intensity_disc=1.0,
+    )["img"]
+    patch = pad_by_visual_size(img=patch, padding=padding, ppd=ppd, pad_value=0.0)
+    return patch != 0
+
+
+def _dot_field(shape, ppd, n_dots, dot_radius, distance, target_shape):
+    """Field of n_dots dots, centered in image, and rectangular target region
+
+    Parameters
+    ----------
+    shape : Sequence[int, int]
+        shape [height, width] of image, in pixels
+    ppd : Sequence[Number, Number]
+        pixels per degree [vertical, horizontal]
+    n_dots : Sequence[int, int]
+        number of dots [vertical, horizontal]
+    dot_radius : float
+        radius of each dot, in degrees visual angle
+    distance : float
+        distance between dots, in degrees visual angle
+    target_shape : Sequence[int, int]
+        shape [height, width] of target region, in number of dots
+
+    Returns
+    -------
+    dots : numpy.ndarray[bool]
+        True where there is a dot
+    target : numpy.ndarray[bool]
+        True in the (centered) target region
+
+    Raises
+    ------
+    ValueError
+        if the dots do not fit into the image
+    """
+    tile = _dot_tile(dot_radius, distance, ppd)
+    pixels_per_dot = tile.shape
+
+    # Target shape = target n_dots * pixels_per_dot
+    rect_shape = resolution.shape_from_visual_size_ppd(
+        visual_size=target_shape, ppd=pixels_per_dot
+    )
+    rect_visual_size = resolution.visual_size_from_shape_ppd(shape=rect_shape, ppd=ppd)
+
+    # Tile the field: broadcast the tile into each (dot row, dot column) cell
+    ny, nx = int(n_dots[0]), int(n_dots[1])
+    field_shape = (ny * pixels_per_dot[0], nx * pixels_per_dot[1])
+    if field_shape[0] > shape[0] or field_shape[1] > shape[1]:
+        raise ValueError("visual_size or shape_argument are too small. Advice: set to None")
+    field = np.empty(field_shape, dtype=bool)
+    field.reshape(ny, pixels_per_dot[0], nx, pixels_per_dot[1])[...] = tile[:, np.newaxis, :]
+
+    # Center field in image
+    dots = np.zeros(shape, dtype=bool)
+    y0 = (shape[0] - field_shape[0]) // 2
+    x0 = (shape[1] - field_shape[1]) // 2
+    dots[y0 : y0 + field_shape[0], x0 : x0 + field_shape[1]] = field
+
+    # Target region: unrotated, centered rectangle
+    base = image_base(shape=shape, ppd=ppd, origin="center")
+    rect_size = resolution.validate_visual_size(rect_visual_size)
+    _, rect_shift = _rectangle_shift(base, rect_size, None)
+    rect_rows, rect_cols = _rectangle_profiles(base, rect_size, rect_shift)
+    target = (rect_rows != 0) & (rect_cols != 0)
+
+    return dots, target
+
+
+@stimulus_output
 def generalized(
     visual_size=None,
     ppd=None,
@@ -86,6 +189,7 @@ def generalized(
     return stim
 
 
+@stimulus_output
 def basic(
     visual_size=None,
     ppd=None,
@@ -138,6 +242,7 @@ def basic(
     return stim
 
 
+@stimulus_output
 def square(
     target_radius,
     visual_size=None,
@@ -198,6 +303,7 @@ def square(
     return stim
 
 
+@stimulus_output
 def circular(
     target_radius,
     visual_size=None,
@@ -258,6 +364,7 @@ def circular(
     return stim
 
 
+@stimulus_output
 def with_dots(
     visual_size=None,
     ppd=None,
@@ -335,42 +442,14 @@ def with_dots(
     # target shape = is in number of dots
     target_shape = resolution.validate_visual_size(target_shape)
 
-    # Figure out pixels_per_dot
-    padding = (distance / 2.0,)
-    patch = disc(
-        radius=dot_radius,
-        ppd=ppd,
-        intensity_background=0.0,
-        intensity_disc=1,
-    )["img"]
-    patch = pad_by_visual_size(img=patch, padding=padding, ppd=ppd, pad_value=0.0)
-    pixels_per_dot = patch.shape
-    patch = np.tile(patch, (int(n_dots[0]), int(n_dots[1])))
-
-    # Target shape = target n_dots * pixels_per_dot
-    rect_shape = resolution.shape_from_visual_size_ppd(
-        visual_size=target_shape, ppd=pixels_per_dot
-    )
-    rect_visual_size = resolution.visual_size_from_shape_ppd(shape=rect_shape, ppd=ppd)
-
-    try:
-        patch = pad_to_shape(patch, shape, 0)
-    except Exception:
-        raise ValueError("visual_size or shape_argument are too small. Advice: set to None")
-
-    # Create the sbc in the background:
-    img_shape = patch.shape
-
-    sbc = rectangle(
-        shape=img_shape,
-        ppd=ppd,
-        rectangle_size=rect_visual_size,
-        intensity_background=intensity_background,
-        intensity_rectangle=intensity_target,
-    )
+    # Dots, and target region in the background
+    dots, target = _dot_field(shape, ppd, n_dots, dot_radius, distance, target_shape)
 
-    img = np.where(patch == 1, intensity_dots, sbc["img"])
-    mask = np.where(patch == 1, 0, sbc["rectangle_mask"])
+    # Draw target and background (as rectangle() would), then dots on top
+    img = np.full(shape, intensity_background, dtype=dtypes.get_dtypes().float)
+    img[target] = (intensity_target - intensity_background) + intensity_background
+    img[dots] = intensity_dots
+    mask = target & ~dots
 
     stim = {
         "img": img,
@@ -390,6 +469,7 @@ def with_dots(
     return stim
 
 
+@stimulus_output
 def dotted(
     visual_size=None,
     ppd=None,
@@ -467,42 +547,14 @@ def dotted(
     # target shape = is in number of dots
     target_shape = resolution.validate_visual_size(target_shape)
 
-    # Figure out pixels_per_dot
-    padding = (distance / 2.0,)
-    patch = disc(
-        radius=dot_radius,
-        ppd=ppd,
-        intensity_background=0.0,
-        intensity_disc=1.0,
-    )["img"]
-    patch = pad_by_visual_size(img=patch, padding=padding, ppd=ppd, pad_value=0.0)
-    pixels_per_dot = patch.shape
-    patch = np.tile(patch, (int(n_dots[0]), int(n_dots[1])))
-
-    # Target shape = target n_dots * pixels_per_dot
-    rect_shape = resolution.shape_from_visual_size_ppd(
-        visual_size=target_shape, ppd=pixels_per_dot
-    )
-    rect_visual_size = resolution.visual_size_from_shape_ppd(shape=rect_shape, ppd=ppd)
-
-    try:
-        patch = pad_to_shape(patch, shape, 0)
-    except Exception:
-        raise ValueError("visual_size or shape_argument are too small. Advice: set to None")
-
-    # Create the sbc and img:
-    img_shape = patch.shape
-    sbc = rectangle(
-        shape=img_shape,
-        ppd=ppd,
-        rectangle_size=rect_visual_size,
-        intensity_background=intensity_background,
-        intensity_rectangle=intensity_target,
-    )
+    # Dots, and target region
+    dots, target = _dot_field(shape, ppd, n_dots, dot_radius, distance, target_shape)
 
-    img = np.where(patch, intensity_dots, intensity_background)
-    img = np.where(patch + sbc["rectangle_mask"] == 2, intensity_target, img)
-    mask = np.where(patch + sbc["rectangle_mask"] == 2, 1, 0)
+    # Draw dots, and dots in the target region in target intensity
+    mask = dots & target
+    img = np.full(shape, intensity_background, dtype=dtypes.get_dtypes().float)
+    img[dots] = intensity_dots
+    img[mask] = intensity_target
 
     stim = {
         "img": img,
@@ -4,7 +4,7 @@ import numpy as np
 
 from stimupy.components.shapes import cross as cross_shape
 from stimupy.components.shapes import rectangle as rectangle_shape
-from stimupy.utils import make_two_sided, pad_dict_to_shape, resolution
+from stimupy.utils import make_two_sided, pad_dict_to_shape, resolution, stimulus_output
 from stimupy.utils.utils import _count_none_args, _repeat_numeric_arg
 
 __all__ = [
@@ -19,6 +19,7 @@ __all__ = [
 ]
 
 
+@stimulus_output
 def rectangle_generalized(
     visual_size=None,
     ppd=None,
@@ -157,6 +158,7 @@ def rectangle_generalized(
     return stim
 
 
+@stimulus_output
 def rectangle(
     visual_size=None,
     ppd=None,
@@ -265,6 +267,7 @@ rectangle_two_sided = make_two_sided(
 )
 
 
+@stimulus_output
 def cross_generalized(
     visual_size=None,
     ppd=None,
@@ -411,6 +414,7 @@ def cross_generalized(
     return stim
 
 
+@stimulus_output
 def cross(
     visual_size=None,
     ppd=None,
@@ -519,6 +523,7 @@ cross_two_sided = make_two_sided(
 )
 
 
+@stimulus_output
 def equal(
     visual_size=None,
     ppd=None,
@@ -3,6 +3,8 @@ import numpy as np
 from stimupy.components import waves
 from stimupy.components.shapes import disc, rectangle
 from stimupy.stimuli import place_targets
+from stimupy.utils import stimulus_output
+from stimupy.utils.utils import _output_buffer
 
 __all__ = [
     "sine_linear",
@@ -20,6 +22,7 @@ __all__ = [
 ]
 
 
+@stimulus_output
 def sine_linear(
     visual_size=None,
     ppd=None,
@@ -130,10 +133,12 @@ def sine_linear(
         element_mask_key="grating_mask",
         target_indices=target_indices,
         intensity_target=intensity_target,
+        out=_output_buffer(stim["img"].shape),
     )
     return stim
 
 
+@stimulus_output
 def square_linear(
     visual_size=None,
     ppd=None,
@@ -237,10 +242,12 @@ def square_linear(
         element_mask_key="grating_mask",
         target_indices=target_indices,
         intensity_target=intensity_target,
+        out=_output_buffer(stim["img"].shape),
     )
     return stim
 
 
+@stimulus_output
 def staircase_linear(
     visual_size=None,
     ppd=None,
@@ -349,10 +356,12 @@ def staircase_linear(
         element_mask_key="grating_mask",
         target_indices=target_indices,
         intensity_target=intensity_target,
+        out=_output_buffer(stim["img"].shape),
     )
     return stim
 
 
+@stimulus_output
 def sine_radial(
     visual_size=None,
     ppd=None,
@@ -476,10 +485,12 @@ def sine_radial(
         element_mask_key="grating_mask",
         target_indices=target_indices,
         intensity_target=intensity_target,
+        out=_output_buffer(stim["img"].shape),
     )
     return stim
 
 
+@stimulus_output
 def square_radial(
     visual_size=None,
     ppd=None,
@@ -601,10 +612,12 @@ def square_radial(
         element_mask_key="grating_mask",
         target_indices=target_indices,
         intensity_target=intensity_target,
+        out=_output_buffer(stim["img"].shape),
     )
     return stim
 
 
+@stimulus_output
 def staircase_radial(
     visual_size=None,
     ppd=None,
@@ -729,10 +742,12 @@ def staircase_radial(
         element_mask_key="grating_mask",
         target_indices=target_indices,
         intensity_target=intensity_target,
+        out=_output_buffer(stim["img"].shape),
     )
     return stim
 
 
+@stimulus_output
 def sine_rectilinear(
     visual_size=None,
     ppd=None,
@@ -864,10 +879,12 @@ def sine_rectilinear(
         element_mask_key="grating_mask",
         target_indices=target_indices,
         intensity_target=intensity_target,
+        out=_output_buffer(stim["img"].shape),
     )
     return stim
 
 
+@stimulus_output
 def square_rectilinear(
     visual_size=None,
     ppd=None,
@@ -998,10 +1015,12 @@ def square_rectilinear(
         element_mask_key="grating_mask",
         target_indices=target_indices,
         intensity_target=intensity_target,
+        out=_output_buffer(stim["img"].shape),
     )
     return stim
 
 
+@stimulus_output
 def staircase_rectilinear(
     visual_size=None,
     ppd=None,
@@ -1134,10 +1153,12 @@ def staircase_rectilinear(
         element_mask_key="grating_mask",
         target_indices=target_indices,
         intensity_target=intensity_target,
+        out=_output_buffer(stim["img"].shape),
     )
     return stim
 
 
+@stimulus_output
 def sine_angular(
     visual_size=None,
     ppd=None,
@@ -1241,10 +1262,12 @@ def sine_angular(
         element_mask_key="grating_mask",
         target_indices=target_indices,
         intensity_target=intensity_target,
+        out=_output_buffer(stim["img"].shape),
     )
     return stim
 
 
+@stimulus_output
 def square_angular(
     visual_size=None,
     ppd=None,
@@ -1348,10 +1371,12 @@ def square_angular(
         element_mask_key="grating_mask",
         target_indices=target_indices,
         intensity_target=intensity_target,
+        out=_output_buffer(stim["img"].shape),
     )
     return stim
 
 
+@stimulus_output
 def staircase_angular(
     visual_size=None,
     ppd=None,
@@ -1456,6 +1481,7 @@ def staircase_angular(
         element_mask_key="grating_mask",
         target_indices=target_indices,
         intensity_target=intensity_target,
+        out=_output_buffer(stim["img"].shape),
     )
     return stim
 
@@ -2,13 +2,15 @@ import itertools
 
 import numpy as np
 
-from stimupy.components import combine_masks, draw_regions
-from stimupy.components.shapes import rectangle
+from stimupy.components import combine_masks, draw_regions, image_base
+from stimupy.components.shapes import _rectangle_profiles, _rectangle_shift, rectangle
 from stimupy.stimuli import mask_targets
 from stimupy.stimuli.gratings import squarewave
 from stimupy.stimuli.pinwheels import pinwheel as angular
 from stimupy.stimuli.waves import square_radial as radial
 from stimupy.stimuli.wedding_cakes import wedding_cake
+from stimupy.utils import dtypes, resolution, stimulus_output
+from stimupy.utils.utils import _output_buffer
 
 __all__ = [
     "generalized",
@@ -23,6 +25,7 @@ __all__ = [
 ]
 
 
+@stimulus_output
 def generalized(
     visual_size=None,
     ppd=None,
@@ -136,47 +139,60 @@ def generalized(
         itertools.islice(itertools.cycle(target_center_offsets), len(target_indices))
     )
 
-    stim_center = stim["visual_size"].height / 2
-    target_rect_masks = []
-    for target_idx, (height, offset) in enumerate(zip(target_heights, target_center_offsets)):
-        # Draw a stripe of target_height x stim_width, at center + offset
-        rect = rectangle(
-            visual_size=stim["visual_size"],
-            ppd=stim["ppd"],
-            shape=stim["shape"],
-            rectangle_size=(height, stim["visual_size"].width),
-            rectangle_position=(stim_center + offset - (height / 2), 0),
-            intensity_rectangle=target_idx,
-        )
-        target_rect_masks.append(rect["rectangle_mask"])
     stim["target_heights"] = target_heights
     stim["target_center_offsets"] = target_center_offsets
 
-    # Combine rect & bar masks
-    target_masks = []
-    for target_idx, rect_mask in enumerate(target_rect_masks):
-        # Find where strip intersects with the target bar
-        target_mask = (target_bar_mask == target_idx + 1) & rect_mask
-        target_masks.append(target_mask)
-
-    # Combine masks
-    if len(target_masks) > 0:
-        target_mask = combine_masks(*target_masks)
-    else:
-        target_mask = np.zeros_like(stim["img"])
-    stim["target_mask"] = target_mask.astype(int)
-
-    # Draw targets
-    stim["img"] = np.where(
-        target_mask,
-        draw_regions(mask=target_mask, intensities=intensity_target, intensity_background=0.0),
-        stim["img"],
+    # Targets are where a (horizontal) stripe of target_height x stim_width,
+    # at center + offset, intersects with the target bar.
+    # Intersect only within the rows that the stripe covers, one target at a time.
+    base = image_base(
+        visual_size=stim["visual_size"],
+        ppd=stim["ppd"],
+        shape=stim["shape"],
+        origin="center",
     )
+    if isinstance(intensity_target, (float, int)):
+        intensities = itertools.cycle((intensity_target,))
+    else:
+        intensities = itertools.cycle(intensity_target)
+    float_dtype = dtypes.get_dtypes().float
+    img = _output_buffer(stim["shape"])
+    if img is None:
+        img = stim["img"].astype(np.result_type(float_dtype, stim["img"]), copy=True)
+    else:
+        np.copyto(img, stim["img"], casting="same_kind")
+    target_mask = np.zeros(stim["shape"], dtype=int)
+    stim_center = stim["visual_size"].height / 2
+    n_targets = 0
+    for target_idx, (height, offset) in enumerate(zip(target_heights, target_center_offsets)):
+        rectangle_size = resolution.validate_visual_size((height, stim["visual_size"].width))
+        _, rect_shift = _rectangle_shift(
+            base, rectangle_size, (stim_center + offset - (height / 2), 0)
+        )
+        stripe_rows, stripe_cols = _rectangle_profiles(base, rectangle_size, rect_shift)
+
+        rows = np.flatnonzero(stripe_rows)
+        if rows.size == 0:
+            continue
+        band = slice(rows[0], rows[-1] + 1)
+        in_target = (target_bar_mask[band] == target_idx + 1) & (
+            stripe_rows[band] * stripe_cols != 0
+        )
+
+        # Targets that do not appear in the image, do not take an index nor intensity
+        if not in_target.any():
+            continue
+        n_targets += 1
+        target_mask[band][in_target] = n_targets
+        img[band][in_target] = float_dtype.type(next(intensities))
+    stim["target_mask"] = target_mask
+    stim["img"] = img
     stim["intensity_target"] = intensity_target
 
     return stim
 
 
+@stimulus_output
 def white(
     visual_size=None,
     ppd=None,
@@ -267,10 +283,12 @@ def white(
         target_heights=target_heights,
         origin=origin,
         round_phase_width=round_phase_width,
+        out=_output_buffer(),
     )
     return stim
 
 
+@stimulus_output
 def white_two_rows(
     visual_size=None,
     ppd=None,
@@ -382,6 +400,7 @@ def white_two_rows(
     return stim
 
 
+@stimulus_output
 def anderson(
     visual_size=None,
     ppd=None,
@@ -537,6 +556,7 @@ def anderson(
     return stim
 
 
+@stimulus_output
 def howe(
     visual_size=None,
     ppd=None,
@@ -631,6 +651,7 @@ def howe(
     )
 
 
+@stimulus_output
 def yazdanbakhsh(
     visual_size=None,
     ppd=None,
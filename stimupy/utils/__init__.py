@@ -1,5 +1,8 @@
+from .cache import *  # noqa: F403
 from .color_conversions import *  # noqa: F403
+from .compiled import *  # noqa: F403
 from .contrast_conversions import *  # noqa: F403
+from .dtypes import *  # noqa: F403
 from .export import *  # noqa: F403
 from .filters import *  # noqa: F403
 from .masks import *  # noqa: F403
@@ -0,0 +1,336 @@
+import functools
+import threading
+import warnings
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+
+__all__ = [
+    "LRUCache",
+    "memoize",
+]
+
+CacheInfo = namedtuple("CacheInfo", "hits misses n_items nbytes max_bytes")
+MemoInfo = namedtuple("MemoInfo", "hits misses n_items maxsize")
+
+# Sentinel for a cache miss, so that None can be cached as a value
+_MISSING = object()
+
+# Lock shared by all memoized functions: recording warnings (warnings.catch_warnings)
+# modifies process-wide state, and memoized functions may call each other
+_memo_lock = threading.RLock()
+
+
+def _nbytes(value):
+    """Number of bytes taken up by (Sequence of) numpy.ndarray(s)"""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (tuple, list)):
+        return sum(_nbytes(v) for v in value)
+    return 0
+
+
+def _set_readonly(value):
+    """Mark (Sequence of) numpy.ndarray(s) as read-only, so they can safely be shared"""
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    elif isinstance(value, (tuple, list)):
+        for v in value:
+            _set_readonly(v)
+    return value
+
+
+class LRUCache:
+    """Bounded, least-recently-used cache of read-only numpy.ndarrays
+
+    The cache is bounded by the total number of bytes of the arrays it holds.
+    When adding an array would exceed this budget,
+    the least-recently-used arrays are evicted first.
+    Cached arrays are marked read-only, since they are shared between all callers.
+    This happens in place (no copy is made),
+    so an array stored by the caller also becomes read-only for that caller.
+
+    The cache can be shared between threads: lookups, stores and evictions
+    hold a (reentrant) lock. Values are computed outside of this lock,
+    so threads missing the same key at the same time may each compute it.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        maximum total size (in bytes) of cached arrays, by default 128 MiB.
+        Setting to 0 disables caching.
+    """
+
+    def __init__(self, max_bytes=128 * 2**20):
+        self._data = OrderedDict()
+        self._nbytes = 0
+        self._max_bytes = int(max_bytes)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.RLock()
+
+    @property
+    def max_bytes(self):
+        """Maximum total size (in bytes) of cached arrays; shrinking evicts immediately"""
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, max_bytes):
+        if max_bytes < 0:
+            raise ValueError(f"max_bytes should be non-negative, not {max_bytes}")
+        with self._lock:
+            self._max_bytes = int(max_bytes)
+            self._evict()
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._data
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+    def get(self, key, default=None):
+        """Get value stored under key, marking it as most-recently used
+
+        Parameters
+        ----------
+        key : Hashable
+            key to look up
+        default : Any, optional
+            returned (and counted as miss) if key is not in cache, by default None
+
+        Returns
+        -------
+        Any
+            cached value, or default
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Store value under key, evicting least-recently-used values as needed
+
+        Values larger than the whole cache budget are not stored.
+
+        Parameters
+        ----------
+        key : Hashable
+            key to store value under
+        value : numpy.ndarray, or Sequence[numpy.ndarray, ...]
+            value to store. Arrays get marked as read-only, in place:
+            the caller's own reference to these arrays also becomes read-only.
+            Pass a copy to keep a writeable array.
+
+        Returns
+        -------
+        Any
+            the (now read-only) value
+        """
+        nbytes = _nbytes(value)
+        _set_readonly(value)
+        if nbytes > self._max_bytes:
+            return value
+
+        with self._lock:
+            if key in self._data:
+                self._nbytes -= _nbytes(self._data.pop(key))
+            self._data[key] = value
+            self._nbytes += nbytes
+            self._evict()
+        return value
+
+    def get_or_compute(self, key, func):
+        """Get value stored under key, or compute, store and return it
+
+        Parameters
+        ----------
+        key : Hashable
+            key to look up
+        func : Callable[[], Any]
+            called without arguments to compute the value on a miss
+
+        Returns
+        -------
+        Any
+            cached or newly computed (read-only) value
+        """
+        # Lookup and store each hold the lock; func is called outside of it
+        value = self.get(key, default=_MISSING)
+        if value is _MISSING:
+            value = self.put(key, func())
+        return value
+
+    def clear(self):
+        """Remove all values from the cache, and reset hit and miss counters"""
+        with self._lock:
+            self._data.clear()
+            self._nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        """Report cache statistics
+
+        Returns
+        -------
+        CacheInfo NamedTuple, with attributes:
+            .hits: int, number of lookups that found a cached value
+            .misses: int, number of lookups that did not
+            .n_items: int, number of cached values
+            .nbytes: int, total size (in bytes) of cached values
+            .max_bytes: int, maximum total size (in bytes)
+        """
+        with self._lock:
+            return CacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                n_items=len(self._data),
+                nbytes=self._nbytes,
+                max_bytes=self._max_bytes,
+            )
+
+    def _evict(self):
+        with self._lock:
+            while self._nbytes > self._max_bytes and self._data:
+                _, value = self._data.popitem(last=False)
+                self._nbytes -= _nbytes(value)
+
+
+_ATOMIC_TYPES = frozenset((type(None), bool, int, float, complex, str))
+
+
+def _freeze(value):
+    """Normalize (nested) argument into a hashable key
+
+    Types are part of the key, so that e.g. 1 and 1.0 (which may resolve differently)
+    do not share an entry.
+
+    Raises
+    ------
+    TypeError
+        if value cannot be normalized into a hashable key
+    """
+    value_type = type(value)
+    if value_type in _ATOMIC_TYPES:
+        return (value_type, value)
+    if value_type is tuple or value_type is list:
+        return (value_type, tuple(map(_freeze, value)))
+    if isinstance(value, np.ndarray):
+        return (np.ndarray, value.dtype.str, value.shape, tuple(value.ravel().tolist()))
+    if isinstance(value, (tuple, list)):
+        return (value_type, tuple(map(_freeze, value)))
+    if isinstance(value, dict):
+        return (dict, tuple((k, _freeze(v)) for k, v in sorted(value.items())))
+    hash(value)
+    return (value_type, value)
+
+
+def _fresh(value):
+    """Copy mutable containers in a cached result, so that callers cannot alter the cache"""
+    if isinstance(value, dict):
+        return {k: _fresh(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_fresh(v) for v in value]
+    if isinstance(value, np.ndarray):
+        return value.copy()
+    return value
+
+
+def memoize(func=None, maxsize=1024):
+    """Decorator: bounded, least-recently-used memo cache for a pure function
+
+    Results are cached under (normalized) arguments;
+    calls with arguments that cannot be normalized are not cached.
+    Warnings raised by the function are recorded,
+    and replayed (subject to the active warning filters) on every cache hit,
+    so that callers see the same warnings as without cache.
+    Exceptions are not cached.
+
+    Memoized functions can be called from multiple threads:
+    cache lookups and updates, and calls to func on a cache miss,
+    hold a lock shared by all memoized functions.
+    Misses (and the recording of their warnings) are thus serialized;
+    warnings raised concurrently by non-memoized code in other threads
+    may still be recorded with a miss, since the warnings state is process-wide.
+
+    Parameters
+    ----------
+    func : function
+        pure function to memoize
+    maxsize : int, optional
+        maximum number of cached results, by default 1024
+
+    Returns
+    -------
+    function
+        memoized function, with additional .cache_info() and .cache_clear() methods
+    """
+    if func is None:
+        return functools.partial(memoize, maxsize=maxsize)
+
+    cache = OrderedDict()
+    counts = {"hits": 0, "misses": 0}
+    registry = func.__globals__.setdefault("__warningregistry__", {})
+
+    def replay(caught):
+        for warning in caught:
+            warnings.warn_explicit(
+                warning.message,
+                warning.category,
+                warning.filename,
+                warning.lineno,
+                registry=registry,
+            )
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            key = (_freeze(args), tuple((k, _freeze(v)) for k, v in kwargs.items()))
+        except TypeError:
+            return func(*args, **kwargs)
+
+        with _memo_lock:
+            if key in cache:
+                counts["hits"] += 1
+                cache.move_to_end(key)
+                result, caught = cache[key]
+            else:
+                counts["misses"] += 1
+                caught = []
+                try:
+                    with warnings.catch_warnings(record=True) as caught:
+                        warnings.simplefilter("always")
+                        result = func(*args, **kwargs)
+                except BaseException:
+                    replay(caught)
+                    raise
+
+                cache[key] = (result, tuple(caught))
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+
+        replay(caught)
+        return _fresh(result)
+
+    def cache_info():
+        """Report memo cache statistics: hits, misses, n_items, maxsize"""
+        with _memo_lock:
+            return MemoInfo(counts["hits"], counts["misses"], len(cache), maxsize)
+
+    def cache_clear():
+        """Remove all cached results, and reset hit and miss counters"""
+        with _memo_lock:
+            cache.clear()
+            counts["hits"] = counts["misses"] = 0
+
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
+    return wrapper
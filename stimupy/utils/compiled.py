@@ -0,0 +1,217 @@
+import inspect
+
+import numpy as np
+
+from stimupy.utils import dtypes
+from stimupy.utils.utils import get_function_argument_names
+
+__all__ = [
+    "CompiledStimulus",
+    "compile_stimulus",
+]
+
+# Probe intensities are encoded as (exactly representable) floats from this offset,
+# far away from any intensity a stimulus function would draw by itself
+_CODE_OFFSET = 2**20
+
+
+def _probe_codes(value, start):
+    """Replace (nested Sequence of) intensity value(s) by consecutive probe codes
+
+    Parameters
+    ----------
+    value : Number or (nested) Sequence[Number, ...]
+        intensity value(s) of a single parameter
+    start : int
+        first probe code
+
+    Returns
+    -------
+    probe : float or (nested) tuple of floats
+        same structure as value, with probe codes
+    n : int
+        number of intensity values, i.e., probe codes used
+    """
+    arr = np.asarray(value, dtype=float)
+    codes = (np.arange(arr.size) + start + _CODE_OFFSET).astype(float).reshape(arr.shape)
+    if codes.ndim == 0:
+        return float(codes), 1
+
+    def _to_tuple(a):
+        return tuple(_to_tuple(x) for x in a) if a.ndim > 1 else tuple(a.tolist())
+
+    return _to_tuple(codes), codes.size
+
+
+class CompiledStimulus:
+    """Stimulus with fixed geometry, that can quickly be re-rendered with new intensities
+
+    The geometry (all masks and which region takes which intensity value)
+    is computed once, by rendering the stimulus function with unique probe intensities.
+    Each call to render() then only assigns intensities to regions,
+    through a single lookup-table gather,
+    and gives the same image as calling the stimulus function with those intensities.
+
+    Only suited for stimuli where each pixel takes exactly one of the intensity values
+    (e.g., gratings, checkerboards, simultaneous brightness contrast),
+    not for stimuli where intensities are blended (e.g., Gabors, Cornsweet edges).
+
+    Parameters
+    ----------
+    func : function
+        stimulus function, returning a stimulus-dict
+    intensity_params : Sequence[str] or None (default)
+        names of intensity arguments that can be changed when rendering.
+        If None, all arguments of func starting with "intensity"
+        that are not None (given in kwargs, or by default)
+    **kwargs
+        arguments to func, fixing the geometry of the stimulus.
+        The number of values given for each intensity argument
+        (e.g., a single intensity_target, or one per target)
+        is fixed as well.
+
+    Raises
+    ------
+    ValueError
+        if func does not draw each pixel in one of the intensity values,
+        or if any of the (explicitly named) intensity_params is None
+
+    Examples
+    --------
+    >>> from stimupy.stimuli import sbcs
+    >>> sbc = CompiledStimulus(
+    ...     sbcs.basic, visual_size=10, ppd=10, target_size=2, intensity_background=0.0
+    ... )
+    >>> stims = [sbc.render(intensity_target=i) for i in (0.25, 0.5, 0.75)]
+    """
+
+    def __init__(self, func, intensity_params=None, **kwargs):
+        arg_names = get_function_argument_names(func)
+        infer_params = intensity_params is None
+        if infer_params:
+            intensity_params = [name for name in arg_names if name.startswith("intensity")]
+        elif isinstance(intensity_params, str):
+            intensity_params = [intensity_params]
+
+        parameters = inspect.signature(func).parameters
+        self.func = func
+        self.kwargs = kwargs
+        self.intensities = {}
+        for name in intensity_params:
+            if name not in arg_names:
+                raise ValueError(f"{func.__name__}() has no argument {name}")
+            value = kwargs.get(name, parameters[name].default)
+            if value is None:
+                # Intensity not drawn (e.g., optional target), so nothing to compile
+                if infer_params:
+                    continue
+                raise ValueError(
+                    f"Cannot compile intensity_param {name}, which is None; "
+                    f"pass a value for {name} to compile it"
+                )
+            self.intensities[name] = value
+
+        # Render once with the given intensities (for reference and all other keys),
+        # and once with a unique probe code for each intensity value
+        self._stim = func(**kwargs)
+        probes = {}
+        self._slices = {}
+        n_codes = 0
+        for name, value in self.intensities.items():
+            probes[name], n = _probe_codes(value, n_codes)
+            self._slices[name] = (n_codes, n_codes + n)
+            n_codes += n
+        probe_img = func(**{**kwargs, **probes})["img"]
+
+        # Label each pixel with the index of its intensity value
+        labels = np.rint(probe_img - _CODE_OFFSET)
+        if not (np.all(labels >= 0) and np.all(labels < n_codes)):
+            raise ValueError(f"{func.__name__}() does not draw intensities in separate regions")
+        self.labels = labels.astype(np.min_scalar_type(max(n_codes - 1, 0)))
+        self.labels.flags.writeable = False
+
+        # Check that geometry reproduces the stimulus
+        if not np.array_equal(self.render()["img"], self._stim["img"]):
+            raise ValueError(f"{func.__name__}() does not draw intensities in separate regions")
+
+    def lut(self, **intensities):
+        """Lookup-table from label to intensity value
+
+        Parameters
+        ----------
+        **intensities
+            intensity value(s) for (some of) the intensity arguments;
+            others remain as compiled. Should have as many values as compiled.
+
+        Returns
+        -------
+        numpy.ndarray
+            intensity value for each label
+        """
+        values = []
+        for name, value in {**self.intensities, **intensities}.items():
+            if name not in self._slices:
+                raise ValueError(f"{name} is not one of the compiled {list(self._slices)}")
+            start, stop = self._slices[name]
+            value = np.asarray(value, dtype=float).ravel()
+            if value.size != stop - start:
+                raise ValueError(
+                    f"{name} should have {stop - start} value(s), as compiled, not {value.size}"
+                )
+            values.append(value)
+        return np.concatenate(values).astype(dtypes.get_dtypes().float)
+
+    def render(self, out=None, **intensities):
+        """Render stimulus with new intensities
+
+        Parameters
+        ----------
+        out : numpy.ndarray or None (default)
+            preallocated buffer to render the image into
+        **intensities
+            intensity value(s) for (some of) the intensity arguments;
+            others remain as compiled. Should have as many values as compiled.
+
+        Returns
+        -------
+        dict[str, Any]
+            dict with the stimulus (key: "img"),
+            and all other keys (masks, parameters) as returned by the stimulus function.
+            Masks are shared between all renders.
+        """
+        lut = self.lut(**intensities)
+        if out is not None and out.shape != self.labels.shape:
+            raise ValueError(
+                f"Buffer for img has shape {out.shape}, but stimulus has shape {self.labels.shape}"
+            )
+        img = np.take(lut, self.labels, out=out, mode="clip")
+
+        stim = {**self._stim, **self.intensities, **intensities}
+        stim["img"] = img
+        return stim
+
+
+def compile_stimulus(func, intensity_params=None, **kwargs):
+    """Compile stimulus geometry once, to quickly re-render with new intensities
+
+    Parameters
+    ----------
+    func : function
+        stimulus function, returning a stimulus-dict,
+        e.g., stimupy.stimuli.whites.white
+    intensity_params : Sequence[str] or None (default)
+        names of intensity arguments that can be changed when rendering.
+        If None, all arguments of func starting with "intensity"
+    **kwargs
+        arguments to func, fixing the geometry of the stimulus
+
+    Returns
+    -------
+    CompiledStimulus
+        with a .render(**intensities) method
+
+    See also
+    --------
+    CompiledStimulus
+    """
+    return CompiledStimulus(func, intensity_params=intensity_params, **kwargs)
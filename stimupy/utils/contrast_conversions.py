@@ -119,7 +119,7 @@ def adapt_normalized_rms_contrast(img, rms_contrast, mean_luminance=None):
     return img
 
 
-def adapt_intensity_range(img, intensity_min=0.0, intensity_max=1.0):
+def adapt_intensity_range(img, intensity_min=0.0, intensity_max=1.0, out=None):
     """
     Adapt intensity range of image
 
@@ -131,6 +131,9 @@ def adapt_intensity_range(img, intensity_min=0.0, intensity_max=1.0):
         new minimal intensity value
     intensity_max : float
         new maximal intensity value
+    out : np.ndarray or None (default)
+        array to write the floating point result into (can be img itself);
+        by default, a new array is returned
 
     Returns
     ----------
@@ -138,8 +141,25 @@ def adapt_intensity_range(img, intensity_min=0.0, intensity_max=1.0):
         image with adapted intensity range
     """
 
-    img = (img - img.min()) / (img.max() - img.min())
-    img = img * (intensity_max - intensity_min) + intensity_min
+    img_min = img.min()
+    img_range = img.max() - img_min
+    intensity_range = intensity_max - intensity_min
+
+    if img.dtype.kind != "f" or np.result_type(
+        img, img_range, intensity_range, intensity_min
+    ) != np.result_type(img):
+        img = (img - img_min) / img_range
+        img = img * intensity_range + intensity_min
+        if out is not None:
+            np.copyto(out, img, casting="same_kind")
+            return out
+        return img
+
+    # Floating point image stays in its dtype: rescale in a single buffer
+    img = np.subtract(img, img_min, out=out)
+    img /= img_range
+    img *= intensity_range
+    img += intensity_min
     return img
 
 
@@ -0,0 +1,151 @@
+import contextlib
+from collections import namedtuple
+
+import numpy as np
+
+__all__ = [
+    "get_dtypes",
+    "set_dtypes",
+    "use_dtypes",
+    "as_float",
+    "as_mask",
+]
+
+Dtypes = namedtuple("Dtypes", "float mask")
+
+MASK_DTYPES = ("int", "compact")
+
+# Package-wide settings
+_dtypes = {"float": np.dtype(np.float64), "mask": "int"}
+
+
+def get_dtypes():
+    """Get the package-wide dtypes for stimulus images and masks
+
+    Returns
+    -------
+    Dtypes NamedTuple, with two attributes:
+        .float: numpy.dtype of images
+        .mask: "int" or "compact", policy for dtype of masks.
+        See set_dtypes
+    """
+    return Dtypes(float=_dtypes["float"], mask=_dtypes["mask"])
+
+
+def set_dtypes(float_dtype=None, mask_dtype=None):
+    """Set the package-wide dtypes for stimulus images and masks
+
+    Parameters
+    ----------
+    float_dtype : numpy.dtype, str, or None (default)
+        floating point dtype of images,
+        e.g., numpy.float64 (package default) or numpy.float32.
+        Images are drawn directly in this dtype
+        (e.g., by draw_regions, intensity lookup-tables, wave and Gaussian profiles).
+        Coordinate grids (see stimupy.components.image_base) remain float64,
+        so that geometry (and thus masks) does not depend on this setting.
+        If None, leave current setting unchanged.
+    mask_dtype : "int", "compact" or None (default)
+        if "int": masks are default (platform) integers (package default);
+        if "compact": masks use the smallest integer type that fits their indices;
+        if None, leave current setting unchanged.
+        The policy applies to masks returned by stimulus functions,
+        by the dict-utilities (e.g., stack_dicts, pad_dict_*, resize_dict, rotate_dict),
+        and to masks written by the exporters (to_mat, to_pickle).
+
+    Returns
+    -------
+    Dtypes NamedTuple
+        previous settings, e.g., to restore them later
+
+    Raises
+    ------
+    ValueError
+        if float_dtype is not a floating point dtype,
+        or mask_dtype is not one of "int", "compact"
+    """
+    previous = get_dtypes()
+
+    if float_dtype is not None:
+        float_dtype = np.dtype(float_dtype)
+        if float_dtype.kind != "f":
+            raise ValueError(f"float_dtype should be a floating point dtype, not {float_dtype}")
+        _dtypes["float"] = float_dtype
+
+    if mask_dtype is not None:
+        if mask_dtype not in MASK_DTYPES:
+            raise ValueError(f"mask_dtype should be one of {MASK_DTYPES}, not {mask_dtype}")
+        _dtypes["mask"] = mask_dtype
+
+    return previous
+
+
+@contextlib.contextmanager
+def use_dtypes(float_dtype=None, mask_dtype=None):
+    """Context manager to temporarily set dtypes for stimulus images and masks
+
+    Parameters
+    ----------
+    float_dtype : numpy.dtype, str, or None (default)
+        floating point dtype of images. See set_dtypes
+    mask_dtype : "int", "compact" or None (default)
+        policy for dtype of masks. See set_dtypes
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from stimupy.stimuli import whites
+    >>> with use_dtypes(float_dtype=np.float32, mask_dtype="compact"):
+    ...     stim = whites.white(
+    ...         visual_size=10, ppd=10, n_bars=8, target_indices=(2, 5), target_heights=2
+    ...     )
+    >>> stim["img"].dtype, stim["target_mask"].dtype
+    (dtype('float32'), dtype('uint8'))
+    """
+    previous = set_dtypes(float_dtype=float_dtype, mask_dtype=mask_dtype)
+    try:
+        yield get_dtypes()
+    finally:
+        set_dtypes(float_dtype=previous.float, mask_dtype=previous.mask)
+
+
+def as_float(arr):
+    """Cast array to the package-wide float dtype (without copying, if possible)
+
+    Parameters
+    ----------
+    arr : numpy.ndarray
+        image-array
+
+    Returns
+    -------
+    numpy.ndarray
+        image-array of package-wide float dtype
+    """
+    return np.asarray(arr).astype(_dtypes["float"], copy=False)
+
+
+def as_mask(arr):
+    """Cast mask to the package-wide mask dtype policy
+
+    Parameters
+    ----------
+    arr : numpy.ndarray
+        mask with integer indices
+
+    Returns
+    -------
+    numpy.ndarray
+        mask with default integer dtype (policy "int"),
+        or smallest integer dtype that fits all indices (policy "compact")
+    """
+    arr = np.asarray(arr)
+    if _dtypes["mask"] == "int":
+        return arr.astype(int, copy=False)
+
+    if arr.size == 0:
+        return arr.astype(np.uint8, copy=False)
+    dtype = np.min_scalar_type(int(arr.max()))
+    if arr.min() < 0:
+        dtype = np.result_type(dtype, np.min_scalar_type(int(arr.min())))
+    return arr.astype(dtype, copy=False)
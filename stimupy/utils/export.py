@@ -8,6 +8,8 @@ import numpy as np
 from PIL import Image
 from scipy.io import savemat
 
+from stimupy.utils import dtypes
+
 __all__ = [
     "array_to_checksum",
     "array_to_image",
@@ -211,7 +213,13 @@ def to_mat(stim, filename):
 
     filepath = Path(filename).resolve().with_suffix(".mat")
 
-    savemat(filepath, stim)
+    stim2 = dict(stim)
+    for key in stim2.keys():
+        # store masks according to package-wide mask dtype policy
+        if key.endswith("mask") and isinstance(stim2[key], np.ndarray):
+            stim2[key] = dtypes.as_mask(stim2[key])
+
+    savemat(filepath, stim2)
 
 
 def to_pickle(stim, filename):
@@ -235,6 +243,9 @@ def to_pickle(stim, filename):
         # certain classes can cause problems for pickles; change to list
         if key in ["visual_size", "ppd", "shape"]:
             stim2[key] = list(stim2[key])
+        # store masks according to package-wide mask dtype policy
+        elif key.endswith("mask") and isinstance(stim2[key], np.ndarray):
+            stim2[key] = dtypes.as_mask(stim2[key])
 
     with filepath.open("wb") as file:
         pickle.dump(stim2, file, protocol=pickle.HIGHEST_PROTOCOL)
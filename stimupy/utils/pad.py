@@ -2,7 +2,7 @@ import copy
 
 import numpy as np
 
-from .utils import resolution
+from .utils import _as_mask, resolution
 
 __all__ = [
     "add_padding",
@@ -258,13 +258,13 @@ def pad_dict_by_visual_size(dct, padding, ppd, pad_value=0.0, keys=("img", "*mas
             img = dct[key]
             if isinstance(img, np.ndarray):
                 # Add mask which indicates padded region
-                new_dict["pad_mask"] = pad_by_visual_size(
-                    np.zeros(img.shape), padding, ppd, 1
-                ).astype(int)
+                new_dict["pad_mask"] = _as_mask(
+                    pad_by_visual_size(np.zeros(img.shape), padding, ppd, 1)
+                )
 
                 if key.endswith("mask"):
                     img = pad_by_visual_size(img, padding, ppd, 0)
-                    img = img.astype(int)
+                    img = _as_mask(img)
                 else:
                     img = pad_by_visual_size(img, padding, ppd, pad_value)
                 new_dict[key] = img
@@ -356,13 +356,13 @@ def pad_dict_by_shape(dct, padding, pad_value=0, keys=("img", "*mask")):
             img = dct[key]
             if isinstance(img, np.ndarray):
                 # Add mask which indicates padded region
-                new_dict["pad_mask"] = np.pad(
-                    np.zeros(img.shape), padding, mode="constant", constant_values=1
-                ).astype(int)
+                new_dict["pad_mask"] = _as_mask(
+                    np.pad(np.zeros(img.shape), padding, mode="constant", constant_values=1)
+                )
 
                 if key.endswith("mask"):
                     img = np.pad(img, padding, mode="constant", constant_values=0)
-                    img = img.astype(int)
+                    img = _as_mask(img)
                 else:
                     img = np.pad(img, padding, mode="constant", constant_values=pad_value)
                 new_dict[key] = img
@@ -426,13 +426,13 @@ def pad_dict_to_shape(dct, shape, pad_value=0, keys=("img", "*mask")):
                 padding = np.stack([padding_before, padding_after]).T
 
                 # Add mask which indicates padded region
-                new_dict["pad_mask"] = pad_by_shape(
-                    np.zeros(img.shape), padding=padding, pad_value=1
-                ).astype(int)
+                new_dict["pad_mask"] = _as_mask(
+                    pad_by_shape(np.zeros(img.shape), padding=padding, pad_value=1)
+                )
 
                 if key.endswith("mask"):
                     img = pad_by_shape(img, padding=padding, pad_value=0)
-                    img = img.astype(int)
+                    img = _as_mask(img)
                 else:
                     img = pad_by_shape(img, padding=padding, pad_value=pad_value)
                 new_dict[key] = img
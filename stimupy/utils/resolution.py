@@ -4,6 +4,8 @@ from collections import namedtuple
 
 import numpy as np
 
+from stimupy.utils.cache import memoize
+
 __all__ = [
     "resolve",
     "resolve_1D",
@@ -38,6 +40,7 @@ class TooManyUnknownsError(ValueError):
     pass
 
 
+@memoize
 def resolve(shape=None, visual_size=None, ppd=None):
     """Resolves the full resolution, for 2 givens and 1 unknown
 
@@ -48,6 +51,7 @@ def resolve(shape=None, visual_size=None, ppd=None):
     if two are given, the third can be calculated using this function.
 
     This function resolves the resolution in both dimensions.
+    Results are memoized (see stimupy.utils.cache.memoize).
 
 
     Parameters
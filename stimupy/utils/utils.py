@@ -1,12 +1,14 @@
 import collections
 import copy
 import functools
+import inspect
 import itertools
+import threading
 
 import numpy as np
 import scipy.special as sp
 
-from stimupy.utils import resolution
+from stimupy.utils import dtypes, resolution
 
 __all__ = [
     "round_to_vals",
@@ -21,6 +23,7 @@ __all__ = [
     "roll_dict",
     "strip_dict",
     "make_two_sided",
+    "stimulus_output",
     "permutate_params",
     "create_stimspace_stimuli",
 ]
@@ -124,36 +127,102 @@ def round_to_vals(arr, vals, mode="nearest"):
     arr_1d = np.sort(np.unique(vals))
     arr = np.array(arr)
 
+    idxs = _round_to_vals_idcs(arr, arr_1d, mode=mode)
+
+    # Replace each element in arr with the nearest value from vals
+    rounded_arr = arr_1d[idxs]
+
+    return rounded_arr
+
+
+def _nearest_idcs_evenly_spaced(arr, vals):
+    """Indices of nearest value in (approximately) evenly spaced, sorted vals
+
+    Estimates indices arithmetically, by scaled rounding.
+    Elements that lie (almost) halfway between two values,
+    where the estimate may differ from the exact comparison, are flagged as ambiguous.
+
+    Parameters
+    ----------
+    arr : numpy.ndarray
+        array to be rounded
+    vals : numpy.ndarray
+        sorted, unique values to which array will be rounded
+
+    Returns
+    -------
+    idxs : numpy.ndarray or None
+        index into vals for each element in arr;
+        None if vals are not sufficiently evenly spaced
+    ambiguous : numpy.ndarray or None
+        whether index of each element still has to be determined exactly
+    """
+    n = len(vals)
+    step = (vals[-1] - vals[0]) / (n - 1)
+    if not step > 0:
+        return None, None
+
+    # Maximum deviation of vals from an evenly spaced grid, in units of step
+    deviation = np.max(np.abs(vals - (vals[0] + np.arange(n) * step))) / step
+    if deviation >= 0.25:
+        return None, None
+    margin = 0.5 - deviation - 1e-6
+
+    pos = (arr - vals[0]) * (1 / step)
+    idxs = np.rint(pos)
+    pos -= idxs
+    np.abs(pos, out=pos)
+    ambiguous = ~(pos < margin)  # also NaNs
+
+    np.fmax(idxs, 0, out=idxs)  # also maps NaN to 0
+    np.minimum(idxs, n - 1, out=idxs)
+    return idxs.astype(np.intp), ambiguous
+
+
+def _nearest_idcs(arr, vals):
+    """Indices of nearest value in sorted, unique vals, by binary search"""
+    # Find indexes where previous index is closer
+    idxs = np.searchsorted(vals, arr, side="left")
+    prev_idx_is_less = (idxs == len(vals)) | (
+        np.fabs(arr - vals[np.maximum(idxs - 1, 0)])
+        < np.fabs(arr - vals[np.minimum(idxs, len(vals) - 1)])
+    )
+    idxs[prev_idx_is_less] -= 1
+    return idxs
+
+
+def _round_to_vals_idcs(arr, vals, mode="nearest"):
+    """Indices into sorted, unique vals to round each element of arr to
+
+    See round_to_vals
+    """
     # Ensure arr fall within bounds of mode:
-    if mode == "floor" and arr.min() < arr_1d.min():
+    if mode == "floor" and arr.min() < vals.min():
         raise ValueError(
-            f"Array values must be within bounds of vals : {arr.min()} < {arr_1d.min()}"
-        )
-    if mode == "ceil" and arr.min() > arr_1d.max():
-        raise ValueError(
-            f"Array values must be within bounds of vals: {arr.min()} > {arr_1d.max()}"
+            f"Array values must be within bounds of vals : {arr.min()} < {vals.min()}"
         )
+    if mode == "ceil" and arr.min() > vals.max():
+        raise ValueError(f"Array values must be within bounds of vals: {arr.min()} > {vals.max()}")
 
     # Find the nearest values from vals, for each element in arr
     if mode == "floor":
-        idxs = np.searchsorted(arr_1d, arr, side="left") - 1
+        idxs = np.searchsorted(vals, arr, side="left") - 1
     elif mode == "ceil":
-        idxs = np.searchsorted(arr_1d, arr, side="right")
+        idxs = np.searchsorted(vals, arr, side="right")
     elif mode == "nearest":
-        # Find indexes where previous index is closer
-        idxs = np.searchsorted(arr_1d, arr, side="left")
-        prev_idx_is_less = (idxs == len(arr_1d)) | (
-            np.fabs(arr - arr_1d[np.maximum(idxs - 1, 0)])
-            < np.fabs(arr - arr_1d[np.minimum(idxs, len(arr_1d) - 1)])
-        )
-        idxs[prev_idx_is_less] -= 1
+        # Fast path: estimate indices directly for evenly spaced vals,
+        # only compare exactly where element is (almost) halfway between values
+        if len(vals) > 2 and arr.ndim > 0 and arr.size > len(vals):
+            idxs, ambiguous = _nearest_idcs_evenly_spaced(arr, vals)
+            if idxs is not None:
+                if ambiguous.any():
+                    idxs[ambiguous] = _nearest_idcs(arr[ambiguous], vals)
+                return idxs
+        idxs = _nearest_idcs(arr, vals)
     else:
         raise ValueError(f"Invalid mode: {mode}")
 
-    # Replace each element in arr with the nearest value from vals
-    rounded_arr = arr_1d[idxs]
-
-    return rounded_arr
+    return idxs
 
 
 def int_factorize(n):
@@ -199,20 +268,30 @@ def get_function_argument_names(func):
     names : tuple
         Tuple containing all argument names of given function
     """
+    func = inspect.unwrap(func)
     names = func.__code__.co_varnames[: func.__code__.co_argcount]
     return names
 
 
-def apply_bessel(arr, order=0):
+def apply_bessel(arr, order=0, tolerance=None):
     """
     Bessel function of the first kind of real order and complex argument.
 
+    Since the Bessel function is expensive to evaluate, it is only evaluated
+    once for each unique value in arr (e.g., each unique radius),
+    or, if a tolerance is given, on a 1D table of values that is linearly interpolated.
+
     Parameters
     ----------
     arr : np.ndarray
         Input array
     order : float
         Order of the bessel function. Default is 0.
+    tolerance : float or None (default)
+        if None, evaluate exactly;
+        otherwise, maximal absolute error of the linearly interpolated Bessel function.
+        Only used for real arr and integer order (where the second derivative
+        of the Bessel function is bounded by 1).
 
     Returns
     -------
@@ -220,8 +299,21 @@ def apply_bessel(arr, order=0):
         Output array
 
     """
-    out = sp.jv(order, arr)
-    return out
+    arr = np.asarray(arr)
+    if arr.ndim == 0 or np.iscomplexobj(arr):
+        return sp.jv(order, arr)
+
+    if tolerance is not None and float(order).is_integer() and np.all(np.isfinite(arr)):
+        # Linear interpolation error is at most step**2 / 8 * max(abs(jv''))
+        step = np.sqrt(8 * tolerance)
+        n_samples = int(np.ceil((arr.max() - arr.min()) / step)) + 2
+        if n_samples < arr.size:
+            table = np.linspace(arr.min(), arr.max(), n_samples)
+            return np.interp(arr, table, sp.jv(order, table))
+
+    vals, idcs = np.unique(arr, return_inverse=True)
+    out = sp.jv(order, vals)
+    return out[idcs].reshape(arr.shape)
 
 
 def resize_array(arr, factor):
@@ -284,7 +376,7 @@ def resize_dict(dct, factor, keys=("img", "*mask")):
             if isinstance(img, np.ndarray):
                 img = np.repeat(np.repeat(img, factor[0], axis=0), factor[1], axis=1)
                 if key.endswith("mask"):
-                    img = img.astype(int)
+                    img = _as_mask(img)
                 new_dict[key] = img
 
     # Update visual_size and shape-keys
@@ -348,7 +440,7 @@ def stack_dicts(
             img2 = dct2[key]
             if isinstance(img1, np.ndarray) and isinstance(img2, np.ndarray):
                 if key.endswith("mask") and not keep_mask_indices:
-                    img2 = np.where(img2 != 0, img2 + img1.max(), 0)
+                    img2 = np.where(img2 != 0, img2.astype(int) + int(img1.max()), 0)
 
                 if direction == "horizontal":
                     img = np.hstack([img1, img2])
@@ -358,7 +450,7 @@ def stack_dicts(
                     raise ValueError("direction must be horizontal or vertical")
 
                 if key.endswith("mask"):
-                    img = img.astype(int)
+                    img = _as_mask(img)
                 new_dict[key] = img
 
     # Update visual_size and shape-keys
@@ -409,7 +501,7 @@ def rotate_dict(dct, nrots=1, keys=("img", "*mask")):
                     raise ValueError("nrots must be a number")
 
                 if key.endswith("mask"):
-                    img = img.astype(int)
+                    img = _as_mask(img, copy=True)
                 new_dict[key] = img
 
     # Update visual_size and shape-keys
@@ -461,7 +553,7 @@ def flip_dict(dct, direction="lr", keys=("img", "*mask")):
                     raise ValueError("direction must be lr or ud")
 
                 if key.endswith("mask"):
-                    img = img.astype(int)
+                    img = _as_mask(img, copy=True)
                 new_dict[key] = img
     return new_dict
 
@@ -506,7 +598,7 @@ def roll_dict(dct, shift, axes, keys=("img", "*mask")):
                 img = np.roll(img, shift=shift, axis=axes)
 
                 if key.endswith("mask"):
-                    img = img.astype(int)
+                    img = _as_mask(img)
                 new_dict[key] = img
     return new_dict
 
@@ -544,6 +636,236 @@ def strip_dict(
     return new_dict
 
 
+# Tracks how deep we are in nested calls of stimulus functions,
+# and the output buffer (out) passed to each of these calls
+_stimulus_calls = threading.local()
+
+
+def _as_mask(arr, copy=False):
+    """Cast mask to the package-wide mask dtype policy, outside of stimulus functions
+
+    Within (nested) stimulus functions, masks remain default integers,
+    so that further arithmetic on mask indices cannot overflow;
+    the outermost stimulus function applies the policy to its output.
+
+    Parameters
+    ----------
+    arr : numpy.ndarray
+        mask with integer indices
+    copy : bool, optional
+        if True, always return a new array, by default False
+
+    Returns
+    -------
+    numpy.ndarray
+        mask with dtype according to the package-wide mask dtype policy
+    """
+    if copy:
+        arr = np.array(arr)
+    if getattr(_stimulus_calls, "depth", 0) > 0:
+        return np.asarray(arr).astype(int, copy=False)
+    return dtypes.as_mask(arr)
+
+
+def _output_buffer(shape=None):
+    """Preallocated "img" buffer passed (as out) to the stimulus function being executed
+
+    Drawing steps that produce the final image of a stimulus function
+    can draw it directly into this buffer, instead of into a newly allocated image
+    that stimulus_output would then have to copy into the buffer.
+
+    Parameters
+    ----------
+    shape : Sequence[int, int] or None (default)
+        shape of the image to draw; if None, the shape is not checked
+
+    Returns
+    -------
+    numpy.ndarray or None
+        buffer; None if no buffer was passed, or if it cannot hold the image
+        (in which case stimulus_output raises a descriptive error, when copying into it)
+    """
+    buffers = getattr(_stimulus_calls, "buffers", None)
+    buffer = buffers[-1] if buffers else None
+    if (
+        not isinstance(buffer, np.ndarray)
+        or not buffer.flags.writeable
+        or (shape is not None and buffer.shape != tuple(shape))
+        or not np.can_cast(dtypes.get_dtypes().float, buffer.dtype, casting="same_kind")
+    ):
+        return None
+    return buffer
+
+
+def _write_to_buffer(buffer, arr, key, mask=False):
+    """Write array into a preallocated buffer
+
+    Parameters
+    ----------
+    buffer : numpy.ndarray
+        preallocated buffer, of the same shape as arr
+    arr : numpy.ndarray
+        array to write into buffer
+    key : str
+        key of arr in stimulus-dict, used in error messages
+    mask : bool, optional
+        if True, arr is a mask; integer indices that do not fit
+        into the dtype of buffer raise an error, by default False
+
+    Returns
+    -------
+    numpy.ndarray
+        buffer, now containing the values of arr
+
+    Raises
+    ------
+    ValueError
+        if buffer and arr have different shapes,
+        or if mask indices do not fit into the dtype of buffer
+    TypeError
+        if arr cannot be cast to the dtype of buffer (e.g., float image to integer buffer)
+    """
+    if not isinstance(buffer, np.ndarray):
+        raise ValueError(f"Buffer for {key} should be a numpy.ndarray, not {type(buffer)}")
+    if buffer.shape != arr.shape:
+        raise ValueError(
+            f"Buffer for {key} has shape {buffer.shape}, but stimulus has shape {arr.shape}"
+        )
+
+    if mask:
+        if buffer.dtype.kind in "iu" and arr.size > 0:
+            info = np.iinfo(buffer.dtype)
+            if arr.min() < info.min or arr.max() > info.max:
+                raise ValueError(
+                    f"Indices in {key} do not fit into buffer of dtype {buffer.dtype}"
+                )
+        np.copyto(buffer, arr, casting="unsafe")
+    else:
+        np.copyto(buffer, arr, casting="same_kind")
+    return buffer
+
+
+def _mask_buffers(stim, mask_out):
+    """Match mask buffer(s) to keys in stimulus-dict
+
+    A single buffer is used for the "target_mask" if stim has one,
+    otherwise for the first mask in stim.
+    """
+    if isinstance(mask_out, dict):
+        missing = set(mask_out.keys()) - set(stim.keys())
+        if missing:
+            raise ValueError(f"Stimulus has no mask(s) {sorted(missing)} to write to mask_out")
+        return mask_out
+
+    mask_keys = [
+        key
+        for key, value in stim.items()
+        if key.endswith("mask") and isinstance(value, np.ndarray)
+    ]
+    if not mask_keys:
+        raise ValueError("Stimulus has no mask to write to mask_out")
+    key = "target_mask" if "target_mask" in mask_keys else mask_keys[0]
+    return {key: mask_out}
+
+
+def stimulus_output(func):
+    """Apply package-wide dtype settings to the stimulus-dict returned by func,
+    and optionally write its output into preallocated buffers
+
+    Drawing functions allocate images in the package-wide float dtype themselves;
+    as a fallback, any "img" in another dtype is cast to it,
+    for every (also nested) call of a stimulus function,
+    so that all subsequent drawing operates on that dtype.
+    Masks (keys ending in "mask") are only cast to the package-wide mask dtype policy
+    when returned from the outermost stimulus function,
+    so that intermediate arithmetic on mask indices cannot overflow.
+
+    The decorated function accepts two additional keyword-only arguments:
+
+    out : numpy.ndarray or None (default)
+        preallocated buffer of the same shape as the stimulus.
+        If provided, the "img" is returned in this buffer, in the dtype of the buffer.
+    mask_out : numpy.ndarray, dict[str, numpy.ndarray] or None (default)
+        preallocated buffer(s) for mask(s), of the same shape as the stimulus.
+        A single buffer is used for the "target_mask" if the stimulus has one,
+        otherwise for its first mask;
+        a dict specifies a buffer per mask-key (e.g., {"grating_mask": buffer}).
+
+    Stimulus functions whose final drawing step supports it
+    (e.g., draw_regions, place_targets, and the wave components)
+    draw the "img" directly into out (see _output_buffer);
+    all others draw into a new image, which is then copied into out.
+    Masks are always copied into mask_out.
+    Buffers can be reused across calls, e.g., to render many trials
+    into the same (shared-memory) array.
+
+    Parameters
+    ----------
+    func : function
+        stimulus function, returning a stimulus-dict
+
+    Returns
+    -------
+    function
+        stimulus function, that applies dtype settings to its output
+
+    See also
+    --------
+    stimupy.utils.dtypes.set_dtypes
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, out=None, mask_out=None, **kwargs):
+        depth = getattr(_stimulus_calls, "depth", 0)
+        buffers = _stimulus_calls.__dict__.setdefault("buffers", [])
+        _stimulus_calls.depth = depth + 1
+        buffers.append(out)
+        try:
+            stim = func(*args, **kwargs)
+        finally:
+            _stimulus_calls.depth = depth
+            buffers.pop()
+
+        if not isinstance(stim, dict):
+            return stim
+
+        settings = dtypes.get_dtypes()
+        cast_float = settings.float != np.float64
+        cast_mask = settings.mask != "int" and depth == 0
+        if cast_float or cast_mask:
+            for key, value in stim.items():
+                if not isinstance(value, np.ndarray):
+                    continue
+                if key == "img" and cast_float and value is not out:
+                    stim[key] = dtypes.as_float(value)
+                elif key.endswith("mask") and cast_mask:
+                    stim[key] = dtypes.as_mask(value)
+
+        if out is not None and stim["img"] is not out:
+            # Fallback: image was not drawn into out directly
+            stim["img"] = _write_to_buffer(out, np.asarray(stim["img"]), "img")
+        if mask_out is not None:
+            for key, buffer in _mask_buffers(stim, mask_out).items():
+                stim[key] = _write_to_buffer(buffer, np.asarray(stim[key]), key, mask=True)
+        return stim
+
+    # Expose the buffer arguments in the signature of the decorated function
+    signature = inspect.signature(func)
+    parameters = list(signature.parameters.values())
+    buffer_parameters = [
+        inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY, default=None)
+        for name in ("out", "mask_out")
+        if name not in signature.parameters
+    ]
+    if parameters and parameters[-1].kind == inspect.Parameter.VAR_KEYWORD:
+        parameters[-1:-1] = buffer_parameters
+    else:
+        parameters.extend(buffer_parameters)
+    wrapper.__signature__ = signature.replace(parameters=parameters)
+
+    return wrapper
+
+
 def make_two_sided(func, two_sided_params):
     """Create two-sided version of a stimulus function
 
@@ -571,6 +893,7 @@ def make_two_sided(func, two_sided_params):
         two-sided version of stimulus function
     """
 
+    @stimulus_output
     @functools.wraps(func)
     def two_sided_func(**kwargs):
         shape = kwargs.pop("shape", None)
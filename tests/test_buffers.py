@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+
+from stimupy.components import angulars, frames, radials, waves
+from stimupy.stimuli import rings, sbcs, whites
+from stimupy.stimuli import waves as stimuli_waves
+from stimupy.utils import utils
+
+white_params = {
+    "visual_size": 10,
+    "ppd": 10,
+    "n_bars": 8,
+    "target_indices": (2, 5),
+    "target_heights": 2,
+}
+
+
+def test_out():
+    ref = whites.white(**white_params)
+    out = np.zeros((100, 100))
+    stim = whites.white(**white_params, out=out)
+    assert stim["img"] is out
+    assert np.array_equal(out, ref["img"])
+
+    # Reuse buffer
+    stim = whites.white(**white_params, intensity_target=0.2, out=out)
+    assert stim["img"] is out
+    assert np.array_equal(out, whites.white(**white_params, intensity_target=0.2)["img"])
+
+
+def test_out_dtype():
+    ref = waves.sine(visual_size=10, ppd=10, frequency=1, distance_metric="horizontal")
+    out = np.zeros((100, 100), dtype=np.float32)
+    stim = waves.sine(visual_size=10, ppd=10, frequency=1, distance_metric="horizontal", out=out)
+    assert stim["img"] is out
+    assert np.allclose(out, ref["img"])
+
+
+grating_params = {"visual_size": 10, "ppd": 10, "frequency": 1}
+
+
+@pytest.mark.parametrize(
+    "func, params",
+    [
+        (waves.sine, {**grating_params, "distance_metric": "horizontal"}),
+        (waves.sine, {**grating_params, "distance_metric": "radial"}),
+        (waves.sine, {**grating_params, "distance_metric": "oblique", "rotation": 30}),
+        (waves.square, {**grating_params, "distance_metric": "horizontal"}),
+        (waves.staircase, {**grating_params, "distance_metric": "radial"}),
+        (radials.rings, {"visual_size": 10, "ppd": 10, "radii": (1, 2, 3)}),
+        (frames.frames, {"visual_size": 10, "ppd": 10, "radii": (1, 2, 3)}),
+        (angulars.segments, {"visual_size": 10, "ppd": 10, "angles": (0, 90, 180)}),
+        (stimuli_waves.sine_linear, {**grating_params, "target_indices": (1, 3)}),
+        (
+            rings.circular_generalized,
+            {"visual_size": 10, "ppd": 10, "radii": (1, 2, 3), "target_indices": 2},
+        ),
+        (whites.white, white_params),
+    ],
+)
+def test_out_drawn_directly(func, params, monkeypatch):
+    ref = func(**params)
+
+    # Image should be drawn into out, not copied into it
+    def _no_copy(buffer, arr, key, mask=False):
+        raise AssertionError(f"{key} copied into buffer")
+
+    monkeypatch.setattr(utils, "_write_to_buffer", _no_copy)
+    out = np.full(ref["img"].shape, np.nan)
+    stim = func(**params, out=out)
+    assert stim["img"] is out
+    assert np.array_equal(out, ref["img"])
+
+
+def test_mask_out():
+    ref = whites.white(**white_params)
+    target_mask = np.zeros((100, 100), dtype=np.uint8)
+    grating_mask = np.zeros((100, 100), dtype=np.uint8)
+
+    stim = whites.white(**white_params, mask_out=target_mask)
+    assert stim["target_mask"] is target_mask
+    assert np.array_equal(target_mask, ref["target_mask"])
+
+    stim = whites.white(**white_params, mask_out={"grating_mask": grating_mask})
+    assert stim["grating_mask"] is grating_mask
+    assert np.array_equal(grating_mask, ref["grating_mask"])
+
+
+def test_two_sided():
+    out = np.zeros((50, 100))
+    stim = sbcs.basic_two_sided(
+        visual_size=(5, 10), ppd=10, target_size=1, intensity_background=(0, 1), out=out
+    )
+    assert stim["img"] is out
+    assert out[0, 0] == 0 and out[0, -1] == 1
+
+
+def test_invalid_buffers():
+    with pytest.raises(ValueError):
+        whites.white(**white_params, out=np.zeros((10, 10)))
+    with pytest.raises(TypeError):
+        whites.white(**white_params, out=np.zeros((100, 100), dtype=int))
+    with pytest.raises(ValueError):
+        whites.white(**white_params, mask_out={"ring_mask": np.zeros((100, 100))})
+
+    # Mask indices that do not fit into buffer dtype
+    stim = waves.square(visual_size=10, ppd=30, frequency=15, distance_metric="horizontal")
+    assert stim["grating_mask"].max() > 127
+    with pytest.raises(ValueError):
+        waves.square(
+            visual_size=10,
+            ppd=30,
+            frequency=15,
+            distance_metric="horizontal",
+            mask_out=np.zeros((300, 300), dtype=np.int8),
+        )
@@ -0,0 +1,148 @@
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from stimupy.components import grid_cache, image_base, waves
+from stimupy.utils import LRUCache, memoize
+
+
+def test_lru_eviction():
+    cache = LRUCache(max_bytes=3 * 80)
+    for key in "abc":
+        cache.put(key, np.zeros(10))
+    cache.get("a")
+    cache.put("d", np.zeros(10))
+
+    assert "b" not in cache
+    assert all(key in cache for key in "acd")
+    assert cache.info().nbytes == 3 * 80
+
+
+def test_readonly():
+    cache = LRUCache()
+    arr = cache.put("a", np.zeros(10))
+    with pytest.raises(ValueError):
+        arr[0] = 1
+
+
+def test_counters():
+    cache = LRUCache()
+    cache.get_or_compute("a", lambda: np.zeros(10))
+    cache.get_or_compute("a", lambda: np.zeros(10))
+    info = cache.info()
+    assert (info.hits, info.misses) == (1, 1)
+
+    cache.clear()
+    assert cache.info() == (0, 0, 0, 0, cache.max_bytes)
+
+
+def test_cached_none():
+    cache = LRUCache()
+    calls = []
+    for _ in range(2):
+        assert cache.get_or_compute("a", lambda: calls.append(1)) is None
+    assert len(calls) == 1
+
+
+def test_threads():
+    # Concurrent lookups, stores and evictions keep the cache consistent
+    cache = LRUCache(max_bytes=10 * 800)
+
+    def call(i):
+        key = i % 25
+        value = cache.get_or_compute(key, lambda: np.full(100, key, dtype=float))
+        return value[0] == key
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert all(executor.map(call, range(5000)))
+    info = cache.info()
+    assert info.hits + info.misses == 5000
+    assert info.n_items <= 10 and info.nbytes == 800 * info.n_items
+
+
+def test_oversized_not_stored():
+    cache = LRUCache(max_bytes=10)
+    cache.put("a", np.zeros(10))
+    assert len(cache) == 0
+
+
+def test_grid_cache_shared():
+    grid_cache.clear()
+    radial1 = image_base(visual_size=(3, 4), ppd=10, rotation=0)["radial"]
+    radial2 = image_base(visual_size=(3, 4), ppd=10, rotation=45)["radial"]
+    oblique = image_base(visual_size=(3, 4), ppd=10, rotation=45)["oblique"]
+
+    assert radial1 is radial2
+    assert oblique is not image_base(visual_size=(3, 4), ppd=10)["oblique"]
+    assert grid_cache.info().hits == 1
+
+
+def test_grid_cache_angular():
+    grid_cache.clear()
+    image_base(visual_size=(3, 4), ppd=10, rotation=0)["angular"]
+    image_base(visual_size=(3, 4), ppd=10, rotation=45)["angular"]
+    assert grid_cache.info().hits == 1
+
+    # Distances of angular grating are shared across phases and intensities
+    params = {"visual_size": 4, "ppd": 10, "n_phases": 8, "distance_metric": "angular"}
+    waves.sine(**params, phase_shift=0)
+    hits = grid_cache.info().hits
+    waves.sine(**params, phase_shift=90, intensities=(0.2, 0.8))
+    assert grid_cache.info().hits == hits + 1
+
+
+def test_memoize():
+    calls = []
+
+    @memoize(maxsize=2)
+    def func(a, b=None):
+        calls.append(a)
+        if a < 0:
+            raise ValueError("negative")
+        if a == 0:
+            warnings.warn("zero")
+        return {"a": a, "b": [b]}
+
+    assert func(1, b=2) == func(1, b=2) == {"a": 1, "b": [2]}
+    assert calls == [1]
+
+    # Callers get their own copy of the result
+    func(1, b=2)["b"].append(3)
+    assert func(1, b=2)["b"] == [2]
+
+    # Argument types are part of the key; unhashable arguments are not cached
+    func(1.0, b=2)
+    func(1, b={2})
+    func(1, b={2})
+    assert calls == [1, 1.0, 1, 1]
+
+    # Warnings are replayed on hits; exceptions are not cached
+    for _ in range(2):
+        with pytest.warns(UserWarning, match="zero"):
+            func(0)
+        with pytest.raises(ValueError):
+            func(-1)
+    assert calls.count(0) == 1 and calls.count(-1) == 2
+
+    info = func.cache_info()
+    assert info.n_items == 2 and info.maxsize == 2
+    func.cache_clear()
+    assert func.cache_info() == (0, 0, 0, 2)
+
+
+def test_memoize_threads():
+    @memoize
+    def func(a):
+        warnings.warn("computed")
+        return np.full(1000, a)
+
+    def call(a):
+        return func(a % 4)[0]
+
+    with warnings.catch_warnings(), ThreadPoolExecutor(max_workers=8) as executor:
+        warnings.simplefilter("ignore")
+        results = list(executor.map(call, range(200)))
+    assert results == [a % 4 for a in range(200)]
+    assert func.cache_info()[:3] == (196, 4, 4)
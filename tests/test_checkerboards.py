@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from stimupy.stimuli import checkerboards
+
+
+def test_checker_mask():
+    stim = checkerboards.checkerboard(visual_size=(6, 9), ppd=10, board_shape=(4, 6))
+    n_cols = stim["col_mask"].max()
+    assert np.array_equal(stim["checker_mask"], (stim["row_mask"] - 1) * n_cols + stim["col_mask"])
+
+
+@pytest.mark.filterwarnings("ignore::UserWarning")
+def test_checker_mask_rotated():
+    stim = checkerboards.checkerboard(visual_size=10, ppd=10, check_visual_size=1, rotation=30)
+    checks = np.stack((stim["row_mask"], stim["col_mask"]), axis=-1).reshape(-1, 2)
+    pairs, labels = np.unique(checks, axis=0, return_inverse=True)
+
+    # Each (present) check gets its own label, consecutive in row-major order
+    assert np.array_equal(stim["checker_mask"].ravel(), labels.ravel() + 1)
+    assert stim["checker_mask"].max() == len(pairs)
+
+
+def test_targets():
+    stim = checkerboards.checkerboard(
+        visual_size=(6, 9),
+        ppd=10,
+        board_shape=(4, 6),
+        target_indices=((1, 1), (1, 2)),
+        extend_targets=True,
+    )
+    # Extended targets overlap: their indices are summed
+    ref = sum(
+        (i + 1) * checkerboards.mask_from_idx(stim, (coords,))
+        for i, idx in enumerate(((1, 1), (1, 2)))
+        for coords in checkerboards.extend_target_idx(idx)
+    )
+    assert np.array_equal(stim["target_mask"], ref)
+    assert stim["target_mask"].max() == 3
+
+    with pytest.raises(ValueError):
+        checkerboards.checkerboard(
+            visual_size=(6, 9), ppd=10, board_shape=(4, 6), target_indices=((0, 7),)
+        )
+    with pytest.raises(ValueError):
+        checkerboards.checkerboard(
+            visual_size=(6, 9), ppd=10, board_shape=(4, 6), target_indices=((6, 0),)
+        )
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from stimupy.stimuli import checkerboards, gabors, sbcs, whites
+from stimupy.utils import compile_stimulus
+
+cases = {
+    "white": (
+        whites.white,
+        {
+            "visual_size": 10,
+            "ppd": 10,
+            "n_bars": 8,
+            "target_indices": (2, 5),
+            "target_heights": 2,
+            "intensity_target": (0.5, 0.5),
+        },
+    ),
+    "sbc": (sbcs.basic, {"visual_size": 10, "ppd": 10, "target_size": 2}),
+    "checkerboard": (
+        checkerboards.checkerboard,
+        {
+            "visual_size": 10,
+            "ppd": 10,
+            "check_visual_size": 1,
+            "target_indices": ((3, 3), (5, 6)),
+            "intensity_target": (0.5, 0.5),
+        },
+    ),
+}
+
+
+@pytest.mark.parametrize("name", cases.keys())
+def test_render(name):
+    func, kwargs = cases[name]
+    compiled = compile_stimulus(func, **kwargs)
+
+    for value in (0.3, 0.8):
+        intensities = {
+            key: (value,) * len(v) if isinstance(v, tuple) else value
+            for key, v in compiled.intensities.items()
+        }
+        ref = func(**{**kwargs, **intensities})
+        stim = compiled.render(**intensities)
+        assert np.array_equal(stim["img"], ref["img"])
+        assert np.array_equal(stim["target_mask"], ref["target_mask"])
+
+
+def test_render_targets():
+    func, kwargs = cases["white"]
+    compiled = compile_stimulus(func, **kwargs)
+    stim = compiled.render(intensity_target=(0.2, 0.9), intensity_bars=(1.0, 0.0))
+    ref = func(**{**kwargs, "intensity_target": (0.2, 0.9), "intensity_bars": (1.0, 0.0)})
+    assert np.array_equal(stim["img"], ref["img"])
+    assert stim["intensity_target"] == (0.2, 0.9)
+
+    out = np.zeros((100, 100))
+    assert compiled.render(intensity_target=(0.1, 0.1), out=out)["img"] is out
+
+
+def test_none_intensity():
+    # intensity_target=None means: same intensity as background
+    def sbc(intensity_background=0.0, intensity_target=None):
+        if intensity_target is None:
+            intensity_target = intensity_background
+        return sbcs.basic(
+            visual_size=10,
+            ppd=10,
+            target_size=2,
+            intensity_background=intensity_background,
+            intensity_target=intensity_target,
+        )
+
+    compiled = compile_stimulus(sbc)
+    assert list(compiled.intensities) == ["intensity_background"]
+    assert np.array_equal(compiled.render(intensity_background=0.3)["img"], sbc(0.3)["img"])
+
+    with pytest.raises(ValueError, match="intensity_target"):
+        compile_stimulus(sbc, intensity_params="intensity_target")
+
+
+def test_invalid():
+    func, kwargs = cases["white"]
+    compiled = compile_stimulus(func, **kwargs)
+    with pytest.raises(ValueError):
+        compiled.render(intensity_target=0.5)
+    with pytest.raises(ValueError):
+        compiled.render(intensity_background=0.5)
+
+    # Intensities are blended in Gabor
+    with pytest.raises(ValueError):
+        compile_stimulus(gabors.gabor, visual_size=10, ppd=10, frequency=1, sigma=2)
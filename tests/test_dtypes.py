@@ -0,0 +1,130 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from stimupy.components import edges, gaussians, waves
+from stimupy.stimuli import sbcs, whites
+from stimupy.utils import (
+    as_mask,
+    get_dtypes,
+    pad_dict_by_shape,
+    resize_dict,
+    rotate_dict,
+    set_dtypes,
+    stack_dicts,
+    to_pickle,
+    use_dtypes,
+)
+
+
+def test_default():
+    stim = whites.white(visual_size=10, ppd=10, n_bars=8, target_indices=(2, 5), target_heights=2)
+    assert stim["img"].dtype == np.float64
+    assert stim["target_mask"].dtype == int
+
+
+def test_use_dtypes():
+    ref = whites.white(visual_size=10, ppd=10, n_bars=8, target_indices=(2, 5), target_heights=2)
+    with use_dtypes(float_dtype=np.float32, mask_dtype="compact"):
+        stim = whites.white(
+            visual_size=10, ppd=10, n_bars=8, target_indices=(2, 5), target_heights=2
+        )
+    assert get_dtypes() == (np.float64, "int")
+
+    assert stim["img"].dtype == np.float32
+    assert np.allclose(stim["img"], ref["img"])
+    for key in ("grating_mask", "target_mask"):
+        assert stim[key].dtype == np.uint8
+        assert np.array_equal(stim[key], ref[key])
+
+
+dot_params = {
+    "n_dots": 3,
+    "dot_radius": 0.3,
+    "distance": 0.4,
+    "target_shape": 1,
+    "intensity_background": 0,
+    "intensity_target": 1,
+    "intensity_dots": 0,
+}
+
+
+@pytest.mark.parametrize(
+    "func, kwargs",
+    [
+        (waves.sine, {"frequency": 1, "distance_metric": "radial"}),
+        (waves.square, {"frequency": 1, "distance_metric": "horizontal"}),
+        (waves.sine_batch, {"frequency": (1, 2), "distance_metric": "horizontal"}),
+        (waves.sine_batch, {"frequency": (1, 2), "distance_metric": "radial"}),
+        (waves.bessel, {"frequency": 1}),
+        (gaussians.gaussian, {"sigma": 1}),
+        (edges.step, {}),
+        (sbcs.with_dots, dot_params),
+        (sbcs.dotted, dot_params),
+    ],
+)
+def test_drawn_in_dtype(func, kwargs):
+    # Drawn in float32 directly, not only cast by the stimulus_output decorator
+    with use_dtypes(float_dtype=np.float32):
+        stim = func.__wrapped__(visual_size=4, ppd=10, **kwargs)
+    assert stim["img"].dtype == np.float32
+
+
+def test_two_sided():
+    with use_dtypes(mask_dtype="compact"):
+        stim = sbcs.basic_two_sided(
+            visual_size=(5, 10), ppd=10, target_size=1, intensity_background=(0, 1)
+        )
+    assert stim["target_mask"].dtype == np.uint8
+    assert stim["target_mask"].max() == 2
+
+
+@pytest.mark.parametrize(
+    "max_idx, dtype",
+    [(1, np.uint8), (255, np.uint8), (256, np.uint16), (70000, np.uint32)],
+)
+def test_compact_mask(max_idx, dtype):
+    mask = np.array([0, max_idx])
+    with use_dtypes(mask_dtype="compact"):
+        assert as_mask(mask).dtype == dtype
+
+
+def test_dict_utils():
+    stim = whites.white(visual_size=10, ppd=10, n_bars=8, target_indices=(2, 5), target_heights=2)
+    with use_dtypes(mask_dtype="compact"):
+        stacked = stack_dicts(stim, stim)
+        padded = pad_dict_by_shape(stim, padding=2)
+        resized = resize_dict(stim, (2, 2))
+        rotated = rotate_dict(stim)
+    for dct in (stacked, padded, resized, rotated):
+        assert dct["target_mask"].dtype == np.uint8
+    assert padded["pad_mask"].dtype == np.uint8
+    assert stacked["grating_mask"].max() == 2 * stim["grating_mask"].max()
+    assert np.array_equal(rotated["target_mask"], np.rot90(stim["target_mask"]))
+    assert not np.shares_memory(rotated["target_mask"], stim["target_mask"])
+
+
+def test_stack_compact_masks():
+    # Offsetting indices of compact masks should not overflow
+    dct = {"img": np.zeros((2, 2)), "mask": np.full((2, 2), 200, dtype=np.uint8)}
+    stacked = stack_dicts(dct, dct)
+    assert stacked["mask"].max() == 400
+
+
+def test_export(tmp_path):
+    stim = whites.white(visual_size=10, ppd=10, n_bars=8, target_indices=(2, 5), target_heights=2)
+    with use_dtypes(mask_dtype="compact"):
+        to_pickle(stim, tmp_path / "stim")
+    with open(tmp_path / "stim.pickle", "rb") as file:
+        loaded = pickle.load(file)
+    assert loaded["target_mask"].dtype == np.uint8
+    assert np.array_equal(loaded["target_mask"], stim["target_mask"])
+    assert stim["target_mask"].dtype == int
+
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        set_dtypes(float_dtype=int)
+    with pytest.raises(ValueError):
+        set_dtypes(mask_dtype="small")
@@ -0,0 +1,14 @@
+import numpy as np
+import pytest
+
+from stimupy.components import edges, image_base
+
+
+@pytest.mark.parametrize("shape", [(10, 11), (10, 13), (4, 21), (7, 37)])
+def test_step_odd_widths(shape):
+    # Middle column of odd widths lies on the edge: side is decided by the full-grid mean
+    stim = edges.step(shape=shape, ppd=10)
+    distances = image_base(shape=shape, ppd=10, origin="corner")["oblique"]
+    ref = np.where(distances < distances.mean(), 1, 2)
+    assert np.array_equal(stim["edge_mask"], ref)
+    assert np.array_equal(stim["img"], np.where(ref == 1, 0.0, 1.0))
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from stimupy.components import image_base
+
+
+@pytest.mark.parametrize("origin", ["corner", "mean", "center"])
+@pytest.mark.parametrize("rotation", [0.0, 30.0, 90.0])
+def test_metrics_match_eager(origin, rotation):
+    base = image_base(visual_size=(4, 5), ppd=10, rotation=rotation, origin=origin)
+
+    xx, yy = np.meshgrid(base["x"], base["y"])
+    alpha = [np.cos(np.deg2rad(-rotation)), np.sin(np.deg2rad(-rotation))]
+    beta = [np.cos(np.deg2rad(rotation)), np.sin(np.deg2rad(rotation))]
+    oblique_x = alpha[0] * xx + alpha[1] * yy
+    oblique_y = beta[1] * xx + beta[0] * yy
+    if origin == "corner":
+        oblique_x = oblique_x - oblique_x.min()
+        oblique_y = oblique_y - oblique_y.min()
+    angular = (np.arctan2(xx, yy) - np.deg2rad(rotation + 90)) % (2 * np.pi)
+
+    assert np.array_equal(base["horizontal"], xx)
+    assert np.array_equal(base["vertical"], yy)
+    assert np.array_equal(base["oblique"], oblique_x)
+    assert np.array_equal(base["oblique_y"], oblique_y)
+    assert np.array_equal(
+        base["rectilinear"], np.maximum(np.abs(oblique_x), np.abs(oblique_y))
+    )
+    assert np.array_equal(base["radial"], np.sqrt(xx**2 + yy**2))
+    assert np.allclose(base["angular"], angular)
+
+
+def test_lazy():
+    base = image_base(visual_size=(4, 5), ppd=10)
+    assert not base._computed
+
+    base["radial"]
+    assert list(base._computed) == ["radial"]
+    assert base["radial"] is base["radial"]
+
+
+def test_keys():
+    base = image_base(visual_size=(4, 5), ppd=10)
+    assert set(base.keys()) == {
+        "visual_size",
+        "ppd",
+        "shape",
+        "rotation",
+        "x",
+        "y",
+        "horizontal",
+        "vertical",
+        "oblique",
+        "oblique_y",
+        "rectilinear",
+        "radial",
+        "angular",
+    }
+    with pytest.raises(KeyError):
+        base["foo"]
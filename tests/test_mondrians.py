@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+from stimupy.stimuli import mondrians
+
+params = {
+    "visual_size": 10,
+    "ppd": 10,
+    "positions": ((0, 0), (8, 4), (1, 6), (4, 4)),
+    "sizes": ((3, 4, 0), (2, 2, 0), (5, 3, 1), (3, 4, -1)),
+    "intensities": (0.0, 0.2, 0.8, 1.0),
+    "intensity_background": 0.5,
+}
+
+
+def test_mondrian():
+    stim = mondrians.mondrian(**params)
+    mask = stim["mondrian_mask"]
+    assert np.all(mask[0:30, 0:40] == 1)
+    assert np.all(mask[80:100, 40:60] == 2)
+    assert mask[0, 99] == 0
+
+    # Later Mondrians are drawn on top of earlier ones
+    assert np.all(np.unique(mask) == np.arange(5))
+    lut = np.array((0.5,) + params["intensities"])
+    assert np.array_equal(stim["img"], lut[mask])
+
+
+def test_mondrian_arrays():
+    # Rectangles only, given as arrays
+    positions = np.array(((0, 0), (8, 4), (1, 6)))
+    sizes = np.array(((3, 4), (2, 2), (5, 3)))
+    stim = mondrians.mondrian(**{**params, "positions": positions, "sizes": sizes})
+    ref = mondrians.mondrian(
+        **{**params, "positions": tuple(map(tuple, positions)), "sizes": tuple(map(tuple, sizes))}
+    )
+    assert np.array_equal(stim["img"], ref["img"])
+    assert np.array_equal(stim["mondrian_mask"], ref["mondrian_mask"])
+
+
+def test_mondrian_bulk(monkeypatch):
+    # Many overlapping Mondrians of few sizes, drawn in chunks
+    monkeypatch.setattr(mondrians, "_BLOCK_SIZE", 100)
+    rng = np.random.default_rng(0)
+    n = 300
+    sizes = np.array(((0.5, 0.5, 0), (0.3, 0.6, 0.2), (0.4, 0.2, -0.2)))[rng.integers(0, 3, n)]
+    positions = rng.integers(2, 90, (n, 2)) / 10
+    stim = mondrians.mondrian(
+        visual_size=10, ppd=10, positions=positions, sizes=sizes, intensities=np.arange(n)
+    )
+
+    # Each Mondrian drawn over the previous ones
+    ref = np.zeros((100, 100), dtype=int)
+    for m in range(n):
+        single = mondrians.mondrian(
+            visual_size=10,
+            ppd=10,
+            positions=positions[m : m + 1],
+            sizes=sizes[m : m + 1],
+            intensities=(1,),
+        )
+        ref[single["mondrian_mask"] > 0] = m + 1
+    assert np.array_equal(stim["mondrian_mask"], ref)
+
+
+def test_mondrian_invalid():
+    with pytest.raises(ValueError):
+        mondrians.mondrian(**{**params, "positions": ((9, 9),), "sizes": ((2, 2),)})
+    with pytest.raises(ValueError):
+        mondrians.mondrian(**{**params, "positions": ((-1, 0),), "sizes": ((2, 2),)})
+    with pytest.raises(ValueError):
+        mondrians.mondrian(**{**params, "positions": ((0, 0),), "sizes": ((2, 2, 0, 1),)})
+
+
+def test_corrugated_mondrian():
+    intensities = np.arange(12).reshape(3, 4) / 12
+    stim = mondrians.corrugated_mondrian(
+        visual_size=(6, 10),
+        ppd=10,
+        depths=(0, 1, -1),
+        intensities=intensities,
+        target_indices=((0, 1), (2, 3)),
+        intensity_target=1.0,
+    )
+    mask = stim["mondrian_mask"]
+    assert mask.max() == 12
+    assert np.all(stim["target_mask"][mask == 2] == 1)
+    assert np.all(stim["target_mask"][mask == 12] == 2)
+    assert np.all(stim["img"][stim["target_mask"] > 0] == 1.0)
+
+    # Each Mondrian takes its value from the intensities matrix
+    others = (stim["target_mask"] == 0) & (mask > 0)
+    lut = np.hstack([0.5, intensities.ravel()])
+    assert np.array_equal(stim["img"][others], lut[mask[others]])
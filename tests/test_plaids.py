@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from stimupy.components import grid_cache
+from stimupy.stimuli import gabors, plaids, waves
+
+grating1 = {
+    "visual_size": 4,
+    "ppd": 10,
+    "bar_width": 1,
+    "rotation": 0,
+    "origin": "center",
+}
+grating2 = {**grating1, "bar_width": 0.5, "rotation": 45, "round_phase_width": False}
+
+
+def test_add_waves():
+    wave1 = waves.sine_linear(**grating1)
+    wave2 = waves.sine_linear(**grating2)
+    img1 = wave1["img"].copy()
+
+    plaid = plaids.add_waves(wave1, wave2, weight1=2, weight2=1)
+    assert np.allclose(plaid["img"], (2 * img1 + wave2["img"]) / 3)
+    assert plaid["grating_mask2"] is wave2["grating_mask"]
+
+    # Inputs are not altered
+    assert np.array_equal(wave1["img"], img1)
+    assert "grating_mask2" not in wave1
+
+    with pytest.raises(ValueError):
+        plaids.add_waves(wave1, waves.sine_linear(**{**grating1, "visual_size": 2}))
+
+
+def test_add_waves_out():
+    wave1 = waves.sine_linear(**grating1)
+    wave2 = waves.sine_linear(**grating2)
+    ref = (wave1["img"] + 0.5 * wave2["img"]) / 1.5
+
+    out = np.zeros((40, 40))
+    plaid = plaids.add_waves(wave1, wave2, weight2=0.5, out=out)
+    assert plaid["img"] is out
+    assert np.allclose(out, ref)
+
+
+def test_gabors_shared_envelope():
+    grid_cache.clear()
+    params1, params2 = {**grating1, "sigma": 1}, {**grating2, "sigma": 1}
+    plaid = plaids.gabors(params1, params2)
+
+    gabor1 = gabors.gabor(**params1)
+    gabor2 = gabors.gabor(**params2)
+    assert np.array_equal(plaid["img"], (gabor1["img"] + gabor2["img"]) / 2)
+    assert gabor1["gaussian_mask"] is not gabor2["gaussian_mask"]
@@ -0,0 +1,95 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from stimupy.components import combine_masks, draw_regions, mask_regions
+
+
+def mask_regions_reference(distances, edges):
+    mask = np.zeros(distances.shape, dtype=int)
+    for idx, edge in zip(reversed(range(len(edges))), reversed(edges)):
+        mask[distances <= edge] = int(idx + 1)
+    return mask
+
+
+@pytest.mark.parametrize("distance_metric", ["horizontal", "radial", "rectilinear", "angular"])
+@pytest.mark.parametrize(
+    "edges",
+    [
+        (0.5, 1.0, 1.5, 2.0),
+        (1.0, 0.5, 2.0, 1.5),
+        (0.5, 0.5, 1.0),
+        (1.0,),
+        (),
+    ],
+)
+def test_mask_regions(distance_metric, edges):
+    stim = mask_regions(
+        distance_metric=distance_metric,
+        edges=edges,
+        visual_size=(4, 5),
+        ppd=10,
+        origin="mean",
+    )
+    assert np.array_equal(stim["mask"], mask_regions_reference(stim["distances"], edges))
+
+
+def draw_regions_reference(mask, intensities, intensity_background=0.5):
+    img = np.ones(mask.shape) * intensity_background
+    mask_idcs = np.unique(mask[mask > 0])
+    if isinstance(intensities, (float, int)):
+        intensities = (intensities,)
+    ints = [*itertools.islice(itertools.cycle(intensities), len(mask_idcs))]
+    for frame_idx, intensity in zip(mask_idcs, ints):
+        img = np.where(mask == frame_idx, intensity, img)
+    return img
+
+
+@pytest.mark.parametrize(
+    "mask",
+    [
+        np.array([[0, 1, 2], [3, 4, 5]]),
+        np.array([[0, 2, 2], [7, 0, 9]]),
+        np.array([[0, 1, 1], [1, 0, 1]], dtype=bool),
+        np.array([[0.0, 2.0, 2.0], [7.0, -1.0, 9.0]]),
+        np.array([[0, 1000, 2], [7, -1, 9]]),
+        np.zeros((2, 3), dtype=int),
+    ],
+)
+@pytest.mark.parametrize("intensities", [0.0, (0.1, 0.9), (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7)])
+def test_draw_regions(mask, intensities):
+    img = draw_regions(mask, intensities=intensities, intensity_background=0.25)
+    ref = draw_regions_reference(mask, intensities=intensities, intensity_background=0.25)
+    assert img.dtype == ref.dtype
+    assert np.array_equal(img, ref)
+
+
+def test_combine_masks():
+    masks = np.zeros((3, 4, 5), dtype=int)
+    masks[0, 0, :] = 1
+    masks[1, 1, :2] = 1
+    masks[1, 1, 2:] = 2
+    masks[2, 3, :] = 1
+    expected = np.zeros((4, 5), dtype=int)
+    expected[0, :] = 1
+    expected[1, :2] = 2
+    expected[1, 2:] = 3
+    expected[3, :] = 4
+
+    assert np.array_equal(combine_masks(*masks), expected)
+    assert np.array_equal(combine_masks(masks), expected)
+    assert np.array_equal(combine_masks(mask for mask in masks), expected)
+
+
+@pytest.mark.parametrize("labels", [(1, 1), (1, 2)])
+def test_combine_masks_overlap(labels):
+    mask1 = np.array([[labels[0], 0]])
+    mask2 = np.array([[labels[1], 0]])
+    with pytest.raises(ValueError, match="overlap"):
+        combine_masks(mask1, mask2)
+
+
+def test_combine_masks_shape():
+    with pytest.raises(ValueError, match="shape"):
+        combine_masks(np.zeros((2, 2)), np.zeros((2, 3)))
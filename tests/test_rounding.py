@@ -27,3 +27,35 @@ def test_raises_oob():
 
     with pytest.raises(ValueError):
         round_to_vals([3], [1, 2], "ceil")
+
+
+def _nearest_reference(arr, vals):
+    """Round to nearest value by binary search (without fast path for even spacing)"""
+    vals = np.sort(np.unique(vals))
+    idxs = np.searchsorted(vals, arr, side="left")
+    prev_idx_is_less = (idxs == len(vals)) | (
+        np.fabs(arr - vals[np.maximum(idxs - 1, 0)])
+        < np.fabs(arr - vals[np.minimum(idxs, len(vals) - 1)])
+    )
+    idxs[prev_idx_is_less] -= 1
+    return vals[idxs]
+
+
+@pytest.mark.parametrize("n_vals", [3, 20, 500])
+@pytest.mark.parametrize("gap", [0, 1e-4])
+def test_rounding_evenly_spaced(n_vals, gap):
+    # Evenly spaced values, optionally with a small gap in the middle (as in gratings)
+    step = 0.37
+    vals = np.arange(n_vals) * step - 1.3
+    vals[n_vals // 2 :] += gap
+
+    # Random values, exact values, and exact midpoints (ties)
+    arr = np.concatenate(
+        [
+            rng.uniform(vals.min() - 1, vals.max() + 1, 10000),
+            vals,
+            (vals[1:] + vals[:-1]) / 2,
+            [np.inf, -np.inf],
+        ]
+    )
+    assert np.array_equal(round_to_vals(arr, vals), _nearest_reference(arr, vals))
@@ -0,0 +1,54 @@
+import numpy as np
+
+from stimupy.components.shapes import disc
+from stimupy.stimuli import sbcs
+from stimupy.utils import pad_by_visual_size
+
+dots_params = {
+    "ppd": 10,
+    "n_dots": (4, 6),
+    "dot_radius": 0.5,
+    "distance": 1,
+    "target_shape": (2, 2),
+    "intensity_target": 0.3,
+    "intensity_background": 0.5,
+    "intensity_dots": 1.0,
+}
+
+
+def test_dotted():
+    stim = sbcs.dotted(**dots_params)
+
+    # Reference: tiled dot patch
+    patch = disc(radius=0.5, ppd=10, intensity_background=0.0, intensity_disc=1.0)["img"]
+    patch = pad_by_visual_size(img=patch, padding=(0.5,), ppd=10, pad_value=0.0)
+    dots = np.tile(patch, (4, 6)) != 0
+    assert stim["img"].shape == dots.shape
+
+    # Target region: central 2x2 dots
+    target = np.zeros(dots.shape, dtype=bool)
+    target[20:60, 40:80] = True
+    assert np.array_equal(stim["target_mask"], (dots & target).astype(int))
+    assert np.all(stim["img"][dots & target] == 0.3)
+    assert np.all(stim["img"][dots & ~target] == 1.0)
+    assert np.all(stim["img"][~dots] == 0.5)
+
+
+def test_with_dots():
+    stim = sbcs.with_dots(**dots_params)
+    dotted = sbcs.dotted(**dots_params)
+    dots = (dotted["img"] != 0.5) | (dotted["target_mask"] == 1)
+
+    target = np.zeros(dots.shape, dtype=bool)
+    target[20:60, 40:80] = True
+    assert np.array_equal(stim["target_mask"], (target & ~dots).astype(int))
+    assert np.all(stim["img"][dots] == 1.0)
+    assert np.all(stim["img"][target & ~dots] == 0.3)
+    assert np.all(stim["img"][~target & ~dots] == 0.5)
+
+
+def test_dot_tile_cached():
+    sbcs._dot_tile.cache_clear()
+    sbcs.dotted(**dots_params)
+    sbcs.with_dots(**{**dots_params, "intensity_target": 0.8})
+    assert sbcs._dot_tile.cache_info().hits == 1
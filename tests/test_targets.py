@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from stimupy.stimuli import mask_targets, place_targets
+
+
+def mask_targets_reference(element_mask, target_indices):
+    target_mask = np.zeros_like(element_mask)
+    for target_idx, element_idx in enumerate(target_indices):
+        if element_idx < 0:
+            element_idx = int(element_mask.max()) + element_idx
+        target_mask = np.where(element_mask == element_idx, target_idx + 1, target_mask)
+    return target_mask
+
+
+element_mask = np.repeat(np.arange(8), 3)[None, :].repeat(4, axis=0)
+
+
+@pytest.mark.parametrize(
+    "target_indices",
+    [(), (2,), (5, 1), (-1, 3), (3, 6, 3), (2.0,), (2.5, 4)],
+)
+@pytest.mark.parametrize("dtype", [int, np.uint8, float])
+def test_mask_targets(target_indices, dtype):
+    mask = element_mask.astype(dtype)
+    target_mask = mask_targets(mask, target_indices)
+    expected = mask_targets_reference(mask, target_indices)
+    assert target_mask.dtype == expected.dtype
+    assert np.array_equal(target_mask, expected)
+
+
+def test_mask_targets_outside():
+    with pytest.raises(ValueError):
+        mask_targets(element_mask, (2, 8))
+
+
+def test_place_targets():
+    stim = {"img": np.zeros(element_mask.shape), "bar_mask": element_mask}
+    stim = place_targets(stim, "bar_mask", (1, 6, 4), intensity_target=(0.2, 0.8))
+    assert np.array_equal(stim["target_mask"], mask_targets_reference(element_mask, (1, 6, 4)))
+    assert np.all(stim["img"][element_mask == 1] == 0.2)
+    assert np.all(stim["img"][element_mask == 6] == 0.8)
+    assert np.all(stim["img"][element_mask == 4] == 0.2)
+    assert np.all(stim["img"][stim["target_mask"] == 0] == 0.0)
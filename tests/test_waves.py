@@ -1,6 +1,8 @@
+import numpy as np
 import pytest
+import scipy.special as sp
 
-from stimupy.components import waves
+from stimupy.components import image_base, waves
 
 
 @pytest.mark.parametrize(
@@ -46,3 +48,153 @@ def test_rounding():
 
 def test_overview():
     waves.overview()
+
+
+@pytest.mark.parametrize("func", [waves.sine, waves.square, waves.staircase])
+@pytest.mark.parametrize("distance_metric", ["horizontal", "vertical", "oblique"])
+def test_separable(func, distance_metric):
+    params = {
+        "visual_size": (4, 6),
+        "ppd": 16,
+        "n_phases": 6,
+        "distance_metric": distance_metric,
+    }
+    stim = func(**params)
+    view = func(**params, materialize=False)
+
+    assert stim["img"].flags.writeable
+    assert not view["img"].flags.writeable
+    assert 0 in view["img"].strides
+    assert np.array_equal(stim["img"], view["img"])
+    assert np.array_equal(stim["grating_mask"], view["grating_mask"])
+
+
+@pytest.mark.parametrize("func", [waves.sine, waves.square, waves.staircase])
+@pytest.mark.parametrize("distance_metric", ["radial", "rectilinear"])
+def test_quadrant(func, distance_metric, monkeypatch):
+    params = {
+        "visual_size": (4, 6),
+        "ppd": 16,
+        "n_phases": 6,
+        "phase_shift": 30,
+        "origin": "center",
+        "distance_metric": distance_metric,
+    }
+    base = image_base(visual_size=(4, 6), ppd=16, origin="center")
+    assert waves._quadrant(base, distance_metric)[0] is not None
+    stim = func(**params)
+
+    # Compare to drawing every pixel
+    waves.grid_cache.clear()
+    monkeypatch.setattr(waves, "_quadrant", lambda base, distance_metric: (None, None))
+    full = func(**params)
+    assert np.array_equal(stim["img"], full["img"])
+    assert np.array_equal(stim["grating_mask"], full["grating_mask"])
+
+
+@pytest.mark.parametrize("distance_metric", ["radial", "oblique", "rectilinear", "angular"])
+@pytest.mark.parametrize("origin", ["corner", "mean", "center"])
+def test_grating_mask_labels(distance_metric, origin):
+    stim = waves.sine(
+        visual_size=(4, 6),
+        ppd=16,
+        n_phases=12,
+        rotation=20,
+        phase_shift=45,
+        origin=origin,
+        distance_metric=distance_metric,
+    )
+    mask = stim["grating_mask"]
+
+    # Consecutive labels 1, ..., n, ordered by sine phase
+    assert np.array_equal(np.unique(mask), np.arange(1, mask.max() + 1))
+    if distance_metric != "angular":
+        distances = image_base(visual_size=(4, 6), ppd=16, rotation=20, origin=origin)[
+            distance_metric
+        ]
+        maxima = [distances[mask == idx].max() for idx in range(1, mask.max() + 1)]
+        assert np.all(np.diff(maxima) > 0)
+
+
+@pytest.mark.parametrize("distance_metric", ["horizontal", "oblique", "radial", "angular"])
+def test_sine_batch(distance_metric):
+    params = {"visual_size": (4, 6), "ppd": 16, "distance_metric": distance_metric}
+    frequencies = (0.5, 1.0, 1.5)
+    phase_shifts = (0, 45, 200)
+    rotations = (0, 30, 30)
+
+    stims = waves.sine_batch(
+        **params,
+        frequency=frequencies,
+        phase_shift=phase_shifts,
+        rotation=rotations,
+        return_masks=True,
+    )
+    assert stims["img"].shape == (3, 64, 96)
+    for idx in range(3):
+        stim = waves.sine(
+            **params,
+            frequency=frequencies[idx],
+            phase_shift=phase_shifts[idx],
+            rotation=rotations[idx],
+        )
+        assert np.array_equal(stims["img"][idx], stim["img"])
+        assert np.array_equal(stims["grating_mask"][idx], stim["grating_mask"])
+        assert stims["frequency"][idx] == stim["frequency"]
+
+
+def test_sine_batch_invalid():
+    with pytest.raises(ValueError):
+        waves.sine_batch(
+            visual_size=4,
+            ppd=16,
+            frequency=(1, 2),
+            phase_shift=(0, 90, 180),
+            distance_metric="horizontal",
+        )
+
+
+@pytest.mark.parametrize("distance_metric", ["horizontal", "oblique", "radial"])
+def test_sine_frames(distance_metric):
+    params = {
+        "visual_size": (4, 6),
+        "ppd": 16,
+        "frequency": 1,
+        "rotation": 30,
+        "intensities": (0.2, 0.8),
+        "distance_metric": distance_metric,
+    }
+    frames = waves.sine_frames(**params, temporal_frequency=2, frame_rate=60, n_frames=10)
+    for idx, frame in enumerate(frames):
+        stim = waves.sine(**params, phase_shift=360 * 2 * idx / 60)
+        assert frame.shape == (64, 96)
+        # sine stretches each image to span the intensities exactly; frames do not
+        assert np.allclose(frame, stim["img"], atol=1e-2)
+    assert idx == 9
+
+
+def test_sine_frames_counterphase():
+    params = {"visual_size": 4, "ppd": 16, "frequency": 1, "distance_metric": "horizontal"}
+    out = np.zeros((64, 64))
+    frames = waves.sine_frames(
+        **params, temporal_frequency=1, frame_rate=4, counterphase=True, out=out
+    )
+    first = next(frames).copy()
+    assert next(frames) is out
+    assert np.allclose(out, 0.5)  # zero contrast at a quarter cycle
+    assert np.allclose(next(frames), 1 - first)  # reversed contrast at half a cycle
+
+
+@pytest.mark.parametrize("order", [0, 1, 2.5])
+def test_bessel(order):
+    params = {"visual_size": 4, "ppd": 16, "frequency": 2, "order": order}
+    radial = image_base(visual_size=4, ppd=16, origin="mean")["radial"]
+    img = sp.jv(order, radial * 2 * 2 * np.pi)
+    img = (img - img.min()) / (img.max() - img.min())
+
+    stim = waves.bessel(**params, intensities=(0.0, 1.0))
+    assert np.array_equal(stim["img"], 1 - img)
+    assert np.array_equal(waves.bessel(**params, intensities=(0.0, 1.0))["img"], stim["img"])
+
+    stim = waves.bessel(**params, intensities=(0.0, 1.0), tolerance=1e-6)
+    assert np.allclose(stim["img"], 1 - img, atol=1e-5)
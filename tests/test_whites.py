@@ -0,0 +1,38 @@
+import numpy as np
+
+from stimupy.stimuli import whites
+
+
+def test_generalized_targets():
+    stim = whites.generalized(
+        visual_size=10,
+        ppd=10,
+        n_bars=10,
+        target_indices=(2, 5),
+        target_heights=(2, 4),
+        target_center_offsets=(-2, 1),
+        intensity_target=(0.2, 0.8),
+    )
+    target_mask = stim["target_mask"]
+
+    # Stripes: rows 20-40 for first target, rows 40-80 for second target
+    assert np.array_equal(np.flatnonzero((target_mask == 1).any(axis=1)), np.arange(20, 40))
+    assert np.array_equal(np.flatnonzero((target_mask == 2).any(axis=1)), np.arange(40, 80))
+    assert np.array_equal(np.flatnonzero((target_mask == 1).any(axis=0)), np.arange(10, 20))
+    assert np.array_equal(np.flatnonzero((target_mask == 2).any(axis=0)), np.arange(40, 50))
+    assert np.all(stim["img"][target_mask == 1] == 0.2)
+    assert np.all(stim["img"][target_mask == 2] == 0.8)
+
+
+def test_generalized_overwritten_target():
+    # Second target overwrites first target bar: only one target remains
+    stim = whites.generalized(
+        visual_size=10,
+        ppd=10,
+        n_bars=10,
+        target_indices=(2, 2),
+        target_heights=2,
+        intensity_target=(0.2, 0.8),
+    )
+    assert stim["target_mask"].max() == 1
+    assert np.all(stim["img"][stim["target_mask"] == 1] == 0.2)